@@ -0,0 +1,166 @@
+"""
+Benchmark `bollinger_trends` (both band sets derived from one shared
+rolling-moments pass) against the previous two `bollinger_bands`
+calls, each with its own pandas rolling standard deviation and basis.
+
+The pandas running variance drifts on long series, so the results
+are compared on the first million bars, and the last two columns
+report the largest relative error of each rolling standard deviation
+against an exact computation on sampled windows.
+
+The second table times `bollinger_bank` with five multipliers against
+one `bollinger_bands` call per multiplier, which keeps the pandas
+rolling standard deviation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_bollinger
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators import (
+    bollinger_bands,
+    bollinger_bank,
+    bollinger_trends,
+)
+from src.tradingview_indicators.moving_average import sma, ema
+from src.tradingview_indicators.rolling import rolling_moments
+
+
+def legacy_bollinger_bands(
+    source: pd.Series,
+    length: int,
+    mult: float,
+    ma_method: str,
+) -> pd.DataFrame:
+    """The `bollinger_bands` that `bollinger_trends` used to call."""
+    basis = sma(source, length) if ma_method == "sma" else ema(source, length)
+    deviation = mult * source.rolling(window=length).std()
+
+    return pd.DataFrame(
+        {
+            "basis": basis,
+            "upper": basis + deviation,
+            "lower": basis - deviation,
+        }
+    )
+
+
+def legacy_bollinger_trends(
+    source: pd.Series,
+    short_length: int,
+    long_length: int,
+    mult: float,
+    ma_method: str,
+) -> pd.Series:
+    """The default (absolute, normal) Bollinger Trend, band by band."""
+    short_bands = legacy_bollinger_bands(source, short_length, mult, ma_method)
+    long_bands = legacy_bollinger_bands(source, long_length, mult, ma_method)
+
+    lower_diff = abs(short_bands["lower"] - long_bands["lower"])
+    upper_diff = abs(short_bands["upper"] - long_bands["upper"])
+
+    return (
+        (lower_diff - upper_diff) / short_bands["basis"] * 100
+    ).rename("Bollinger Trend")
+
+
+def max_std_error(source: pd.Series, length: int) -> tuple[float, float]:
+    """
+    The largest relative error of the pandas and the shared rolling
+    standard deviations against an exact one, on every 997th window.
+    """
+    values = source.to_numpy()
+    windows = np.lib.stride_tricks.sliding_window_view(values, length)[::997]
+    exact = windows.std(axis=1, ddof=1)
+    rows = np.arange(length - 1, len(values), 997)
+
+    before = source.rolling(length).std().to_numpy()[rows]
+    after = rolling_moments(source, [length])[1][length].to_numpy()[rows]
+
+    return (
+        np.max(np.abs(before - exact) / exact),
+        np.max(np.abs(after - exact) / exact),
+    )
+
+
+def main(sizes=(10_000, 1_000_000, 10_000_000), repeat=3):
+    rng = np.random.default_rng(seed=42)
+    bollinger_trends(pd.Series(rng.normal(size=100)), 20, 50)
+
+    print(
+        f"{'bars':>10} {'ma':>4} {'before (s)':>11} {'after (s)':>10}"
+        f" {'before error':>13} {'after error':>12}"
+    )
+
+    for size in sizes:
+        source = pd.Series(
+            100 * np.exp(rng.normal(0, 1e-3, size).cumsum())
+        )
+        head = source.iloc[:1_000_000]
+        before_error, after_error = max_std_error(source, 20)
+
+        for ma_method in ["sma", "ema"]:
+            pd.testing.assert_series_equal(
+                bollinger_trends(head, 20, 50, 2, ma_method),
+                legacy_bollinger_trends(head, 20, 50, 2, ma_method),
+                rtol=1e-4,
+                atol=1e-6,
+            )
+
+            before = min(timeit.repeat(
+                lambda: legacy_bollinger_trends(source, 20, 50, 2, ma_method),
+                number=1, repeat=repeat,
+            ))
+            after = min(timeit.repeat(
+                lambda: bollinger_trends(source, 20, 50, 2, ma_method),
+                number=1, repeat=repeat,
+            ))
+
+            print(
+                f"{size:>10} {ma_method:>4} {before:>11.4f} {after:>10.4f}"
+                f" {before_error:>13.1e} {after_error:>12.1e}"
+            )
+
+
+def main_bank(sizes=(10_000, 1_000_000, 10_000_000), repeat=3):
+    rng = np.random.default_rng(seed=42)
+    mults = [1.0, 1.5, 2.0, 2.5, 3.0]
+
+    print(f"\n{'bars':>10} {'per mult (s)':>13} {'bank (s)':>9}")
+
+    for size in sizes:
+        source = pd.Series(
+            100 * np.exp(rng.normal(0, 1e-3, size).cumsum())
+        )
+
+        head = source.iloc[:1_000_000]
+        bank = bollinger_bank(head, 20, mults)
+        for mult in mults:
+            pd.testing.assert_frame_equal(
+                bank[(20, mult)],
+                bollinger_bands(head, 20, mult),
+                check_names=False,
+                rtol=1e-4,
+                atol=1e-6,
+            )
+
+        before = min(timeit.repeat(
+            lambda: [bollinger_bands(source, 20, mult) for mult in mults],
+            number=1, repeat=repeat,
+        ))
+        after = min(timeit.repeat(
+            lambda: bollinger_bank(source, 20, mults),
+            number=1, repeat=repeat,
+        ))
+
+        print(f"{size:>10} {before:>13.4f} {after:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
+    main_bank()
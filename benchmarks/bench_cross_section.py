@@ -0,0 +1,79 @@
+"""
+Benchmark the cross-sectional engine against one streaming state object
+per symbol.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_cross_section
+"""
+
+import timeit
+
+import numpy as np
+
+from src.tradingview_indicators import (
+    EMAState,
+    RMAState,
+    RSIState,
+    CrossSectionalEngine,
+)
+
+
+def per_symbol_update(states: list[dict], closes: np.ndarray) -> dict:
+    """Advance one state object per symbol and indicator."""
+    results = {name: np.full(len(closes), np.nan) for name in states[0]}
+
+    for symbol, close in enumerate(closes):
+        for name, state in states[symbol].items():
+            value = state.value if close != close else state.update(close)
+            results[name][symbol] = value
+
+    return results
+
+
+def main(sizes=(500, 5_000, 50_000), n_bars=50):
+    rng = np.random.default_rng(seed=42)
+
+    print(
+        f"{'symbols':>8} {'before (ms/bar)':>16} {'after (ms/bar)':>15}"
+    )
+
+    for n_symbols in sizes:
+        closes = 100 * np.exp(np.cumsum(
+            rng.normal(0, 0.01, (n_bars, n_symbols)), axis=0
+        ))
+        closes[rng.random(closes.shape) < 0.01] = np.nan
+
+        states = [
+            {
+                "ema_20": EMAState(20),
+                "rma_14": RMAState(14),
+                "RSI_14": RSIState(14),
+            }
+            for _ in range(n_symbols)
+        ]
+        engine = CrossSectionalEngine(n_symbols, [20], [14], [14])
+
+        for row in closes:
+            expected = per_symbol_update(states, row)
+            result = engine.update(row)
+            for name, values in expected.items():
+                np.testing.assert_array_equal(result[name], values)
+
+        before = timeit.timeit(
+            lambda: [per_symbol_update(states, row) for row in closes],
+            number=1,
+        )
+        after = timeit.timeit(
+            lambda: [engine.update(row) for row in closes],
+            number=1,
+        )
+
+        print(
+            f"{n_symbols:>8} {before / n_bars * 1e3:>16.3f}"
+            f" {after / n_bars * 1e3:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
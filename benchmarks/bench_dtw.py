@@ -0,0 +1,71 @@
+"""
+Benchmark the compiled DTW engines against the `fastdtw` package.
+
+The series are a random walk and a lagged, noisy copy of it, like the
+moving averages aligned by the `dtw` modes of `MACD`, `didi_index` and
+`bollinger_trends`. The first columns time each engine, the package
+running once per size. The last columns report the path quality as
+the DTW distance of each engine over the exact DTW distance, computed
+with a band as wide as the series on the smallest size, and over the
+lowest distance found otherwise.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_dtw
+"""
+
+import timeit
+
+import fastdtw
+import numpy as np
+
+from src.tradingview_indicators.dtw import banded_dtw, fast_dtw
+
+
+def main(sizes=(10_000, 100_000, 1_000_000), repeat=3):
+    rng = np.random.default_rng(seed=42)
+    fast_dtw(rng.normal(size=100), rng.normal(size=100))
+    banded_dtw(rng.normal(size=100), rng.normal(size=100))
+
+    print(
+        f"{'points':>10} {'fastdtw (s)':>12} {'compiled (s)':>13}"
+        f" {'band (s)':>9} {'fastdtw q':>10} {'compiled q':>11}"
+        f" {'band q':>7}"
+    )
+
+    for size in sizes:
+        walk = rng.normal(0, 1, size + 15).cumsum()
+        x = walk[15:]
+        y = walk[:-15] + rng.normal(0, 0.1, size)
+
+        package_distance, _ = fastdtw.fastdtw(x, y)
+        compiled_distance, _ = fast_dtw(x, y)
+        band_distance, _ = banded_dtw(x, y)
+
+        assert package_distance == compiled_distance
+
+        package = min(timeit.repeat(
+            lambda: fastdtw.fastdtw(x, y), number=1, repeat=1
+        ))
+        compiled = min(timeit.repeat(
+            lambda: fast_dtw(x, y), number=1, repeat=repeat
+        ))
+        band = min(timeit.repeat(
+            lambda: banded_dtw(x, y), number=1, repeat=repeat
+        ))
+
+        if size == min(sizes):
+            reference, _ = banded_dtw(x, y, size)
+        else:
+            reference = min(compiled_distance, band_distance)
+
+        print(
+            f"{size:>10} {package:>12.4f} {compiled:>13.4f} {band:>9.4f}"
+            f" {package_distance / reference:>10.3f}"
+            f" {compiled_distance / reference:>11.3f}"
+            f" {band_distance / reference:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark the seeded EMA paths of `ema` and `_rma_pandas` against the
+previous rolling/concat implementation.
+
+Memory is reported as the peak traced allocation divided by the size
+of the float64 input, i.e. the number of full-length buffers alive at
+the same time.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ema
+"""
+
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators.moving_average import ema, _rma_pandas
+
+
+def legacy_ema(source: pd.Series, length: int) -> pd.Series:
+    """The rolling/concat EMA that `ema` used to run."""
+    sma_series = (
+        source.rolling(window=length, min_periods=length).mean()[:length]
+    )
+    rest = source[length:]
+    return (
+        pd.concat([sma_series, rest])
+        .ewm(span=length, adjust=False)
+        .mean()
+        .dropna(axis=0)
+    )
+
+
+def legacy_rma_pandas(source: pd.Series, length: int) -> pd.Series:
+    """The rolling/concat RMA that `_rma_pandas` used to run."""
+    sma_series = (
+        source
+        .rolling(window=length, min_periods=length)
+        .mean()[:length]
+    )
+    rest = source[length:]
+    return (
+        pd.concat([sma_series, rest])
+        .ewm(alpha=1 / length)
+        .mean()
+    ).rename("RMA")
+
+
+def peak_buffers(function, source: pd.Series, length: int) -> float:
+    """Peak traced memory of a call, in input-sized buffers."""
+    tracemalloc.start()
+    function(source, length)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / source.to_numpy().nbytes
+
+
+def main(sizes=(100_000, 1_000_000, 5_000_000), length=20):
+    rng = np.random.default_rng(seed=42)
+    ema(pd.Series(rng.normal(size=100)), length)
+
+    cases = [
+        ("ema", legacy_ema, ema),
+        ("_rma_pandas", legacy_rma_pandas, _rma_pandas),
+    ]
+
+    print(
+        f"{'function':>12} {'bars':>9} {'before (s)':>11} {'after (s)':>10}"
+        f" {'before buf':>11} {'after buf':>10}"
+    )
+
+    for size in sizes:
+        source = pd.Series(
+            rng.normal(100, 5, size).cumsum(),
+            index=pd.date_range("2000-01-01", periods=size, freq="min"),
+        )
+
+        for name, legacy, current in cases:
+            pd.testing.assert_series_equal(
+                current(source, length),
+                legacy(source, length),
+                check_exact=True,
+            )
+
+            before = min(timeit.repeat(
+                lambda: legacy(source, length), number=1, repeat=3
+            ))
+            after = min(timeit.repeat(
+                lambda: current(source, length), number=1, repeat=3
+            ))
+
+            print(
+                f"{name:>12} {size:>9} {before:>11.4f} {after:>10.4f}"
+                f" {peak_buffers(legacy, source, length):>11.1f}"
+                f" {peak_buffers(current, source, length):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark the float32 mode against the default float64 one.
+
+The first table compares the time and output size of the 2-D moving
+averages over a block of symbols. The second one reports the maximum
+deviation of every indicator against its float64 result, relative to
+the value for the price-level indicators and in indicator points for
+the oscillators.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_float32
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import src.tradingview_indicators as ta
+from src.tradingview_indicators import array
+
+
+def max_deviation(values, reference, relative: bool) -> float:
+    """Largest difference between `values` and `reference`."""
+    values = np.asarray(values, dtype="float64")
+    reference = np.asarray(reference, dtype="float64")
+    valid = ~np.isnan(reference)
+
+    deviation = np.abs(values[valid] - reference[valid])
+    if relative:
+        deviation /= np.abs(reference[valid])
+    return deviation.max()
+
+
+def deviations(close: np.ndarray, high: np.ndarray, low: np.ndarray) -> dict:
+    """Maximum float32 deviation of every indicator."""
+    source = pd.Series(close)
+    results = {}
+
+    for name in ["sma", "ema", "rma"]:
+        function = getattr(ta, name)
+        results[name] = max_deviation(
+            function(source, 14, dtype="float32"), function(source, 14), True
+        )
+
+    results["sema"] = max_deviation(
+        ta.sema(source, 14, 3, "float32"), ta.sema(source, 14, 3), True
+    )
+
+    for method in ["sma", "ema", "dema", "tema", "rma"]:
+        results[f"RSI {method}"] = max_deviation(
+            ta.RSI(source, 14, method, "float32"),
+            ta.RSI(source, 14, method),
+            False,
+        )
+
+    bands = ta.bollinger_bands(source, 20, 2)
+    bands_32 = ta.bollinger_bands(source, 20, 2, dtype="float32")
+    results["bollinger_bands"] = max(
+        max_deviation(bands_32[column], bands[column], True)
+        for column in bands
+    )
+
+    results["stoch"] = max_deviation(
+        array.stoch(close, high, low, 14, "float32")[0],
+        array.stoch(close, high, low, 14)[0],
+        False,
+    )
+
+    for name in ["CCI", "tsi", "TRIX"]:
+        function = getattr(array, name)
+        results[name] = max_deviation(
+            function(close, dtype="float32")[0], function(close)[0], False
+        )
+
+    (macd_32, _, _), offset = array.MACD(close, 12, 26, 9, dtype="float32")
+    (macd, _, _), _ = array.MACD(close, 12, 26, 9)
+    results["MACD / price"] = (np.abs(macd_32 - macd) / close[offset:]).max()
+    return results
+
+
+def global_deviations(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+) -> dict:
+    """
+    Maximum deviation of the indicators without a `dtype` argument,
+    which follow `set_dtype` through their moving averages.
+    """
+    source = pd.Series(close)
+    dataframe = pd.DataFrame({"high": high, "low": low, "close": close})
+
+    def indicators() -> dict:
+        dmi = ta.DMI(dataframe)
+        return {
+            "MACD": ta.MACD(source, 12, 26, 9),
+            "DMI": pd.concat(dmi.adx(), axis=1),
+            "TRIX": ta.TRIX(source),
+            "tsi": ta.tsi(source),
+            "SMIO": ta.SMIO(source),
+        }
+
+    expected = indicators()
+    try:
+        ta.set_dtype("float32")
+        results = indicators()
+    finally:
+        ta.set_dtype("float64")
+
+    deviation = {
+        name: (results[name] - expected[name]).abs()
+        for name in expected
+    }
+    return {
+        "MACD / price (global)": (
+            deviation["MACD"].div(source, axis=0).max().max()
+        ),
+        "DMI (global)": deviation["DMI"].max().max(),
+        "TRIX (global)": deviation["TRIX"].max(),
+        "tsi (global)": deviation["tsi"].max(),
+        "SMIO (global)": deviation["SMIO"].max(),
+    }
+
+
+def main(n_bars=100_000, n_symbols=200, length=20):
+    rng = np.random.default_rng(seed=42)
+    block = 100 * np.exp(
+        np.cumsum(rng.normal(0, 0.002, (n_bars, n_symbols)), axis=0)
+    )
+    block_32 = block.astype("float32")
+
+    print(f"{'function':>8} {'float64 (s)':>12} {'float32 (s)':>12}"
+          f" {'float64 MB':>11} {'float32 MB':>11}")
+
+    for name in ["sma", "ema", "rma"]:
+        function = getattr(ta, name)
+        function(block[:100], length, dtype="float32")
+
+        timings = [
+            min(timeit.repeat(
+                lambda: function(data, length, dtype=data.dtype),
+                number=1,
+                repeat=3,
+            ))
+            for data in (block, block_32)
+        ]
+        sizes = [
+            function(data, length, dtype=data.dtype).nbytes / 1e6
+            for data in (block, block_32)
+        ]
+        print(f"{name:>8} {timings[0]:>12.4f} {timings[1]:>12.4f}"
+              f" {sizes[0]:>11.1f} {sizes[1]:>11.1f}")
+
+    close = block[:, 0]
+    high = close * (1 + np.abs(rng.normal(0, 0.001, n_bars)))
+    low = close * (1 - np.abs(rng.normal(0, 0.001, n_bars)))
+
+    print(f"\n{'indicator':>21} {'max deviation':>14}")
+    results = deviations(close, high, low)
+    results.update(global_deviations(close, high, low))
+    for name, value in results.items():
+        print(f"{name:>21} {value:>14.3g}")
+
+
+if __name__ == "__main__":
+    main()
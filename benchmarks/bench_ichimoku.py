@@ -0,0 +1,106 @@
+"""
+Benchmark `Ichimoku` (single-pass Donchian lines written into one
+preallocated block) against the previous six rolling passes and
+column-by-column DataFrame assembly. The last column times the
+`components` option returning only the leading spans.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ichimoku
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators import Ichimoku
+
+
+def legacy_ichimoku(
+    dataframe: pd.DataFrame,
+    conversion_periods: int,
+    base_periods: int,
+    lagging_span_2_periods: int,
+    displacement: int,
+) -> pd.DataFrame:
+    """The rolling max/min Ichimoku that `Ichimoku` used to run."""
+    high = dataframe["high"]
+    low = dataframe["low"]
+    close = dataframe["close"]
+
+    def _donchian(length) -> pd.Series:
+        max_rolling = high.rolling(length).max()
+        min_rolling = low.rolling(length).min()
+        return (max_rolling + min_rolling) / 2
+
+    conversion_line = _donchian(conversion_periods)
+    base_line = _donchian(base_periods)
+    lead_line1 = (conversion_line + base_line) / 2
+    lead_line2 = _donchian(lagging_span_2_periods)
+
+    ichimoku_clouds = pd.DataFrame()
+    ichimoku_clouds["conversion_line"] = conversion_line
+    ichimoku_clouds["base_line"] = base_line
+    ichimoku_clouds["lagging_span"] = close.shift(-displacement + 1)
+    ichimoku_clouds["lead_line1"] = lead_line1
+    ichimoku_clouds["lead_line2"] = lead_line2
+    ichimoku_clouds["leading_span_a"] = lead_line1.shift(displacement - 1)
+    ichimoku_clouds["leading_span_b"] = lead_line2.shift(displacement - 1)
+    return ichimoku_clouds
+
+
+def main(sizes=(10_000, 1_000_000, 10_000_000), repeat=3):
+    rng = np.random.default_rng(seed=42)
+    Ichimoku(
+        pd.DataFrame(
+            rng.normal(size=(100, 4)), columns=["open", "high", "low", "close"]
+        ),
+        9, 26, 52, 26,
+    )
+
+    print(
+        f"{'bars':>10} {'before (s)':>11} {'after (s)':>10}"
+        f" {'spans only (s)':>15}"
+    )
+
+    for size in sizes:
+        close = 100 + rng.normal(0, 1, size).cumsum()
+        dataframe = pd.DataFrame({
+            "open": close,
+            "high": close + rng.uniform(0, 1, size),
+            "low": close - rng.uniform(0, 1, size),
+            "close": close,
+        })
+
+        pd.testing.assert_frame_equal(
+            Ichimoku(dataframe, 9, 26, 52, 26),
+            legacy_ichimoku(dataframe, 9, 26, 52, 26),
+            check_names=False,
+        )
+
+        before = min(timeit.repeat(
+            lambda: legacy_ichimoku(dataframe, 9, 26, 52, 26),
+            number=1, repeat=repeat,
+        ))
+        after = min(timeit.repeat(
+            lambda: Ichimoku(dataframe, 9, 26, 52, 26),
+            number=1, repeat=repeat,
+        ))
+
+        spans_only = min(timeit.repeat(
+            lambda: Ichimoku(
+                dataframe, 9, 26, 52, 26,
+                ["leading_span_a", "leading_span_b"],
+            ),
+            number=1, repeat=repeat,
+        ))
+
+        print(
+            f"{size:>10} {before:>11.4f} {after:>10.4f}"
+            f" {spans_only:>15.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark the compiled RMA kernel against the legacy pure Python loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rma
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators.moving_average import _rma_pandas, rma
+
+
+def legacy_rma(source: pd.Series, length: int) -> pd.Series:
+    """The per-bar Python loop that `_rma_python` used to run."""
+    alpha = 1 / length
+    source_pd = _rma_pandas(source, length)[:length]
+    source_values = source[length:].to_numpy().tolist()
+
+    rma_series = float(source_pd.dropna().iloc[0])
+    rma_list = [rma_series]
+
+    for source_value in source_values:
+        rma_series = alpha * source_value + (1 - alpha) * rma_series
+        rma_list.append(rma_series)
+
+    return pd.Series(
+        rma_list,
+        name="RMA",
+        index=source[length - 1:].index
+    )
+
+
+def main(sizes=(10_000, 100_000, 1_000_000, 5_000_000), length=14):
+    rng = np.random.default_rng(seed=42)
+    rma(pd.Series(rng.normal(size=100)), length)
+
+    print(f"{'bars':>10} {'legacy (s)':>12} {'kernel (s)':>12} {'speedup':>9}")
+
+    for size in sizes:
+        source = pd.Series(rng.normal(100, 5, size).cumsum())
+
+        legacy = legacy_rma(source, length)
+        current = rma(source, length)
+        pd.testing.assert_series_equal(current, legacy, check_exact=True)
+
+        legacy_time = min(timeit.repeat(
+            lambda: legacy_rma(source, length), number=1, repeat=3
+        ))
+        kernel_time = min(timeit.repeat(
+            lambda: rma(source, length), number=1, repeat=3
+        ))
+
+        print(
+            f"{size:>10} {legacy_time:>12.4f} {kernel_time:>12.4f}"
+            f" {legacy_time / kernel_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark the fused RSI kernel against the previous Series-based
+implementation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rsi
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators import RSI
+from src.tradingview_indicators.moving_average import sma, ema, sema, rma
+
+
+def legacy_rsi(source: pd.Series, periods: int, ma_method: str) -> pd.Series:
+    """The shift/dropna RSI that `RSI` used to run."""
+    upward_diff = pd.Series(np.maximum(source - source.shift(1), 0.0)).dropna()
+    downward_diff = (
+        pd.Series(np.maximum(source.shift(1) - source, 0.0)).dropna()
+    )
+
+    match ma_method:
+        case "sma":
+            relative_strength = (
+                sma(upward_diff, periods) / sma(downward_diff, periods)
+            )
+        case "ema":
+            relative_strength = (
+                ema(upward_diff, periods) / ema(downward_diff, periods)
+            )
+        case "dema":
+            relative_strength = (
+                sema(upward_diff, periods, 2) / sema(downward_diff, periods, 2)
+            )
+        case "tema":
+            relative_strength = (
+                sema(upward_diff, periods, 3) / sema(downward_diff, periods, 3)
+            )
+        case "rma":
+            relative_strength = (
+                rma(upward_diff, periods) / rma(downward_diff, periods)
+            )
+
+    rsi = 100 - (100 / (1 + relative_strength))
+    return rsi.rename("RSI")
+
+
+def main(sizes=(10_000, 100_000, 1_000_000), periods=14):
+    rng = np.random.default_rng(seed=42)
+    RSI(pd.Series(rng.normal(size=100)), periods)
+
+    print(
+        f"{'ma_method':>9} {'bars':>9} {'before (s)':>11} {'after (s)':>10}"
+    )
+
+    for size in sizes:
+        source = pd.Series(
+            rng.normal(0, 5, size).round(1).cumsum() + 10_000,
+            index=pd.date_range("2000-01-01", periods=size, freq="min"),
+        )
+
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            pd.testing.assert_series_equal(
+                RSI(source, periods, ma_method),
+                legacy_rsi(source, periods, ma_method),
+                check_exact=True,
+            )
+
+            before = min(timeit.repeat(
+                lambda: legacy_rsi(source, periods, ma_method),
+                number=1,
+                repeat=3,
+            ))
+            after = min(timeit.repeat(
+                lambda: RSI(source, periods, ma_method), number=1, repeat=3
+            ))
+
+            print(f"{ma_method:>9} {size:>9} {before:>11.4f} {after:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
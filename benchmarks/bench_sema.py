@@ -0,0 +1,80 @@
+"""
+Benchmark the fused SEMA kernel against the chained `ema` calls.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sema
+"""
+
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators.moving_average import ema, sema
+
+
+def legacy_sema(source: pd.Series, length: int, smooth: int) -> pd.Series:
+    """The chained `ema` calls that `sema` used to run."""
+    emas_dict = {}
+    emas_dict["source_1"] = ema(source, length)
+    for value in range(2, smooth + 1):
+        emas_dict[f"source_{value}"] = ema(
+            emas_dict[f"source_{value-1}"],
+            length,
+        )
+    emas_df = pd.DataFrame(emas_dict)
+    emas_df["sema"] = (
+        emas_df[emas_df.columns[:-1]].diff(axis=1).sum(axis=1) * - 1
+        * smooth
+        + emas_df[emas_df.columns[-1]]
+    )
+    sema_series = emas_df["sema"]
+    return sema_series.dropna(axis=0)
+
+
+def peak_memory(function, *args) -> float:
+    """Peak traced memory of a call, in MiB."""
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(sizes=(100_000, 1_000_000, 5_000_000), length=20, smooth=3):
+    rng = np.random.default_rng(seed=42)
+    sema(pd.Series(rng.normal(size=100)), length, smooth)
+
+    print(f"smooth={smooth}, length={length}")
+    print(
+        f"{'bars':>10} {'legacy (s)':>11} {'fused (s)':>10}"
+        f" {'legacy MiB':>11} {'fused MiB':>10}"
+    )
+
+    for size in sizes:
+        source = pd.Series(rng.normal(100, 5, size).cumsum())
+
+        pd.testing.assert_series_equal(
+            sema(source, length, smooth),
+            legacy_sema(source, length, smooth),
+            check_exact=True,
+        )
+
+        legacy_time = min(timeit.repeat(
+            lambda: legacy_sema(source, length, smooth), number=1, repeat=3
+        ))
+        fused_time = min(timeit.repeat(
+            lambda: sema(source, length, smooth), number=1, repeat=3
+        ))
+
+        print(
+            f"{size:>10} {legacy_time:>11.4f} {fused_time:>10.4f}"
+            f" {peak_memory(legacy_sema, source, length, smooth):>11.1f}"
+            f" {peak_memory(sema, source, length, smooth):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@ from typing import Literal
 
 import pandas as pd
 import numpy as np
+from .array import CCI as _cci_array
 from .errors_exceptions import InvalidArgumentError
-from .moving_average import ema, sema, rma
+from .kernels import mean_mad_kernel, window_mean_mad, divide
+from .moving_average import ema, sema, rma, EMAState, SEMAState, RMAState
 
 
 def CCI(
@@ -11,7 +13,8 @@ def CCI(
     length: int = 20,
     constant: float = 0.015,
     method: Literal['sma', 'ema', 'dema', 'tema', 'rma'] = 'sma',
-) -> pd.DataFrame:
+    output: Literal["dataframe", "series", "array"] = "dataframe",
+) -> pd.DataFrame | pd.Series | np.ndarray:
     """
     Calculate Commodity Channel Index (CCI)  of the input time series
     data.
@@ -29,25 +32,46 @@ def CCI(
     method : str, optional
         The method to use for the moving average calculation.
         (default: "sma")
+    output : Literal["dataframe", "series", "array"], optional
+        "dataframe" returns the `source`, `mad`, `ma` and `CCI`
+        columns. "series" and "array" return only the CCI values,
+        computed on plain arrays without building the auxiliary
+        columns or aligning them on the index.
+        (default: "dataframe")
+
     Returns:
     --------
-    pd.DataFrame
-        The calculated CCI data as a DataFrame.
+    pd.DataFrame, pd.Series or np.ndarray
+        The calculated CCI data as a DataFrame, or the values of its
+        `CCI` column as a Series named "CCI" or as an array.
 
     Raises:
     -------
     InvalidArgumentError
-        If the method is not 'sma', 'ema', 'sema', or 'rma'.
+        If the method is not 'sma', 'ema', 'sema', or 'rma', or the
+        output is not 'dataframe', 'series', or 'array'.
     """
     source_arr = np.array(source)
 
+    match output:
+        case "dataframe":
+            pass
+        case "series" | "array":
+            cci, offset = _cci_array(
+                source_arr, length, constant, method, "float64"
+            )
+            if output == "array":
+                return cci
+            return pd.Series(cci, index=source.index[offset:], name="CCI")
+        case _:
+            raise InvalidArgumentError(
+                "output must be 'dataframe', 'series', or 'array',"
+                f" got '{output}'."
+            )
+
     match method:
         case "sma":
-            ma = np.convolve(
-                source_arr,
-                np.ones(length) / length,
-                mode="valid"
-            )
+            ma = None
         case "ema":
             ma = ema(source, length)
         case "dema":
@@ -62,14 +86,13 @@ def CCI(
                 f" got '{method}'."
             )
 
-    window = np.lib.stride_tricks.sliding_window_view(
-        source_arr,
-        length,
+    dtype = np.float32 if source_arr.dtype == np.float32 else np.float64
+    mean, mad = mean_mad_kernel(
+        np.ascontiguousarray(source_arr, dtype=dtype), length
     )
 
-    mean_window = np.mean(window, axis=1)
-    abs_diff = np.abs(window - mean_window[:, np.newaxis])
-    mad = np.mean(abs_diff, axis=1)
+    if ma is None:
+        ma = mean
 
     df = pd.DataFrame()
     df["source"] = source[length - 1 :]
@@ -78,3 +101,123 @@ def CCI(
     df["CCI"] = (df["source"] - df["ma"])  / (constant * df["mad"])
 
     return df
+
+
+class CCIState:
+    """
+    Streaming Commodity Channel Index (CCI).
+
+    The last `length` values are kept in a ring buffer written twice,
+    at `position` and `position + length`, so the window is always a
+    contiguous view. Its mean and mean absolute deviation come from
+    the compiled `kernels.window_mean_mad`, an O(length) loop that
+    sums in the same order as `CCI`, and the moving average of the
+    other methods is advanced by its O(1) state. Every value equals
+    ``CCI(...)["CCI"]`` for the same bars.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the CCI calculation.
+    constant : float
+        The constant factor for CCI calculation.
+    method : Literal["sma", "ema", "dema", "tema", "rma"]
+        The method used for the moving average calculation.
+    value : float
+        The current CCI value (NaN during the warm-up period).
+    ma : float
+        The current moving average.
+    mad : float
+        The mean absolute deviation of the current window.
+    count : int
+        The number of values received so far.
+    """
+    def __init__(
+        self,
+        length: int = 20,
+        constant: float = 0.015,
+        method: Literal["sma", "ema", "dema", "tema", "rma"] = "sma",
+    ) -> None:
+        """
+        Initialize the CCI state.
+
+        Parameters:
+        -----------
+        length : int, optional
+            The number of periods to include in the CCI calculation
+            (default: 20)
+        constant : float, optional
+            The constant factor for CCI calculation.
+            (default: 0.015)
+        method : str, optional
+            The method to use for the moving average calculation.
+            (default: "sma")
+        """
+        if length < 1:
+            raise InvalidArgumentError(
+                f"length must be greater than 0, got '{length}'."
+            )
+
+        match method:
+            case "sma":
+                self._ma_state = None
+            case "ema":
+                self._ma_state = EMAState(length)
+            case "dema":
+                self._ma_state = SEMAState(length, 2)
+            case "tema":
+                self._ma_state = SEMAState(length, 3)
+            case "rma":
+                self._ma_state = RMAState(length)
+            case _:
+                raise InvalidArgumentError(
+                    "method must be 'sma', 'ema', 'sema', or 'rma',"
+                    f" got '{method}'."
+                )
+
+        self.length = length
+        self.constant = constant
+        self.method = method
+        self.value = np.nan
+        self.ma = np.nan
+        self.mad = np.nan
+        self.count = 0
+
+        self._buffer = np.empty(2 * length)
+        self._position = 0
+
+    def update(self, value: float) -> float:
+        """
+        Add a new value and return the updated CCI.
+
+        Parameters:
+        -----------
+        value : float
+            The next value of the time series.
+
+        Returns:
+        --------
+        float
+            The current CCI value, or NaN during the warm-up period.
+        """
+        value = float(value)
+
+        self._buffer[self._position] = value
+        self._buffer[self._position + self.length] = value
+        self._position = (self._position + 1) % self.length
+        self.count += 1
+
+        if self._ma_state is not None:
+            self.ma = self._ma_state.update(value)
+
+        if self.count < self.length:
+            return self.value
+
+        mean, self.mad = window_mean_mad(
+            self._buffer[self._position:self._position + self.length]
+        )
+        if self._ma_state is None:
+            self.ma = mean
+
+        self.value = divide(value - self.ma, self.constant * self.mad)
+        return self.value
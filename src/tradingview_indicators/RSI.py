@@ -3,14 +3,34 @@ from typing import Literal
 import numpy as np
 import pandas as pd
 
+from .config import resolve_dtype
 from .errors_exceptions import InvalidArgumentError
-from .moving_average import sma, ema, sema, rma
+from .moving_average import sma, ema, sema, rma, SMAState, EMAState, RMAState
+from .kernels import (
+    rsi_kernel,
+    rsi_gain,
+    divide,
+    MA_SMA,
+    MA_EMA,
+    MA_DEMA,
+    MA_TEMA,
+    MA_RMA,
+)
+
+MA_METHODS = {
+    "sma": MA_SMA,
+    "ema": MA_EMA,
+    "dema": MA_DEMA,
+    "tema": MA_TEMA,
+    "rma": MA_RMA,
+}
 
 
 def RSI(
     source: pd.Series,
     periods: int = 14,
     ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "rma",
+    dtype: Literal["float32", "float64"] | None = None,
 ) -> pd.Series:
     """
     Calculate the Relative Strength Index (RSI) for a given time series
@@ -23,6 +43,69 @@ def RSI(
     periods : int, optional
         The number of periods to use for RSI calculation.
         (default: 14)
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The moving average used to smooth gains and losses.
+        (default: "rma")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    pd.Series
+        The calculated RSI values for the input data.
+
+    Note:
+    -----
+    The gains, losses, both moving averages and the RSI are computed
+    in a single pass of `kernels.rsi_kernel`. Sources with missing
+    values go through `_rsi_series`, which drops the missing diffs
+    before smoothing them.
+    """
+    if ma_method not in MA_METHODS:
+        raise InvalidArgumentError(
+            "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma',"
+            f" got '{ma_method}'."
+        )
+
+    dtype = resolve_dtype(dtype)
+    values = source.to_numpy(dtype=dtype)
+
+    if np.isnan(values).any():
+        return _rsi_series(source.astype(dtype), periods, ma_method, dtype)
+
+    smooth = {"dema": 2, "tema": 3}.get(ma_method, 1)
+    offset = smooth * (periods - 1) + 1
+
+    rsi_values = rsi_kernel(values, periods, MA_METHODS[ma_method])
+    return pd.Series(
+        rsi_values[offset:],
+        index=source.index[offset:],
+        name="RSI",
+    )
+
+
+def _rsi_series(
+    source: pd.Series,
+    periods: int,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"],
+    dtype: np.dtype,
+) -> pd.Series:
+    """
+    Calculate the Relative Strength Index (RSI) with Series
+    operations.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The input time series data, already cast to `dtype`.
+    periods : int
+        The number of periods to use for RSI calculation.
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"]
+        The moving average used to smooth gains and losses.
+    dtype : np.dtype
+        The dtype of the calculation.
 
     Returns:
     --------
@@ -37,20 +120,200 @@ def RSI(
 
     match ma_method:
         case "sma":
-            relative_strength = sma(upward_diff, periods) / sma(downward_diff, periods)
+            relative_strength = (
+                sma(upward_diff, periods, dtype=dtype)
+                / sma(downward_diff, periods, dtype=dtype)
+            )
         case "ema":
-            relative_strength = ema(upward_diff, periods) / ema(downward_diff, periods)
+            relative_strength = (
+                ema(upward_diff, periods, dtype=dtype)
+                / ema(downward_diff, periods, dtype=dtype)
+            )
         case "dema":
-            relative_strength = sema(upward_diff, periods, 2) / sema(downward_diff, periods, 2)
+            relative_strength = (
+                sema(upward_diff, periods, 2, dtype)
+                / sema(downward_diff, periods, 2, dtype)
+            )
         case "tema":
-            relative_strength = sema(upward_diff, periods, 3) / sema(downward_diff, periods, 3)
+            relative_strength = (
+                sema(upward_diff, periods, 3, dtype)
+                / sema(downward_diff, periods, 3, dtype)
+            )
         case "rma":
-            relative_strength = rma(upward_diff, periods) / rma(downward_diff, periods)
-        case _:
-            raise InvalidArgumentError(
-                "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma',"
-                f" got '{ma_method}'."
+            relative_strength = (
+                rma(upward_diff, periods, dtype=dtype)
+                / rma(downward_diff, periods, dtype=dtype)
             )
 
     rsi = 100 - (100 / (1 + relative_strength))
     return rsi.rename("RSI")
+
+
+class RSIState:
+    """
+    Streaming Relative Strength Index (RSI).
+
+    Each close updates the gain and loss moving averages in O(1) and
+    returns the same value `RSI` gives for the same bars. A NaN close
+    is a bar without a price: it leaves the state unchanged and
+    returns the current value, so the results match
+    `RSI(source.dropna())` like `CrossSectionalRSI` does.
+
+    The state also follows the realtime bar of TradingView:
+    `update_last` revises the forming bar as often as needed without
+    committing it, and `commit` finalizes it. Every revision is
+    applied on top of the last committed state, so recomputing on
+    every tick never accumulates into the moving averages.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods of the moving averages.
+    ma_method : Literal["sma", "ema", "rma"]
+        The moving average used to smooth gains and losses.
+    value : float
+        The current RSI value, including the forming bar (NaN during
+        the warm-up period).
+    count : int
+        The number of valid closes received so far, including the
+        forming bar.
+    """
+    def __init__(
+        self,
+        length: int = 14,
+        ma_method: Literal["sma", "ema", "rma"] = "rma",
+    ) -> None:
+        """
+        Initialize the RSI state.
+
+        Parameters:
+        -----------
+        length : int, optional
+            The number of periods of the moving averages.
+            (default: 14)
+        ma_method : Literal["sma", "ema", "rma"], optional
+            The moving average used to smooth gains and losses.
+            (default: "rma")
+        """
+        match ma_method:
+            case "sma":
+                state = SMAState
+            case "ema":
+                state = EMAState
+            case "rma":
+                state = RMAState
+            case _:
+                raise InvalidArgumentError(
+                    "ma_method must be 'sma', 'ema', or 'rma',"
+                    f" got '{ma_method}'."
+                )
+
+        self._upward = state(length)
+        self._downward = state(length)
+
+        self.length = length
+        self.ma_method = ma_method
+        self.value = np.nan
+        self.count = 0
+
+        self._prev_close = np.nan
+        self._committed = None
+
+    def _snapshot(self) -> tuple:
+        """
+        Capture the committed state before the forming bar.
+        """
+        return (
+            self.value,
+            self.count,
+            self._prev_close,
+            self._upward._snapshot(),
+            self._downward._snapshot(),
+        )
+
+    def _restore(self, snapshot: tuple) -> None:
+        """
+        Revert the forming bar.
+        """
+        (
+            self.value,
+            self.count,
+            self._prev_close,
+            upward_snapshot,
+            downward_snapshot,
+        ) = snapshot
+        self._upward._restore(upward_snapshot)
+        self._downward._restore(downward_snapshot)
+
+    def update_last(self, close: float) -> float:
+        """
+        Set the close of the forming bar and return the RSI with it.
+
+        Calling it again before `commit` replaces the previous close
+        of the forming bar.
+
+        Parameters:
+        -----------
+        close : float
+            The current close of the forming bar.
+
+        Returns:
+        --------
+        float
+            The RSI value including the forming bar, or NaN during
+            the warm-up period. A NaN close returns the value of the
+            committed bars.
+        """
+        if self._committed is None:
+            self._committed = self._snapshot()
+        else:
+            self._restore(self._committed)
+
+        close = float(close)
+
+        if np.isnan(close):
+            return self.value
+
+        if self.count:
+            upward_ma = self._upward.update(rsi_gain(close, self._prev_close))
+            downward_ma = self._downward.update(
+                rsi_gain(self._prev_close, close)
+            )
+            relative_strength = divide(upward_ma, downward_ma)
+            self.value = 100 - divide(100.0, 1 + relative_strength)
+
+        self._prev_close = close
+        self.count += 1
+        return self.value
+
+    def commit(self) -> float:
+        """
+        Finalize the forming bar.
+
+        Returns:
+        --------
+        float
+            The RSI value of the committed bar.
+        """
+        self._committed = None
+        return self.value
+
+    def update(self, close: float) -> float:
+        """
+        Add a closed bar and return the updated RSI.
+
+        It is the same as `update_last` followed by `commit`, so it
+        also finalizes a forming bar with `close`.
+
+        Parameters:
+        -----------
+        close : float
+            The close of the bar.
+
+        Returns:
+        --------
+        float
+            The current RSI value, or NaN during the warm-up period.
+        """
+        self.update_last(close)
+        return self.commit()
@@ -1,13 +1,37 @@
-from .moving_average import sma, rma, ema, sema
-from .CCI import CCI
+from .moving_average import (
+    sma,
+    rma,
+    ema,
+    sema,
+    ma_bank,
+    SMAState,
+    RMAState,
+    EMAState,
+    SEMAState,
+)
+from .config import set_dtype, get_dtype
+from .CCI import CCI, CCIState
 from .MACD import MACD
-from .RSI import RSI
+from .RSI import RSI, RSIState
 from .DMI import DMI
 from .TRIX import TRIX
 from .SMIO import SMIO
 from .slow_stoch import slow_stoch
-from .stoch import stoch
-from .ichimoku import Ichimoku
+from .stoch import stoch, StochState
+from .rolling import RollingMax, RollingMin, RollingStd
+from .ichimoku import Ichimoku, IchimokuState
 from .didi_index import didi_index
 from .tsi import tsi
-from .bollinger import bollinger_bands, bollinger_trends
+from .bollinger import (
+    bollinger_bands,
+    bollinger_bank,
+    bollinger_trends,
+    BollingerState,
+)
+from .cross_section import (
+    CrossSectionalEMA,
+    CrossSectionalRMA,
+    CrossSectionalRSI,
+    CrossSectionalEngine,
+)
+from . import array
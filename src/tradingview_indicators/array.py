@@ -0,0 +1,603 @@
+"""
+NumPy Array API
+
+This module mirrors the main indicators of the package for plain
+float64 arrays. The functions never build pandas objects, so they
+skip index alignment, renaming and `dropna` entirely.
+
+Every function returns a ``(values, offset)`` tuple. `values` is an
+array (or a tuple of arrays) without the warm-up period and `offset`
+is the position in the source of its first element, so
+``values[i]`` belongs to ``source[offset + i]``. Missing values after
+the warm-up are kept in place instead of being dropped. The values
+have the dtype passed to the call, or the one set by `set_dtype`.
+
+Functions
+---------
+sma(source, length)
+    Simple Moving Average.
+ema(source, length)
+    Exponential Moving Average.
+rma(source, length)
+    Relative Moving Average.
+sema(source, length, smooth)
+    Smoothed Exponential Moving Average.
+RSI(source, periods, ma_method)
+    Relative Strength Index.
+stoch(source, high, low, length)
+    Fast Stochastic Oscillator.
+CCI(source, length, constant, method)
+    Commodity Channel Index.
+tsi(source, short_length, long_length, ma_method)
+    True Strength Index.
+TRIX(source, length, signal_length, ma_method)
+    Triple Exponential Moving Average oscillator.
+MACD(source, fast_length, slow_length, signal_length, ...)
+    Moving Average Convergence Divergence.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+from .config import resolve_dtype
+from .errors_exceptions import InvalidArgumentError
+from .kernels import (
+    ema_kernel,
+    rma_kernel,
+    sema_kernel,
+    sma_batch_kernel,
+    rsi_kernel,
+    mean_mad_kernel,
+)
+from .RSI import MA_METHODS
+
+
+def _as_array(
+    source: np.ndarray,
+    dtype: Literal["float32", "float64"] | None,
+) -> np.ndarray:
+    """
+    Convert `source` to a contiguous array of the resolved `dtype`.
+    """
+    return np.ascontiguousarray(source, dtype=resolve_dtype(dtype))
+
+
+def _pad(values: np.ndarray, offset: int, target_offset: int) -> np.ndarray:
+    """
+    Prepend NaN values so `values` starts at `target_offset`.
+    """
+    padding = np.full(offset - target_offset, np.nan, dtype=values.dtype)
+    return np.concatenate([padding, values])
+
+
+def _mean_absolute_deviation(
+    source: np.ndarray,
+    length: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling mean of `source` and its mean absolute
+    deviation.
+
+    The windows are read in place by a compiled loop, so the peak
+    memory is O(n + length) whatever the window length.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input time series data.
+    length : int
+        The number of periods of each window.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The mean and the mean absolute deviation of each complete
+        window.
+    """
+    dtype = np.float32 if source.dtype == np.float32 else np.float64
+    return mean_mad_kernel(np.ascontiguousarray(source, dtype=dtype), length)
+
+
+def sma(
+    source: np.ndarray,
+    length: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Simple Moving Average (SMA) of an array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The time series data to calculate the SMA for.
+    length : int
+        The number of periods to include in the SMA calculation.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The SMA values and their offset in `source`.
+    """
+    source = _as_array(source, dtype)
+    sma_values = sma_batch_kernel(source.reshape(-1, 1), length).ravel()
+    return sma_values[length - 1:], length - 1
+
+
+def ema(
+    source: np.ndarray,
+    length: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Exponential Moving Average (EMA) of an array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The time series data to calculate the EMA for.
+    length : int
+        The number of periods to include in the EMA calculation.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The EMA values and their offset in `source`.
+    """
+    ema_values = ema_kernel(_as_array(source, dtype), length)
+    return ema_values[length - 1:], length - 1
+
+
+def rma(
+    source: np.ndarray,
+    length: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Relative Moving Average (RMA) of an array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The time series data to calculate the RMA for.
+    length : int
+        The number of periods to include in the RMA calculation.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The RMA values and their offset in `source`.
+    """
+    return rma_kernel(_as_array(source, dtype), length), length - 1
+
+
+def sema(
+    source: np.ndarray,
+    length: int,
+    smooth: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Smoothed Exponential Moving Average (SEMA) of an
+    array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The time series data to calculate the SEMA for.
+    length : int
+        The number of periods to include in the SEMA calculation.
+    smooth : int
+        The smooth of EMAs to calculate.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The SEMA values and their offset in `source`.
+    """
+    offset = smooth * (length - 1)
+    sema_values = sema_kernel(_as_array(source, dtype), length, smooth)
+    return sema_values[offset:], offset
+
+
+def _moving_average(
+    source: np.ndarray,
+    length: int,
+    ma_method: str,
+    dtype: Literal["float32", "float64"] | None,
+    argument: str = "ma_method",
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the moving average selected by `ma_method`.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The time series data.
+    length : int
+        The number of periods of the moving average.
+    ma_method : str
+        One of 'sma', 'ema', 'dema', 'tema' or 'rma'.
+    dtype : Literal["float32", "float64"] or None
+        The dtype of the calculation.
+    argument : str, optional
+        The argument name used in the error message.
+        (default: "ma_method")
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The moving average values and their offset in `source`.
+    """
+    match ma_method:
+        case "sma":
+            return sma(source, length, dtype)
+        case "ema":
+            return ema(source, length, dtype)
+        case "dema":
+            return sema(source, length, 2, dtype)
+        case "tema":
+            return sema(source, length, 3, dtype)
+        case "rma":
+            return rma(source, length, dtype)
+        case _:
+            raise InvalidArgumentError(
+                f"{argument} must be 'sma', 'ema', 'dema', 'tema', or 'rma',"
+                f" got '{ma_method}'."
+            )
+
+
+def RSI(
+    source: np.ndarray,
+    periods: int = 14,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "rma",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Relative Strength Index (RSI) of an array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input time series data for which to calculate RSI.
+    periods : int, optional
+        The number of periods to use for RSI calculation.
+        (default: 14)
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The moving average used to smooth gains and losses.
+        (default: "rma")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The RSI values and their offset in `source`.
+    """
+    if ma_method not in MA_METHODS:
+        raise InvalidArgumentError(
+            "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma',"
+            f" got '{ma_method}'."
+        )
+
+    offset = {"dema": 2, "tema": 3}.get(ma_method, 1) * (periods - 1) + 1
+    rsi = rsi_kernel(_as_array(source, dtype), periods, MA_METHODS[ma_method])
+    return rsi[offset:], offset
+
+
+def stoch(
+    source: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    length: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Fast Stochastic Oscillator of arrays.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input time series data.
+    high : np.ndarray
+        The high prices for the given time series data.
+    low : np.ndarray
+        The low prices for the given time series data.
+    length : int
+        The length of the stochastic period.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The Fast Stochastic Oscillator values and their offset in
+        `source`.
+    """
+    source = _as_array(source, dtype)
+    sliding_window = np.lib.stride_tricks.sliding_window_view
+    lowest_low = sliding_window(_as_array(low, dtype), length).min(axis=1)
+    highest_high = (
+        sliding_window(_as_array(high, dtype), length).max(axis=1)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stochastic = (
+            100
+            * (source[length - 1:] - lowest_low)
+            / (highest_high - lowest_low)
+        )
+
+    return stochastic, length - 1
+
+
+def CCI(
+    source: np.ndarray,
+    length: int = 20,
+    constant: float = 0.015,
+    method: Literal["sma", "ema", "dema", "tema", "rma"] = "sma",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Commodity Channel Index (CCI) of an array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input time series data.
+    length : int, optional
+        The number of periods to include in the CCI calculation
+        (default: 20)
+    constant : float, optional
+        The constant factor for CCI calculation.
+        (default: 0.015)
+    method : str, optional
+        The method to use for the moving average calculation.
+        (default: "sma")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The CCI values and their offset in `source`. As in `CCI`, the
+        values are NaN until the moving average is available.
+    """
+    source = _as_array(source, dtype)
+    offset = length - 1
+
+    match method:
+        case "sma":
+            ma = None
+        case "ema" | "dema" | "tema" | "rma":
+            ma, ma_offset = _moving_average(
+                source, length, method, source.dtype
+            )
+            # the warm-up of the moving average can be longer than
+            # the source, so keep one value per window
+            ma = _pad(ma, ma_offset, offset)[: max(len(source) - offset, 0)]
+        case _:
+            raise InvalidArgumentError(
+                "method must be 'sma', 'ema', 'sema', or 'rma',"
+                f" got '{method}'."
+            )
+
+    mean, mad = _mean_absolute_deviation(source, length)
+
+    if ma is None:
+        ma = mean
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cci = (source[offset:] - ma) / (constant * mad)
+
+    return cci, offset
+
+
+def tsi(
+    source: np.ndarray,
+    short_length: int = 13,
+    long_length: int = 25,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the True Strength Index (TSI) of an array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input time series data for calculating TSI.
+    short_length : int
+        The number of periods for the short-term moving average.
+        (default: 13)
+    long_length : int
+        The number of periods for the long-term moving average.
+        (default: 25)
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The method to use for calculating moving averages.
+        (default: "ema")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The TSI values and their offset in `source`.
+    """
+    source = _as_array(source, dtype)
+    price_change = source[1:] - source[:-1]
+
+    short_smoothed, short_offset = _moving_average(
+        price_change, short_length, ma_method, source.dtype
+    )
+    long_smoothed, long_offset = _moving_average(
+        short_smoothed, long_length, ma_method, source.dtype
+    )
+    absolute_short_smoothed, _ = _moving_average(
+        np.abs(price_change), short_length, ma_method, source.dtype
+    )
+    absolute_long_smoothed, _ = _moving_average(
+        absolute_short_smoothed, long_length, ma_method, source.dtype
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tsi_values = long_smoothed / absolute_long_smoothed
+
+    return tsi_values, 1 + short_offset + long_offset
+
+
+def TRIX(
+    source: np.ndarray,
+    length: int = 18,
+    signal_length: int = 1,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[np.ndarray, int]:
+    """
+    Calculate the Triple Exponential Moving Average (TRIX) oscillator
+    of an array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input time series data for calculating TRIX.
+    length : int
+        The number of periods for the TRIX moving average.
+        (default: 18)
+    signal_length : int
+        The number of periods of the difference.
+        (default: 1)
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The method to use for calculating moving averages.
+        (default: "ema")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[np.ndarray, int]
+        The TRIX values and their offset in `source`.
+    """
+    trix_source = np.log(_as_array(source, dtype))
+    offset = signal_length
+
+    for _ in range(3):
+        trix_source, ma_offset = _moving_average(
+            trix_source, length, ma_method, trix_source.dtype
+        )
+        offset += ma_offset
+
+    trix = (trix_source[signal_length:] - trix_source[:-signal_length]) * 10000
+    return trix, offset
+
+
+def MACD(
+    source: np.ndarray,
+    fast_length: int,
+    slow_length: int,
+    signal_length: int,
+    diff_method: Literal["absolute", "ratio"] = "absolute",
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    signal_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> tuple[tuple[np.ndarray, np.ndarray, np.ndarray], int]:
+    """
+    Calculate the Moving Average Convergence Divergence (MACD) of an
+    array.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input time series data for calculating MACD.
+    fast_length : int
+        The number of periods for the fast moving average.
+    slow_length : int
+        The number of periods for the slow moving average.
+    signal_length : int
+        The number of periods for the signal line moving average.
+    diff_method : Literal["absolute", "ratio"], optional
+        How the fast and slow moving averages are compared. The "dtw"
+        method of `MACD` isn't available for arrays.
+        (default: "absolute")
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The method to use for the fast and slow moving averages.
+        (default: "ema")
+    signal_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The method to use for the signal line.
+        (default: "ema")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    tuple[tuple[np.ndarray, np.ndarray, np.ndarray], int]
+        The MACD, signal and histogram values, all starting at the
+        returned offset in `source`. The signal and histogram are NaN
+        until the signal line is available.
+    """
+    source = _as_array(source, dtype)
+    fast_ma, fast_offset = _moving_average(
+        source, fast_length, ma_method, source.dtype
+    )
+    slow_ma, slow_offset = _moving_average(
+        source, slow_length, ma_method, source.dtype
+    )
+
+    offset = max(fast_offset, slow_offset)
+    fast_ma = fast_ma[offset - fast_offset:]
+    slow_ma = slow_ma[offset - slow_offset:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        match diff_method:
+            case "absolute":
+                macd = fast_ma - slow_ma
+            case "ratio":
+                macd = fast_ma / slow_ma
+            case _:
+                raise InvalidArgumentError(
+                    "diff_method must be 'absolute' or 'ratio',"
+                    f" got '{diff_method}'."
+                )
+
+        macd_signal, signal_offset = _moving_average(
+            macd, signal_length, signal_method, source.dtype, "signal_method"
+        )
+
+        if diff_method == "absolute":
+            histogram = macd[signal_offset:] - macd_signal
+        else:
+            histogram = macd[signal_offset:] / macd_signal
+
+    return (
+        macd,
+        _pad(macd_signal, signal_offset, 0),
+        _pad(histogram, signal_offset, 0),
+    ), offset
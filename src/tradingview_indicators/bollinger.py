@@ -2,35 +2,160 @@ from typing import Literal
 import pandas as pd
 import numpy as np
 
+from .config import resolve_dtype
 from .errors_exceptions import InvalidArgumentError
-from .moving_average import sma, ema, sema, rma
+from .kernels import bands_kernel
+from .moving_average import (
+    ma_bank,
+    sma,
+    ema,
+    sema,
+    rma,
+    SMAState,
+    EMAState,
+    SEMAState,
+    RMAState,
+)
+from .rolling import rolling_moments, RollingStd
 from .utils import DynamicTimeWarping
 
 
+def _bases_and_deviations(
+    source: pd.Series,
+    lengths: list[int],
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"],
+    dtype: np.dtype,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Calculate the bases and standard deviations of several lengths
+    from one shared pass over the data.
+
+    The standard deviations (and the SMA bases) of every length are
+    read from the same rolling moments, and the EMA and RMA bases of
+    every length come from one `ma_bank` pass.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The time series data.
+    lengths : list[int]
+        The lengths of the bands.
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"]
+        The moving average of the basis.
+    dtype : np.dtype
+        The resolved dtype of the calculation.
+
+    Returns:
+    --------
+    tuple[pd.DataFrame, pd.DataFrame]
+        The bases and the standard deviations, one column per
+        distinct length.
+    """
+    if ma_method not in ("sma", "ema", "dema", "tema", "rma"):
+        raise InvalidArgumentError(
+            "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma',"
+            f" got '{ma_method}'."
+        )
+
+    distinct_lengths = list(dict.fromkeys(lengths))
+    means, deviations = rolling_moments(source, distinct_lengths)
+
+    match ma_method:
+        case "sma":
+            bases = means.astype(dtype)
+        case "ema" | "rma":
+            bases = ma_bank(source, distinct_lengths, ma_method, dtype)
+        case "dema" | "tema":
+            smooth = 2 if ma_method == "dema" else 3
+            bases = pd.DataFrame(
+                {
+                    length: sema(source, length, smooth, dtype)
+                    for length in distinct_lengths
+                },
+                index=source.index,
+            )
+
+    return bases, deviations.astype(dtype)
+
+
+def _bollinger_bank(
+    source: pd.Series,
+    lengths: list[int],
+    mult: float,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"],
+    dtype: Literal["float32", "float64"] | None,
+) -> list[pd.DataFrame]:
+    """
+    Calculate the Bollinger Bands of several lengths from one shared
+    pass over the data.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The time series data.
+    lengths : list[int]
+        The lengths of the bands.
+    mult : float
+        The multiplier of the standard deviation.
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"]
+        The moving average of the basis.
+    dtype : Literal["float32", "float64"] or None
+        The dtype of the calculation.
+
+    Returns:
+    --------
+    list[pd.DataFrame]
+        The basis, upper and lower bands of each length, in the order
+        of `lengths`.
+    """
+    bases, deviations = _bases_and_deviations(
+        source, lengths, ma_method, resolve_dtype(dtype)
+    )
+
+    bands = []
+    for length in lengths:
+        basis = bases[length]
+        deviation = mult * deviations[length]
+
+        bands.append(
+            pd.DataFrame(
+                {
+                    "basis": basis,
+                    "upper": basis + deviation,
+                    "lower": basis - deviation,
+                }
+            )
+        )
+    return bands
+
+
 def bollinger_bands(
     source: pd.Series,
     length: int,
     mult: float,
     ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    dtype: Literal["float32", "float64"] | None = None,
 ) -> pd.DataFrame:
+    dtype = resolve_dtype(dtype)
+
     match ma_method:
         case "sma":
-            basis = sma(source, length)
+            basis = sma(source, length, dtype)
         case "ema":
-            basis = ema(source, length)
+            basis = ema(source, length, dtype)
         case "dema":
-            basis = sema(source, length, 2)
+            basis = sema(source, length, 2, dtype)
         case "tema":
-            basis = sema(source, length, 3)
+            basis = sema(source, length, 3, dtype)
         case "rma":
-            basis = rma(source, length)
+            basis = rma(source, length, dtype=dtype)
         case _:
             raise InvalidArgumentError(
                 "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma',"
                 f" got '{ma_method}'."
             )
 
-    deviation = mult * source.rolling(window=length).std()
+    deviation = mult * source.rolling(window=length).std().astype(dtype)
 
     return pd.DataFrame(
         {
@@ -41,6 +166,180 @@ def bollinger_bands(
     )
 
 
+def bollinger_bank(
+    source: pd.Series | np.ndarray,
+    lengths: int | list[int],
+    mults: list[float] | np.ndarray,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> pd.DataFrame | np.ndarray:
+    """
+    Calculate the Bollinger Bands of every combination of lengths and
+    multipliers into one contiguous block.
+
+    The basis and the standard deviation of each length are computed
+    once, from the shared pass of `bollinger_trends`, and every
+    multiplier only scales the deviation. The deviations come from
+    `rolling.rolling_moments` instead of the pandas rolling standard
+    deviation of `bollinger_bands`, so the bands can differ from
+    `bollinger_bands` where pandas loses precision.
+
+    Parameters:
+    -----------
+    source : pd.Series or np.ndarray
+        The time series data.
+    lengths : int or list[int]
+        The length, or the lengths, of the bands.
+    mults : list[float] or np.ndarray
+        The multipliers of the standard deviation.
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The moving average of the basis.
+        (default: "ema")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    pd.DataFrame or np.ndarray
+        A C-contiguous ``(n_bars, n_lengths * n_mults, 3)`` block,
+        with the band sets ordered by length then multiplier, and the
+        basis, upper and lower bands on the last axis. Series inputs
+        return a DataFrame over the same memory, with the source index
+        and ``(length, mult, band)`` columns.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If `mults` is empty, or `ma_method` or `lengths` is invalid.
+    """
+    dtype = resolve_dtype(dtype)
+    lengths = [lengths] if np.ndim(lengths) == 0 else list(lengths)
+    mults = np.asarray(mults, dtype=dtype).ravel()
+
+    if mults.size == 0:
+        raise InvalidArgumentError("mults must hold at least one multiplier.")
+
+    series = source if isinstance(source, pd.Series) else pd.Series(source)
+    bases, deviations = _bases_and_deviations(
+        series, lengths, ma_method, dtype
+    )
+    block = bands_kernel(
+        np.ascontiguousarray(bases[lengths].to_numpy()),
+        np.ascontiguousarray(deviations[lengths].to_numpy()),
+        mults,
+        np.empty((len(series), len(lengths) * mults.size, 3), dtype=dtype),
+    )
+
+    if isinstance(source, pd.Series):
+        columns = pd.MultiIndex.from_product(
+            [lengths, mults.tolist(), ["basis", "upper", "lower"]],
+            names=["length", "mult", "band"],
+        )
+        return pd.DataFrame(
+            block.reshape(len(series), -1),
+            index=source.index,
+            columns=columns,
+            copy=False,
+        )
+    return block
+
+
+class BollingerState:
+    """
+    Streaming Bollinger Bands.
+
+    The standard deviation comes from the ring buffer and the Welford
+    updates of `RollingStd`, and the basis from the streaming state of
+    `ma_method`, so every bar costs O(1). The deviation equals
+    ``source.rolling(length).std()``, and the bands equal
+    `bollinger_bands` in float64 to floating point tolerance.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods of the basis and the deviation.
+    mult : float
+        The multiplier of the standard deviation.
+    ma_method : str
+        The moving average of the basis.
+    value : dict[str, float]
+        The "basis", "upper" and "lower" bands of the last bar.
+    count : int
+        The number of values received so far.
+    """
+    def __init__(
+        self,
+        length: int,
+        mult: float,
+        ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    ) -> None:
+        """
+        Initialize the Bollinger Bands state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods of the basis and the deviation.
+        mult : float
+            The multiplier of the standard deviation.
+        ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+            The moving average of the basis.
+            (default: "ema")
+        """
+        match ma_method:
+            case "sma":
+                self._basis = SMAState(length)
+            case "ema":
+                self._basis = EMAState(length)
+            case "dema":
+                self._basis = SEMAState(length, 2)
+            case "tema":
+                self._basis = SEMAState(length, 3)
+            case "rma":
+                self._basis = RMAState(length)
+            case _:
+                raise InvalidArgumentError(
+                    "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma',"
+                    f" got '{ma_method}'."
+                )
+
+        self._deviation = RollingStd(length)
+
+        self.length = length
+        self.mult = mult
+        self.ma_method = ma_method
+        self.value = dict.fromkeys(["basis", "upper", "lower"], np.nan)
+        self.count = 0
+
+    def update(self, value: float) -> dict[str, float]:
+        """
+        Add a new value and return the updated bands.
+
+        Parameters:
+        -----------
+        value : float
+            The next value of the time series.
+
+        Returns:
+        --------
+        dict[str, float]
+            The "basis", "upper" and "lower" bands, NaN during the
+            warm-up period.
+        """
+        basis = self._basis.update(value)
+        deviation = self.mult * self._deviation.update(value)
+
+        self.count += 1
+        self.value = {
+            "basis": basis,
+            "upper": basis + deviation,
+            "lower": basis - deviation,
+        }
+        return self.value
+
+
 def bollinger_trends(
     source: pd.Series,
     short_length: int = 20,
@@ -50,9 +349,11 @@ def bollinger_trends(
     stdev_method: Literal["absolute", "ratio", "dtw"] = "absolute",
     diff_method: Literal["normal", "absolute", "ratio", "dtw"] = "normal",
     based_on: Literal["short_length", "long_length"] = "short_length",
+    dtype: Literal["float32", "float64"] | None = None,
 ) -> pd.Series:
-    short_bands = bollinger_bands(source, short_length, mult, ma_method)
-    long_bands = bollinger_bands(source, long_length, mult, ma_method)
+    short_bands, long_bands = _bollinger_bank(
+        source, [short_length, long_length], mult, ma_method, dtype
+    )
 
     short_lower = short_bands["lower"]
     short_upper = short_bands["upper"]
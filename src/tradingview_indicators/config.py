@@ -0,0 +1,103 @@
+"""
+Configuration Module
+
+This module holds the package wide options.
+
+Functions
+---------
+set_dtype(dtype)
+    Set the default floating point dtype of the indicators.
+get_dtype()
+    Return the default floating point dtype of the indicators.
+resolve_dtype(dtype)
+    Return the dtype of a call, falling back to the default one.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+from .errors_exceptions import InvalidArgumentError
+
+DTYPES = ("float64", "float32")
+
+_options = {"dtype": np.dtype("float64")}
+
+
+def _validate_dtype(dtype: str | np.dtype | type) -> np.dtype:
+    """
+    Convert `dtype` to a supported `np.dtype`.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If `dtype` isn't float32 or float64.
+    """
+    try:
+        validated = np.dtype(dtype)
+    except TypeError:
+        validated = None
+
+    if dtype is None or validated is None or validated.name not in DTYPES:
+        raise InvalidArgumentError(
+            f"dtype must be 'float32' or 'float64', got '{dtype}'."
+        )
+    return validated
+
+
+def set_dtype(dtype: Literal["float32", "float64"] | np.dtype | type) -> None:
+    """
+    Set the default floating point dtype of the indicators.
+
+    With "float32" the compiled kernels read and write float32 arrays,
+    halving the memory footprint and the cache traffic of large batch
+    jobs, while the recursions and sums still accumulate in float64.
+    `MACD`, `DMI`, `TRIX`, `tsi` and `SMIO`, which have no `dtype`
+    argument, follow it through their moving averages.
+
+    Parameters:
+    -----------
+    dtype : Literal["float32", "float64"], np.dtype or type
+        The dtype used when a call doesn't pass its own `dtype`.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If `dtype` isn't float32 or float64.
+    """
+    _options["dtype"] = _validate_dtype(dtype)
+
+
+def get_dtype() -> np.dtype:
+    """
+    Return the default floating point dtype of the indicators.
+
+    Returns:
+    --------
+    np.dtype
+        The dtype set by `set_dtype` (float64 by default).
+    """
+    return _options["dtype"]
+
+
+def resolve_dtype(
+    dtype: Literal["float32", "float64"] | np.dtype | type | None = None,
+) -> np.dtype:
+    """
+    Return the dtype of a call.
+
+    Parameters:
+    -----------
+    dtype : Literal["float32", "float64"], np.dtype, type or None
+        The dtype passed to the indicator, or None to use the default
+        dtype.
+        (default: None)
+
+    Returns:
+    --------
+    np.dtype
+        The dtype to compute with.
+    """
+    if dtype is None:
+        return get_dtype()
+    return _validate_dtype(dtype)
@@ -0,0 +1,591 @@
+"""
+Cross-Sectional Streaming Module
+
+This module keeps the streaming state of an indicator for many
+symbols at once. Every field of the state is a contiguous NumPy array
+with one slot per symbol (a struct of arrays), so a new bar for all
+the symbols is a single vectorized call instead of one Python object
+update per symbol.
+
+Each symbol has its own warm-up counter. A NaN close means the symbol
+has no bar yet (or none this time) and leaves its state untouched, so
+symbols listed later are seeded with their own first closes. For each
+symbol the values are identical to the single-symbol states
+(`EMAState`, `RMAState`, `RSIState`) fed with its valid closes.
+
+Classes
+-------
+CrossSectionalEMA(n_symbols, length)
+    Streaming EMA of every symbol.
+CrossSectionalRMA(n_symbols, length)
+    Streaming RMA of every symbol.
+CrossSectionalRSI(n_symbols, length, ma_method)
+    Streaming RSI of every symbol.
+CrossSectionalEngine(n_symbols, ema_lengths, rma_lengths, rsi_lengths,
+                     rsi_ma_method)
+    Several of the above, advanced by the same closes.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+from .errors_exceptions import InvalidArgumentError
+
+
+class _CrossSectionalState:
+    """
+    Base class of the struct-of-arrays states.
+
+    Subclasses list their fields in `_fields`, which maps each
+    attribute name to its dtype, initial value and per-symbol shape.
+    """
+    def __init__(self, n_symbols: int, length: int) -> None:
+        if length < 1:
+            raise InvalidArgumentError(
+                f"length must be greater than 0, got '{length}'."
+            )
+
+        self.length = length
+        self.n_symbols = 0
+
+        for name, (dtype, _, shape) in self._fields().items():
+            setattr(self, name, np.empty((0, *shape), dtype=dtype))
+
+        self.add_symbols(n_symbols)
+
+    def _fields(self) -> dict[str, tuple[type, float, tuple[int, ...]]]:
+        """
+        Return the dtype, initial value and shape of every field.
+        """
+        return {
+            "count": (np.int64, 0, ()),
+            "value": (np.float64, np.nan, ()),
+        }
+
+    def add_symbols(self, count: int) -> None:
+        """
+        Append `count` symbols with empty states.
+
+        Parameters:
+        -----------
+        count : int
+            The number of symbols to add.
+        """
+        for name, (dtype, initial, shape) in self._fields().items():
+            new_slots = np.full((count, *shape), initial, dtype=dtype)
+            setattr(
+                self, name, np.concatenate([getattr(self, name), new_slots])
+            )
+
+        self.n_symbols += count
+
+    def reset(self, symbols: np.ndarray | list[int]) -> None:
+        """
+        Restart the warm-up of `symbols`, e.g. after a relisting.
+
+        Parameters:
+        -----------
+        symbols : np.ndarray or list[int]
+            The positions of the symbols to reset.
+        """
+        for name, (_, initial, _) in self._fields().items():
+            getattr(self, name)[symbols] = initial
+
+    def _validate(self, values: np.ndarray) -> np.ndarray:
+        """
+        Convert the new closes to a float64 array with one slot per
+        symbol.
+        """
+        values = np.asarray(values, dtype=np.float64)
+
+        if values.shape != (self.n_symbols,):
+            raise InvalidArgumentError(
+                f"values must have shape ({self.n_symbols},),"
+                f" got {values.shape}."
+            )
+        return values
+
+
+class _CrossSectionalSeeded(_CrossSectionalState):
+    """
+    Struct-of-arrays version of `_SeededState`.
+
+    The first `length` values of each symbol go into the compensated
+    seed sum of `kernels.sma_seed` and the following ones into the
+    recursion of `_step`.
+    """
+    def _fields(self) -> dict[str, tuple[type, float, tuple[int, ...]]]:
+        return {
+            **super()._fields(),
+            "_sum": (np.float64, 0.0, ()),
+            "_compensation": (np.float64, 0.0, ()),
+            "_neg_ct": (np.int64, 0, ()),
+            "_consecutive_same": (np.int64, 0, ()),
+            "_prev_value": (np.float64, np.nan, ()),
+        }
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+        """
+        Add a new value for every symbol and return the updated
+        moving averages.
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            The next value of each symbol, NaN for the symbols
+            without a new value.
+
+        Returns:
+        --------
+        np.ndarray
+            The current moving average of each symbol, NaN during
+            its warm-up period.
+        """
+        values = self._validate(values)
+        valid = values == values
+
+        self.count += valid
+        warm_up = valid & (self.count <= self.length)
+
+        y = values - self._compensation
+        t = self._sum + y
+        self._compensation = np.where(
+            warm_up, t - self._sum - y, self._compensation
+        )
+        self._sum = np.where(warm_up, t, self._sum)
+        self._neg_ct += warm_up & np.signbit(values)
+
+        is_same = (values == self._prev_value) | (self.count == 1)
+        self._consecutive_same = np.where(
+            warm_up,
+            np.where(is_same, self._consecutive_same + 1, 1),
+            self._consecutive_same,
+        )
+        self._prev_value = np.where(warm_up, values, self._prev_value)
+
+        is_seed = valid & (self.count == self.length)
+        if is_seed.any():
+            self.value = np.where(is_seed, self._seed(), self.value)
+
+        is_step = valid & (self.count > self.length)
+        self.value = np.where(is_step, self._step(values), self.value)
+        return self.value.copy()
+
+    def _seed(self) -> np.ndarray:
+        """
+        Calculate the SMA seed of every symbol from its warm-up
+        values.
+        """
+        result = self._sum / self.length
+        is_sign_flip = (
+            ((self._neg_ct == 0) & (result < 0))
+            | ((self._neg_ct == self.length) & (result > 0))
+        )
+        return np.where(
+            self._consecutive_same >= self.length,
+            self._prev_value,
+            np.where(is_sign_flip, 0.0, result),
+        )
+
+
+class CrossSectionalRMA(_CrossSectionalSeeded):
+    """
+    Streaming Relative Moving Average (RMA) of many symbols.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the RMA calculation.
+    alpha : float
+        The smoothing factor, ``1 / length``.
+    n_symbols : int
+        The number of symbols.
+    value : np.ndarray
+        The current RMA of each symbol (NaN during its warm-up).
+    count : np.ndarray
+        The number of values received by each symbol.
+    """
+    def __init__(self, n_symbols: int, length: int) -> None:
+        """
+        Initialize the RMA states.
+
+        Parameters:
+        -----------
+        n_symbols : int
+            The number of symbols.
+        length : int
+            The number of periods to include in the RMA calculation.
+        """
+        super().__init__(n_symbols, length)
+        self.alpha = 1 / length
+
+    def _step(self, values: np.ndarray) -> np.ndarray:
+        return self.alpha * values + (1 - self.alpha) * self.value
+
+
+class CrossSectionalEMA(_CrossSectionalSeeded):
+    """
+    Streaming Exponential Moving Average (EMA) of many symbols.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the EMA calculation.
+    alpha : float
+        The smoothing factor derived from the span, as pandas does.
+    n_symbols : int
+        The number of symbols.
+    value : np.ndarray
+        The current EMA of each symbol (NaN during its warm-up).
+    count : np.ndarray
+        The number of values received by each symbol.
+    """
+    def __init__(self, n_symbols: int, length: int) -> None:
+        """
+        Initialize the EMA states.
+
+        Parameters:
+        -----------
+        n_symbols : int
+            The number of symbols.
+        length : int
+            The number of periods to include in the EMA calculation.
+        """
+        super().__init__(n_symbols, length)
+        self.alpha = 1 / (1 + (length - 1) / 2)
+        self._decay = 1 - self.alpha
+
+    def _step(self, values: np.ndarray) -> np.ndarray:
+        # NaN values never reach the recursion, so the old weight of
+        # `pandas.Series.ewm` is always a single decay step
+        weighted = self.value
+        return np.where(
+            weighted == values,
+            weighted,
+            (self._decay * weighted + self.alpha * values)
+            / (self._decay + self.alpha),
+        )
+
+
+class _CrossSectionalSMA(_CrossSectionalState):
+    """
+    Struct-of-arrays version of `SMAState`.
+
+    The windows are the rows of a ``(n_symbols, length)`` ring buffer
+    with one write position per symbol.
+    """
+    def _fields(self) -> dict[str, tuple[type, float, tuple[int, ...]]]:
+        return {
+            **super()._fields(),
+            "_buffer": (np.float64, np.nan, (self.length,)),
+            "_position": (np.int64, 0, ()),
+            "_nobs": (np.int64, 0, ()),
+            "_sum": (np.float64, 0.0, ()),
+            "_compensation_add": (np.float64, 0.0, ()),
+            "_compensation_remove": (np.float64, 0.0, ()),
+            "_neg_ct": (np.int64, 0, ()),
+            "_consecutive_same": (np.int64, 0, ()),
+            "_prev_value": (np.float64, np.nan, ()),
+        }
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+        """
+        Add a new value for every symbol and return the updated SMAs.
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            The next value of each symbol, NaN for the symbols
+            without a new value.
+
+        Returns:
+        --------
+        np.ndarray
+            The current SMA of each symbol, NaN while its window
+            holds fewer than `length` values.
+        """
+        values = self._validate(values)
+        valid = values == values
+        rows = np.arange(self.n_symbols)
+
+        removed = self._buffer[rows, self._position]
+        is_removed = valid & (self.count >= self.length)
+
+        self._nobs -= is_removed
+        y = -removed - self._compensation_remove
+        t = self._sum + y
+        self._compensation_remove = np.where(
+            is_removed, t - self._sum - y, self._compensation_remove
+        )
+        self._sum = np.where(is_removed, t, self._sum)
+        self._neg_ct -= is_removed & np.signbit(removed)
+
+        self._nobs += valid
+        y = values - self._compensation_add
+        t = self._sum + y
+        self._compensation_add = np.where(
+            valid, t - self._sum - y, self._compensation_add
+        )
+        self._sum = np.where(valid, t, self._sum)
+        self._neg_ct += valid & np.signbit(values)
+
+        is_same = (values == self._prev_value) | (self.count == 0)
+        self._consecutive_same = np.where(
+            valid,
+            np.where(is_same, self._consecutive_same + 1, 1),
+            self._consecutive_same,
+        )
+        self._prev_value = np.where(valid, values, self._prev_value)
+
+        self._buffer[rows[valid], self._position[valid]] = values[valid]
+        self._position = np.where(
+            valid, (self._position + 1) % self.length, self._position
+        )
+        self.count += valid
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = self._sum / self._nobs
+
+        is_sign_flip = (
+            ((self._neg_ct == 0) & (result < 0))
+            | ((self._neg_ct == self._nobs) & (result > 0))
+        )
+        mean = np.where(
+            self._consecutive_same >= self._nobs,
+            self._prev_value,
+            np.where(is_sign_flip, 0.0, result),
+        )
+        self.value = np.where(
+            valid,
+            np.where(self._nobs < self.length, np.nan, mean),
+            self.value,
+        )
+        return self.value.copy()
+
+
+class CrossSectionalRSI(_CrossSectionalState):
+    """
+    Streaming Relative Strength Index (RSI) of many symbols.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods of the moving averages.
+    ma_method : Literal["sma", "ema", "rma"]
+        The moving average used to smooth gains and losses.
+    n_symbols : int
+        The number of symbols.
+    value : np.ndarray
+        The current RSI of each symbol (NaN during its warm-up).
+    count : np.ndarray
+        The number of closes received by each symbol.
+    """
+    def __init__(
+        self,
+        n_symbols: int,
+        length: int = 14,
+        ma_method: Literal["sma", "ema", "rma"] = "rma",
+    ) -> None:
+        """
+        Initialize the RSI states.
+
+        Parameters:
+        -----------
+        n_symbols : int
+            The number of symbols.
+        length : int, optional
+            The number of periods of the moving averages.
+            (default: 14)
+        ma_method : Literal["sma", "ema", "rma"], optional
+            The moving average used to smooth gains and losses.
+            (default: "rma")
+        """
+        match ma_method:
+            case "sma":
+                state = _CrossSectionalSMA
+            case "ema":
+                state = CrossSectionalEMA
+            case "rma":
+                state = CrossSectionalRMA
+            case _:
+                raise InvalidArgumentError(
+                    "ma_method must be 'sma', 'ema', or 'rma',"
+                    f" got '{ma_method}'."
+                )
+
+        self.ma_method = ma_method
+        self._upward = state(0, length)
+        self._downward = state(0, length)
+        super().__init__(n_symbols, length)
+
+    def _fields(self) -> dict[str, tuple[type, float, tuple[int, ...]]]:
+        return {
+            **super()._fields(),
+            "_prev_close": (np.float64, np.nan, ()),
+        }
+
+    def add_symbols(self, count: int) -> None:
+        super().add_symbols(count)
+        self._upward.add_symbols(count)
+        self._downward.add_symbols(count)
+
+    def reset(self, symbols: np.ndarray | list[int]) -> None:
+        super().reset(symbols)
+        self._upward.reset(symbols)
+        self._downward.reset(symbols)
+
+    def update(self, closes: np.ndarray) -> np.ndarray:
+        """
+        Add a new close for every symbol and return the updated RSIs.
+
+        Parameters:
+        -----------
+        closes : np.ndarray
+            The close of each symbol, NaN for the symbols without a
+            new bar.
+
+        Returns:
+        --------
+        np.ndarray
+            The current RSI of each symbol, NaN during its warm-up
+            period.
+        """
+        closes = self._validate(closes)
+        valid = closes == closes
+        has_change = valid & (self.count > 0)
+
+        upward_ma = self._upward.update(np.where(
+            has_change, np.maximum(closes - self._prev_close, 0.0), np.nan
+        ))
+        downward_ma = self._downward.update(np.where(
+            has_change, np.maximum(self._prev_close - closes, 0.0), np.nan
+        ))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + upward_ma / downward_ma))
+
+        self.value = np.where(has_change, rsi, self.value)
+        self._prev_close = np.where(valid, closes, self._prev_close)
+        self.count += valid
+        return self.value.copy()
+
+
+class CrossSectionalEngine:
+    """
+    Streaming EMAs, RMAs and RSIs of many symbols.
+
+    All the states are advanced by the same array of closes, so the
+    whole cross-section is updated with one call per bar.
+
+    Attributes:
+    -----------
+    n_symbols : int
+        The number of symbols.
+    count : np.ndarray
+        The number of closes received by each symbol.
+    states : dict[str, CrossSectionalEMA | CrossSectionalRMA |
+                       CrossSectionalRSI]
+        The states, keyed like ``"ema_20"``, ``"rma_14"`` or
+        ``"RSI_14"``.
+    """
+    def __init__(
+        self,
+        n_symbols: int,
+        ema_lengths: list[int] | tuple[int, ...] = (),
+        rma_lengths: list[int] | tuple[int, ...] = (),
+        rsi_lengths: list[int] | tuple[int, ...] = (),
+        rsi_ma_method: Literal["sma", "ema", "rma"] = "rma",
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Parameters:
+        -----------
+        n_symbols : int
+            The number of symbols.
+        ema_lengths : list[int] or tuple[int, ...], optional
+            The lengths of the EMAs.
+            (default: ())
+        rma_lengths : list[int] or tuple[int, ...], optional
+            The lengths of the RMAs.
+            (default: ())
+        rsi_lengths : list[int] or tuple[int, ...], optional
+            The lengths of the RSIs.
+            (default: ())
+        rsi_ma_method : Literal["sma", "ema", "rma"], optional
+            The moving average used to smooth the RSI gains and
+            losses.
+            (default: "rma")
+        """
+        self.n_symbols = n_symbols
+        self.count = np.zeros(n_symbols, dtype=np.int64)
+        self.states = {
+            **{
+                f"ema_{length}": CrossSectionalEMA(n_symbols, length)
+                for length in ema_lengths
+            },
+            **{
+                f"rma_{length}": CrossSectionalRMA(n_symbols, length)
+                for length in rma_lengths
+            },
+            **{
+                f"RSI_{length}": CrossSectionalRSI(
+                    n_symbols, length, rsi_ma_method
+                )
+                for length in rsi_lengths
+            },
+        }
+
+    def add_symbols(self, count: int) -> None:
+        """
+        Append `count` symbols with empty states.
+
+        Parameters:
+        -----------
+        count : int
+            The number of symbols to add.
+        """
+        for state in self.states.values():
+            state.add_symbols(count)
+
+        self.count = np.concatenate(
+            [self.count, np.zeros(count, dtype=np.int64)]
+        )
+        self.n_symbols += count
+
+    def reset(self, symbols: np.ndarray | list[int]) -> None:
+        """
+        Restart the warm-up of `symbols` in every state.
+
+        Parameters:
+        -----------
+        symbols : np.ndarray or list[int]
+            The positions of the symbols to reset.
+        """
+        for state in self.states.values():
+            state.reset(symbols)
+
+        self.count[symbols] = 0
+
+    def update(self, closes: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Add a new close for every symbol and return every indicator.
+
+        Parameters:
+        -----------
+        closes : np.ndarray
+            The close of each symbol, NaN for the symbols without a
+            new bar.
+
+        Returns:
+        --------
+        dict[str, np.ndarray]
+            The current values of each state, keyed like `states`.
+        """
+        results = {
+            name: state.update(closes)
+            for name, state in self.states.items()
+        }
+        self.count += ~np.isnan(np.asarray(closes, dtype=np.float64))
+        return results
@@ -0,0 +1,175 @@
+"""
+Dynamic Time Warping Module
+
+This module provides the compiled Dynamic Time Warping engines used by
+`utils.DynamicTimeWarping`. Both engines run the exact DTW recursion
+inside a window of cells, with the absolute difference as the local
+distance, and return the warping path as an integer array.
+
+`fast_dtw` builds the window like FastDTW: the series are reduced by
+half until they are shorter than ``radius + 2``, aligned exactly, and
+the path of every resolution is projected onto the next one. Its
+distance is the one of `fastdtw.fastdtw`, in O(n) time and memory,
+and so is its path, unless the rounding of an addition makes two
+different costs equal, where the cheaper step is taken.
+
+`banded_dtw` restricts the cells to a Sakoe-Chiba band around the
+diagonal, which is exact whenever the optimal path stays in the band,
+and costs O(n * radius).
+
+Functions
+---------
+fast_dtw(x, y, radius)
+    Compiled FastDTW.
+banded_dtw(x, y, radius)
+    Exact DTW in a Sakoe-Chiba band.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .errors_exceptions import InvalidArgumentError
+from .kernels import dtw_window_kernel, expand_window_kernel
+
+
+def _prepare(
+    x: np.ndarray | pd.Series,
+    y: np.ndarray | pd.Series,
+    radius: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Validate `radius` and the values, and convert the series to
+    float64 arrays.
+    """
+    if radius < 0:
+        raise InvalidArgumentError(
+            f"radius must be greater than or equal to 0, got '{radius}'."
+        )
+
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        raise InvalidArgumentError(
+            "x and y must not contain NaN or infinite values."
+        )
+    return x, y
+
+
+def _empty_path(x: np.ndarray, y: np.ndarray) -> tuple[float, np.ndarray]:
+    """
+    The distance and path when a series is empty.
+    """
+    distance = 0.0 if len(x) == len(y) else np.inf
+    return distance, np.empty((0, 2), dtype=np.int64)
+
+
+def fast_dtw(
+    x: np.ndarray | pd.Series,
+    y: np.ndarray | pd.Series,
+    radius: int = 1,
+) -> tuple[float, np.ndarray]:
+    """
+    Calculate the FastDTW distance and warping path of two series.
+
+    Every resolution runs `kernels.dtw_window_kernel` inside the
+    window projected from the coarser one, so the distance is the one
+    of `fastdtw.fastdtw` with the default absolute distance.
+
+    Parameters:
+    -----------
+    x : np.ndarray or pd.Series
+        The first series.
+    y : np.ndarray or pd.Series
+        The second series.
+    radius : int, optional
+        The number of cells added around each projected path. Larger
+        values get closer to the exact DTW at a higher cost.
+        (default: 1)
+
+    Returns:
+    --------
+    tuple[float, np.ndarray]
+        The DTW distance and the ``(n_steps, 2)`` int64 warping path,
+        whose rows are the aligned indexes of `x` and `y`.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If `radius` is negative, or the series hold NaN or infinite
+        values.
+    """
+    x, y = _prepare(x, y, radius)
+
+    if not len(x) or not len(y):
+        return _empty_path(x, y)
+
+    levels = [(x, y)]
+    while min(len(x), len(y)) >= radius + 2:
+        x = (x[:len(x) // 2 * 2:2] + x[1:len(x) // 2 * 2:2]) / 2
+        y = (y[:len(y) // 2 * 2:2] + y[1:len(y) // 2 * 2:2]) / 2
+        levels.append((x, y))
+
+    lo = np.zeros(len(x), dtype=np.int64)
+    hi = np.full(len(x), len(y) - 1, dtype=np.int64)
+    distance, path = dtw_window_kernel(x, y, lo, hi)
+
+    for x, y in reversed(levels[:-1]):
+        lo, hi = expand_window_kernel(path, len(x), len(y), radius)
+        distance, path = dtw_window_kernel(x, y, lo, hi)
+
+    return distance, path
+
+
+def banded_dtw(
+    x: np.ndarray | pd.Series,
+    y: np.ndarray | pd.Series,
+    radius: int = 50,
+) -> tuple[float, np.ndarray]:
+    """
+    Calculate the exact DTW distance and warping path of two series
+    inside a Sakoe-Chiba band.
+
+    The band follows the diagonal from the first to the last pair of
+    values, so series of different lengths keep a band of the same
+    width, and it is widened where needed to keep the rows connected.
+
+    Parameters:
+    -----------
+    x : np.ndarray or pd.Series
+        The first series.
+    y : np.ndarray or pd.Series
+        The second series.
+    radius : int, optional
+        The number of columns of the band on each side of the
+        diagonal. The cost grows with ``len(x) * radius``.
+        (default: 50)
+
+    Returns:
+    --------
+    tuple[float, np.ndarray]
+        The DTW distance and the ``(n_steps, 2)`` int64 warping path,
+        whose rows are the aligned indexes of `x` and `y`.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If `radius` is negative, or the series hold NaN or infinite
+        values.
+    """
+    x, y = _prepare(x, y, radius)
+
+    if not len(x) or not len(y):
+        return _empty_path(x, y)
+
+    slope = (len(y) - 1) / (len(x) - 1) if len(x) > 1 else 0.0
+    diagonal = np.rint(np.arange(len(x)) * slope).astype(np.int64)
+
+    lo = np.clip(diagonal - radius, 0, len(y) - 1)
+    hi = np.clip(diagonal + radius, 0, len(y) - 1)
+    hi[-1] = len(y) - 1
+
+    # each row must reach the column before the start of the next one
+    hi[:-1] = np.maximum(hi[:-1], lo[1:] - 1)
+
+    return dtw_window_kernel(x, y, lo, hi)
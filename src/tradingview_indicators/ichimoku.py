@@ -1,12 +1,56 @@
+from typing import Literal
+
+import numpy as np
 import pandas as pd
+from .errors_exceptions import InvalidArgumentError
+from .rolling import rolling_extremes, RollingMax, RollingMin
 from .utils import OHLC_finder
 
+COMPONENTS = (
+    "conversion_line",
+    "base_line",
+    "lagging_span",
+    "lead_line1",
+    "lead_line2",
+    "leading_span_a",
+    "leading_span_b",
+)
+
+
+def _shift(values: np.ndarray, periods: int, out: np.ndarray) -> np.ndarray:
+    """
+    Write `values` shifted by `periods` into `out`, like
+    `pd.Series.shift`.
+    """
+    size = len(values)
+    periods = max(min(periods, size), -size)
+
+    if periods >= 0:
+        out[:periods] = np.nan
+        out[periods:] = values[:size - periods]
+    else:
+        out[size + periods:] = np.nan
+        out[:size + periods] = values[-periods:]
+    return out
+
+
 def Ichimoku(
     dataframe: pd.DataFrame,
     conversion_periods: int,
     base_periods: int,
     lagging_span_2_periods: int,
     displacement: int,
+    components: list[
+        Literal[
+            "conversion_line",
+            "base_line",
+            "lagging_span",
+            "lead_line1",
+            "lead_line2",
+            "leading_span_a",
+            "leading_span_b",
+        ]
+    ] | None = None,
 ) -> pd.DataFrame:
     """
     Calculate the components of the Ichimoku Cloud indicator.
@@ -15,6 +59,10 @@ def Ichimoku(
     which include the Conversion Line, Base Line, Leading Span A,
     Leading Span B, Lagging Span, and other intermediate lines.
 
+    Every component is written straight into its column of one
+    preallocated float64 block, which the returned DataFrame wraps
+    without copying.
+
     Parameters:
     -----------
     dataframe : pd.DataFrame
@@ -27,6 +75,11 @@ def Ichimoku(
         The number of periods to calculate Lagging Span 2.
     displacement : int
         The displacement of the indicator lines into the future.
+    components : list[str], optional
+        The components to return, in this order. The intermediate
+        lines that aren't requested are computed in scratch arrays,
+        and the lagging span is skipped when it isn't requested.
+        (default: None, every component)
 
     Returns:
     --------
@@ -36,67 +89,247 @@ def Ichimoku(
         'lagging_span', 'lead_line1', 'lead_line2',
         'leading_span_a', and 'leading_span_b'.
 
+    Raises:
+    -------
+    InvalidArgumentError
+        If `components` holds an unknown component.
     """
+    if components is None:
+        components = list(COMPONENTS)
+
+    for component in components:
+        if component not in COMPONENTS:
+            raise InvalidArgumentError(
+                f"components must be in {COMPONENTS}, got '{component}'."
+            )
+
     _, high, low, close = OHLC_finder(
         dataframe,
     )
 
-    def _donchian(length) -> pd.Series:
+    size = len(close)
+    block = np.empty((len(components), size)).T
+    columns = {
+        component: block[:, idx]
+        for idx, component in enumerate(components)
+    }
+
+    def _column(component: str) -> np.ndarray:
+        """
+        Return the block column of `component`, or a scratch array
+        when it wasn't requested.
         """
-        Calculate the Donchian line.
+        if component in columns:
+            return columns[component]
+        return np.empty(size)
+
+    if "lagging_span" in columns:
+        _shift(
+            close.to_numpy(dtype=np.float64),
+            -displacement + 1,
+            columns["lagging_span"],
+        )
 
-        This method calculates the Donchian line based on the given
-        'length' for rolling highest high and lowest low values.
+    if set(columns) - {"lagging_span"}:
+        highest_high, lowest_low = rolling_extremes(
+            high,
+            low,
+            [conversion_periods, base_periods, lagging_span_2_periods],
+        )
+
+        def _donchian(length: int, out: np.ndarray) -> np.ndarray:
+            """
+            Calculate the Donchian line.
+
+            This method writes the Donchian line based on the given
+            'length' into `out`, from the highest high and lowest low
+            values, which are computed for every length in a single
+            pass.
+
+            Parameters:
+            -----------
+            length : int
+                The number of periods for Donchian line calculation.
+            out : np.ndarray
+                The array that receives the Donchian line.
+
+            Returns:
+            --------
+            np.ndarray
+                The `out` array.
+            """
+            np.add(
+                highest_high[length].to_numpy(),
+                lowest_low[length].to_numpy(),
+                out=out,
+            )
+            return np.divide(out, 2, out=out)
+
+        conversion_line = _donchian(
+            conversion_periods, _column("conversion_line")
+        )
+        base_line = _donchian(base_periods, _column("base_line"))
+        lead_line2 = _donchian(
+            lagging_span_2_periods, _column("lead_line2")
+        )
+
+        lead_line1 = _column("lead_line1")
+        np.add(conversion_line, base_line, out=lead_line1)
+        np.divide(lead_line1, 2, out=lead_line1)
+
+        if "leading_span_a" in columns:
+            _shift(lead_line1, displacement - 1, columns["leading_span_a"])
+        if "leading_span_b" in columns:
+            _shift(lead_line2, displacement - 1, columns["leading_span_b"])
+
+    return pd.DataFrame(
+        block, index=close.index, columns=list(components), copy=False
+    )
+
+
+class IchimokuState:
+    """
+    Streaming Ichimoku Cloud.
+
+    The Donchian lines come from the monotonic deques of `RollingMax`
+    and `RollingMin`, so every bar costs O(1) amortized. The leading
+    spans computed on a bar are plotted `displacement - 1` bars ahead,
+    so they wait in two fixed-size ring buffers until their bar
+    arrives, and the close of a bar resolves the lagging span of the
+    bar `displacement - 1` bars back. Every value equals the matching
+    row of `Ichimoku` for the same bars.
+
+    Attributes:
+    -----------
+    conversion_periods : int
+        The number of periods of the Conversion Line.
+    base_periods : int
+        The number of periods of the Base Line.
+    lagging_span_2_periods : int
+        The number of periods of Lagging Span 2.
+    displacement : int
+        The displacement of the indicator lines into the future.
+    value : dict[str, float]
+        The components of the last bar, keyed like the columns of
+        `Ichimoku`. Its "lagging_span" is the value resolved by the
+        last close, which belongs to the bar `displacement - 1` bars
+        back (NaN until that bar exists).
+    count : int
+        The number of bars received so far.
+    """
+    def __init__(
+        self,
+        conversion_periods: int,
+        base_periods: int,
+        lagging_span_2_periods: int,
+        displacement: int,
+    ) -> None:
+        """
+        Initialize the Ichimoku state.
 
         Parameters:
         -----------
-        length : int
-            The number of periods for Donchian line calculation.
-
-        Returns:
-        --------
-        pd.Series
-            A Series representing the Donchian line.
+        conversion_periods : int
+            The number of periods to calculate the Conversion Line.
+        base_periods : int
+            The number of periods to calculate the Base Line.
+        lagging_span_2_periods : int
+            The number of periods to calculate Lagging Span 2.
+        displacement : int
+            The displacement of the indicator lines into the future.
         """
-        max_rolling = high.rolling(length).max()
-        min_rolling = low.rolling(length).min()
-        return (max_rolling + min_rolling) / 2
+        if displacement < 1:
+            raise InvalidArgumentError(
+                f"displacement must be greater than 0, got '{displacement}'."
+            )
 
-    conversion_line = (
-        _donchian(conversion_periods)
-        .rename("conversion_line")
-    )
+        self._extremes = [
+            (RollingMax(length), RollingMin(length))
+            for length in [
+                conversion_periods, base_periods, lagging_span_2_periods
+            ]
+        ]
 
-    base_line = (
-        _donchian(base_periods)
-        .rename("base_line")
-    )
+        self.conversion_periods = conversion_periods
+        self.base_periods = base_periods
+        self.lagging_span_2_periods = lagging_span_2_periods
+        self.displacement = displacement
+        self.value = dict.fromkeys(COMPONENTS, np.nan)
+        self.count = 0
 
-    lead_line1 = (conversion_line + base_line) / 2
+        self._lead_line1_buffer = np.full(displacement - 1, np.nan)
+        self._lead_line2_buffer = np.full(displacement - 1, np.nan)
+        self._position = 0
 
-    lead_line2 = (
-        _donchian(lagging_span_2_periods)
-        .rename("kumo_cloud_lower_line")
-    )
+    def update(self, high: float, low: float, close: float) -> dict[str, float]:
+        """
+        Add a new bar and return the updated components.
 
-    leading_span_a = lead_line1.shift(displacement - 1)
-    leading_span_b = lead_line2.shift(displacement - 1)
+        Parameters:
+        -----------
+        high : float
+            The high of the bar.
+        low : float
+            The low of the bar.
+        close : float
+            The close of the bar.
 
-    lagging_span = (
-        close
-        .shift(-displacement + 1)
-        .rename('lagging_span')
-    )
+        Returns:
+        --------
+        dict[str, float]
+            The components of the bar, keyed like the columns of
+            `Ichimoku`. "lagging_span" holds the close of this bar,
+            which is the lagging span of the bar `displacement - 1`
+            bars back, or NaN when that bar doesn't exist.
+        """
+        conversion_line, base_line, lead_line2 = [
+            (highest.update(high) + lowest.update(low)) / 2
+            for highest, lowest in self._extremes
+        ]
+        lead_line1 = (conversion_line + base_line) / 2
 
-    ichimoku_clouds = pd.DataFrame()
+        if self.displacement == 1:
+            leading_span_a = lead_line1
+            leading_span_b = lead_line2
+        else:
+            leading_span_a = self._lead_line1_buffer[self._position]
+            leading_span_b = self._lead_line2_buffer[self._position]
 
-    ichimoku_clouds["conversion_line"] = conversion_line
-    ichimoku_clouds["base_line"] = base_line
-    ichimoku_clouds["lagging_span"] = lagging_span
+            self._lead_line1_buffer[self._position] = lead_line1
+            self._lead_line2_buffer[self._position] = lead_line2
+            self._position = (self._position + 1) % (self.displacement - 1)
 
-    ichimoku_clouds["lead_line1"] = lead_line1
-    ichimoku_clouds["lead_line2"] = lead_line2
+        self.count += 1
+        lagging_span = (
+            float(close) if self.count >= self.displacement else np.nan
+        )
 
-    ichimoku_clouds["leading_span_a"] = leading_span_a
-    ichimoku_clouds["leading_span_b"] = leading_span_b
-    return ichimoku_clouds
+        self.value = dict(zip(COMPONENTS, [
+            conversion_line,
+            base_line,
+            lagging_span,
+            lead_line1,
+            lead_line2,
+            float(leading_span_a),
+            float(leading_span_b),
+        ]))
+        return self.value
+
+    def future_cloud(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the leading spans already projected onto the next
+        `displacement - 1` bars.
+
+        Returns:
+        --------
+        tuple[np.ndarray, np.ndarray]
+            The leading span A and leading span B of the next bars,
+            from the next bar to the furthest one.
+        """
+        order = np.roll(
+            np.arange(self.displacement - 1), -self._position
+        )
+        return (
+            self._lead_line1_buffer[order],
+            self._lead_line2_buffer[order],
+        )
@@ -0,0 +1,1628 @@
+"""
+Compiled Kernels Module
+
+This module contains the low level loops used by the indicators.
+The kernels are written in the subset of Python supported by numba
+and are compiled on first use. numba is a required dependency (it
+also ships with ``pandas[performance]``): the loops are far too slow
+to run interpreted.
+
+The outputs have the dtype of the source, so float32 inputs give
+float32 results, while the sums and recursions are always carried
+in float64.
+
+The compiled kernels are kept in memory only. Setting the
+``TRADINGVIEW_INDICATORS_NUMBA_CACHE`` environment variable to ``1``
+also stores them on disk, which saves the compilation in the next
+processes. The cache records the name the package was imported
+under, so the package must then always be imported under the same
+name.
+
+Functions
+---------
+njit(*args, **kwargs)
+    Compile a function with numba.
+sma_seed(source, length)
+    Mean of the first `length` values, matching pandas' rolling mean.
+rma_kernel(source, length)
+    TradingView RMA recursion seeded with an SMA.
+new_seeded_state(count)
+    Allocate the states used by `seeded_update`.
+seeded_update(state, value, length, alpha, is_ema)
+    Advance an SMA-seeded EMA or RMA by one value.
+ema_kernel(source, length)
+    TradingView EMA seeded with an SMA.
+sema_update(state, stage_values, value, length, alpha)
+    Advance the cascaded EMAs of a SEMA by one value.
+sema_kernel(source, length, smooth)
+    Cascaded EMAs and their SEMA combination in a single pass.
+sma_batch_kernel(source, length)
+    Rolling mean of every column of a 2-D array.
+seeded_batch_kernel(source, length, alpha, is_ema)
+    SMA-seeded EMA or RMA of every column of a 2-D array.
+sema_batch_kernel(source, length, smooth)
+    SEMA of every column of a 2-D array.
+sma_bank_kernel(source, lengths)
+    SMAs of several lengths from one shared cumulative sum.
+seeded_bank_kernel(source, lengths, is_ema)
+    SMA-seeded EMAs or RMAs of several lengths in one pass.
+rsi_gain(current, previous)
+    Positive part of the change between two values.
+divide(numerator, denominator)
+    Scalar division with the NumPy results for zero denominators.
+rsi_kernel(source, length, ma_method)
+    RSI with the gains, losses and their averages in a single pass.
+rolling_extremes_kernel(high, low, lengths)
+    Rolling maxima and minima of several lengths in a single pass.
+window_mean_mad(window)
+    Mean and mean absolute deviation of one window.
+mean_mad_kernel(source, length)
+    Rolling means and mean absolute deviations without window copies.
+rolling_moments_kernel(source, lengths, ddof)
+    Rolling means and standard deviations of several lengths at once.
+bands_kernel(bases, deviations, mults, output)
+    Bollinger Bands of every length and multiplier, row by row.
+expand_window_kernel(path, len_x, len_y, radius)
+    Project a FastDTW path onto the series of twice its resolution.
+dtw_window_kernel(x, y, lo, hi)
+    Exact DTW restricted to a window of cells, with its path.
+"""
+
+import os
+
+import numpy as np
+
+from numba import njit as _numba_njit
+
+# opt-in on-disk cache of the compiled kernels
+CACHE_VARIABLE = "TRADINGVIEW_INDICATORS_NUMBA_CACHE"
+NUMBA_CACHE = os.environ.get(CACHE_VARIABLE) == "1"
+
+# number of bars between two re-centerings of the rolling moments
+MOMENTS_EPOCH = 4096
+
+
+def njit(*args, **kwargs):
+    """
+    Compile a function with `numba.njit`.
+
+    The decorator can be used with or without arguments. The on-disk
+    cache of numba is only enabled by `CACHE_VARIABLE`.
+
+    Returns
+    -------
+    Callable
+        The compiled function, or the decorator when called with
+        arguments only.
+    """
+    return _numba_njit(*args, cache=NUMBA_CACHE, **kwargs)
+
+
+@njit
+def sma_seed(source: np.ndarray, length: int) -> float:
+    """
+    Calculate the mean of the first `length` values of `source`.
+
+    The sum follows the compensated (Kahan) summation used by
+    `pandas.Series.rolling(length).mean()`, so the seed is
+    bit-identical to the first valid value of the pandas SMA.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data.
+    length : int
+        The number of values to average.
+
+    Returns
+    -------
+    float
+        The SMA seed, or NaN if the first window contains NaN values.
+    """
+    sum_x = 0.0
+    compensation = 0.0
+    neg_ct = 0
+    consecutive_same = 0
+    prev_value = source[0]
+
+    for idx in range(length):
+        value = source[idx]
+        if value != value:
+            return np.nan
+
+        y = value - compensation
+        t = sum_x + y
+        compensation = t - sum_x - y
+        sum_x = t
+
+        if np.signbit(value):
+            neg_ct += 1
+
+        if value == prev_value:
+            consecutive_same += 1
+        else:
+            consecutive_same = 1
+        prev_value = value
+
+    result = sum_x / length
+
+    if consecutive_same >= length:
+        return prev_value
+    # pandas clips sign flips caused by rounding on one-signed windows
+    is_sign_flip = (
+        (neg_ct == 0 and result < 0)
+        or (neg_ct == length and result > 0)
+    )
+    return 0.0 if is_sign_flip else result
+
+
+@njit
+def rma_kernel(source: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the TradingView Relative Moving Average (RMA).
+
+    The first output value is the SMA of the first `length` values
+    and every following value applies the recursion
+    ``alpha * value + (1 - alpha) * previous`` with
+    ``alpha = 1 / length``.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 or float32 array.
+    length : int
+        The number of periods to include in the RMA calculation.
+
+    Returns
+    -------
+    np.ndarray
+        The RMA values, starting at position ``length - 1`` of
+        `source`.
+    """
+    size = source.shape[0]
+    if size < length:
+        return np.empty(0, dtype=source.dtype)
+
+    alpha = 1 / length
+    output = np.empty(size - length + 1, dtype=source.dtype)
+    rma_value = sma_seed(source, length)
+    output[0] = rma_value
+
+    for idx in range(length, size):
+        rma_value = alpha * source[idx] + (1 - alpha) * rma_value
+        output[idx - length + 1] = rma_value
+
+    return output
+
+
+# Fields of the state arrays used by `seeded_update`.
+SUM = 0
+COMPENSATION = 1
+NEG_CT = 2
+CONSECUTIVE_SAME = 3
+PREV_VALUE = 4
+COUNT = 5
+VALUE = 6
+OLD_WEIGHT = 7
+STATE_SIZE = 8
+
+# Moving average codes of `rsi_kernel`.
+MA_SMA = 0
+MA_EMA = 1
+MA_DEMA = 2
+MA_TEMA = 3
+MA_RMA = 4
+
+
+@njit
+def new_seeded_state(count: int) -> np.ndarray:
+    """
+    Allocate `count` empty states for `seeded_update`.
+
+    Parameters
+    ----------
+    count : int
+        The number of independent moving averages.
+
+    Returns
+    -------
+    np.ndarray
+        A ``(count, STATE_SIZE)`` float64 array.
+    """
+    state = np.zeros((count, STATE_SIZE))
+    state[:, PREV_VALUE] = np.nan
+    state[:, VALUE] = np.nan
+    state[:, OLD_WEIGHT] = 1.0
+    return state
+
+
+@njit(inline="always")
+def seeded_update(
+    state: np.ndarray,
+    value: float,
+    length: int,
+    alpha: float,
+    is_ema: bool,
+) -> float:
+    """
+    Advance an SMA-seeded moving average by one value.
+
+    The first `length` values are summed like `sma_seed`. After the
+    seed, EMA states follow the recursion of
+    `pandas.Series.ewm(adjust=False)` and RMA states follow the
+    TradingView RMA recursion.
+
+    Parameters
+    ----------
+    state : np.ndarray
+        One row of `new_seeded_state`, updated in place.
+    value : float
+        The next value of the time series.
+    length : int
+        The number of periods of the moving average.
+    alpha : float
+        The smoothing factor of the recursion.
+    is_ema : bool
+        Whether to apply the EMA recursion instead of the RMA one.
+
+    Returns
+    -------
+    float
+        The current moving average value, NaN during warm-up.
+    """
+    state[COUNT] += 1
+    count = state[COUNT]
+
+    if count > length:
+        weighted = state[VALUE]
+
+        if not is_ema:
+            state[VALUE] = alpha * value + (1 - alpha) * weighted
+            return state[VALUE]
+
+        if weighted != weighted:
+            state[VALUE] = value
+            return value
+
+        state[OLD_WEIGHT] *= 1 - alpha
+
+        if value != value:
+            return weighted
+
+        old_weight = state[OLD_WEIGHT]
+        state[OLD_WEIGHT] = 1.0
+
+        if weighted != value:
+            state[VALUE] = (
+                (old_weight * weighted + alpha * value)
+                / (old_weight + alpha)
+            )
+        return state[VALUE]
+
+    if value != value:
+        state[SUM] = np.nan
+    else:
+        y = value - state[COMPENSATION]
+        t = state[SUM] + y
+        state[COMPENSATION] = t - state[SUM] - y
+        state[SUM] = t
+
+        if np.signbit(value):
+            state[NEG_CT] += 1
+
+        if value == state[PREV_VALUE] or count == 1:
+            state[CONSECUTIVE_SAME] += 1
+        else:
+            state[CONSECUTIVE_SAME] = 1
+        state[PREV_VALUE] = value
+
+    if count == length:
+        result = state[SUM] / length
+
+        if state[CONSECUTIVE_SAME] >= length:
+            state[VALUE] = state[PREV_VALUE]
+        else:
+            is_sign_flip = (
+                (state[NEG_CT] == 0 and result < 0)
+                or (state[NEG_CT] == length and result > 0)
+            )
+            state[VALUE] = 0.0 if is_sign_flip else result
+
+    return state[VALUE]
+
+
+@njit
+def ema_kernel(source: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the TradingView Exponential Moving Average (EMA).
+
+    The EMA is seeded with the SMA of the first `length` values and
+    then follows the ``span=length`` recursion of
+    `pandas.Series.ewm(adjust=False)`. The values are written into a
+    single preallocated output array.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 or float32 array.
+    length : int
+        The number of periods to include in the EMA calculation.
+
+    Returns
+    -------
+    np.ndarray
+        The EMA values aligned with `source`, NaN during warm-up.
+    """
+    alpha = 1 / (1 + (length - 1) / 2)
+    state = new_seeded_state(1)[0]
+    output = np.empty(source.shape[0], dtype=source.dtype)
+
+    for idx in range(source.shape[0]):
+        output[idx] = seeded_update(state, source[idx], length, alpha, True)
+
+    return output
+
+
+@njit(inline="always")
+def sema_update(
+    state: np.ndarray,
+    stage_values: np.ndarray,
+    value: float,
+    length: int,
+    alpha: float,
+) -> float:
+    """
+    Advance the cascaded EMAs of a SEMA by one value.
+
+    Parameters
+    ----------
+    state : np.ndarray
+        One `new_seeded_state` row per cascaded EMA, updated in place.
+    stage_values : np.ndarray
+        Scratch array with one slot per cascaded EMA.
+    value : float
+        The next value of the time series.
+    length : int
+        The number of periods of each EMA.
+    alpha : float
+        The smoothing factor of the EMAs.
+
+    Returns
+    -------
+    float
+        The current SEMA value, NaN until the last EMA is available.
+    """
+    smooth = state.shape[0]
+
+    for stage in range(smooth):
+        value = seeded_update(state[stage], value, length, alpha, True)
+        stage_values[stage] = value
+
+        # later stages only receive the valid values of the previous
+        # one, like chained `ema` calls after `dropna`
+        if value != value:
+            return np.nan
+
+    total = 0.0
+    for stage in range(1, smooth - 1):
+        total += stage_values[stage] - stage_values[stage - 1]
+
+    return total * -1 * smooth + stage_values[smooth - 1]
+
+
+@njit
+def sema_kernel(source: np.ndarray, length: int, smooth: int) -> np.ndarray:
+    """
+    Calculate the Smoothed Exponential Moving Average (SEMA) in a
+    single pass.
+
+    All `smooth` cascaded EMAs advance together bar by bar, each one
+    seeded with the SMA of the values it receives, and the SEMA
+    combination is written straight into the output. Only the output
+    array is allocated, so memory stays O(n) whatever `smooth` is.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 or float32 array.
+    length : int
+        The number of periods of each EMA.
+    smooth : int
+        The number of cascaded EMAs.
+
+    Returns
+    -------
+    np.ndarray
+        The SEMA values aligned with `source`, NaN where the last
+        EMA isn't available yet.
+    """
+    alpha = 1 / (1 + (length - 1) / 2)
+    state = new_seeded_state(smooth)
+    stage_values = np.empty(smooth)
+    output = np.empty(source.shape[0], dtype=source.dtype)
+
+    for idx in range(source.shape[0]):
+        output[idx] = sema_update(
+            state, stage_values, source[idx], length, alpha
+        )
+
+    return output
+
+
+@njit
+def sma_batch_kernel(source: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the rolling mean of every column of a 2-D array.
+
+    Each column follows the compensated add/remove summation of
+    `pandas.Series.rolling(length).mean()`, and the rows are
+    scanned in memory order so all columns advance together.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        A C-contiguous ``(n_bars, n_columns)`` float64 or
+        float32 array.
+    length : int
+        The number of periods to include in the SMA calculation.
+
+    Returns
+    -------
+    np.ndarray
+        The SMA values with the shape of `source`, NaN where the
+        window holds fewer than `length` valid values.
+    """
+    n_bars, n_columns = source.shape
+    output = np.empty((n_bars, n_columns), dtype=source.dtype)
+
+    nobs = np.zeros(n_columns, dtype=np.int64)
+    neg_ct = np.zeros(n_columns, dtype=np.int64)
+    consecutive_same = np.zeros(n_columns, dtype=np.int64)
+    sum_x = np.zeros(n_columns)
+    compensation_add = np.zeros(n_columns)
+    compensation_remove = np.zeros(n_columns)
+    prev_value = (
+        source[0].copy()
+        if n_bars
+        else np.empty(n_columns, dtype=source.dtype)
+    )
+
+    for idx in range(n_bars):
+        for col in range(n_columns):
+            if idx >= length:
+                value = source[idx - length, col]
+                if value == value:
+                    nobs[col] -= 1
+                    y = -value - compensation_remove[col]
+                    t = sum_x[col] + y
+                    compensation_remove[col] = t - sum_x[col] - y
+                    sum_x[col] = t
+                    if np.signbit(value):
+                        neg_ct[col] -= 1
+
+            value = source[idx, col]
+            if value == value:
+                nobs[col] += 1
+                y = value - compensation_add[col]
+                t = sum_x[col] + y
+                compensation_add[col] = t - sum_x[col] - y
+                sum_x[col] = t
+                if np.signbit(value):
+                    neg_ct[col] += 1
+                if value == prev_value[col]:
+                    consecutive_same[col] += 1
+                else:
+                    consecutive_same[col] = 1
+                prev_value[col] = value
+
+            if nobs[col] < length:
+                output[idx, col] = np.nan
+            elif consecutive_same[col] >= nobs[col]:
+                output[idx, col] = prev_value[col]
+            else:
+                result = sum_x[col] / nobs[col]
+                is_sign_flip = (
+                    (neg_ct[col] == 0 and result < 0)
+                    or (neg_ct[col] == nobs[col] and result > 0)
+                )
+                output[idx, col] = 0.0 if is_sign_flip else result
+
+    return output
+
+
+@njit
+def seeded_batch_kernel(
+    source: np.ndarray,
+    length: int,
+    alpha: float,
+    is_ema: bool,
+) -> np.ndarray:
+    """
+    Calculate an SMA-seeded EMA or RMA for every column of a 2-D
+    array.
+
+    Leading NaN values of each column are skipped, so every column is
+    seeded with the SMA of its first `length` values, exactly like the
+    1-D calculation over the column's own history.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        A C-contiguous ``(n_bars, n_columns)`` float64 or
+        float32 array.
+    length : int
+        The number of periods of the moving average.
+    alpha : float
+        The smoothing factor of the recursion.
+    is_ema : bool
+        Whether to apply the EMA recursion instead of the RMA one.
+
+    Returns
+    -------
+    np.ndarray
+        The moving average values with the shape of `source`.
+    """
+    n_bars, n_columns = source.shape
+    state = new_seeded_state(n_columns)
+    output = np.full((n_bars, n_columns), np.nan, dtype=source.dtype)
+
+    for idx in range(n_bars):
+        for col in range(n_columns):
+            value = source[idx, col]
+            if state[col, COUNT] == 0 and value != value:
+                continue
+
+            output[idx, col] = seeded_update(
+                state[col], value, length, alpha, is_ema
+            )
+
+    return output
+
+
+@njit
+def sema_batch_kernel(
+    source: np.ndarray,
+    length: int,
+    smooth: int,
+) -> np.ndarray:
+    """
+    Calculate the SEMA of every column of a 2-D array in one pass.
+
+    Leading NaN values of each column are skipped, like in
+    `seeded_batch_kernel`.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        A C-contiguous ``(n_bars, n_columns)`` float64 or
+        float32 array.
+    length : int
+        The number of periods of each EMA.
+    smooth : int
+        The number of cascaded EMAs.
+
+    Returns
+    -------
+    np.ndarray
+        The SEMA values with the shape of `source`.
+    """
+    n_bars, n_columns = source.shape
+    alpha = 1 / (1 + (length - 1) / 2)
+    state = new_seeded_state(n_columns * smooth)
+    stage_values = np.empty(smooth)
+    output = np.full((n_bars, n_columns), np.nan, dtype=source.dtype)
+
+    for idx in range(n_bars):
+        for col in range(n_columns):
+            value = source[idx, col]
+            first_stage = col * smooth
+            if state[first_stage, COUNT] == 0 and value != value:
+                continue
+
+            output[idx, col] = sema_update(
+                state[first_stage:first_stage + smooth],
+                stage_values,
+                value,
+                length,
+                alpha,
+            )
+
+    return output
+
+
+@njit
+def sma_bank_kernel(source: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Calculate the SMA of `source` for several lengths at once.
+
+    A single Kahan-compensated cumulative sum (and a cumulative count
+    of valid values) is built while scanning `source`, and every SMA
+    is read from it as a difference of two prefix sums.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 or float32 array.
+    lengths : np.ndarray
+        The SMA lengths as an int64 array.
+
+    Returns
+    -------
+    np.ndarray
+        A ``(n_bars, n_lengths)`` array, NaN where the window holds
+        fewer than the required number of valid values.
+    """
+    n_bars = source.shape[0]
+    n_lengths = lengths.shape[0]
+    output = np.empty((n_bars, n_lengths), dtype=source.dtype)
+
+    cum_sum = np.zeros(n_bars + 1)
+    cum_compensation = np.zeros(n_bars + 1)
+    cum_count = np.zeros(n_bars + 1, dtype=np.int64)
+
+    for idx in range(n_bars):
+        value = source[idx]
+        sum_x = cum_sum[idx]
+        compensation = cum_compensation[idx]
+        count = cum_count[idx]
+
+        if value == value:
+            y = value - compensation
+            t = sum_x + y
+            compensation = t - sum_x - y
+            sum_x = t
+            count += 1
+
+        cum_sum[idx + 1] = sum_x
+        cum_compensation[idx + 1] = compensation
+        cum_count[idx + 1] = count
+
+        for col in range(n_lengths):
+            length = lengths[col]
+            start = idx + 1 - length
+
+            if start < 0 or count - cum_count[start] < length:
+                output[idx, col] = np.nan
+            else:
+                total = (
+                    (sum_x - cum_sum[start])
+                    - (compensation - cum_compensation[start])
+                )
+                output[idx, col] = total / length
+
+    return output
+
+
+@njit
+def seeded_bank_kernel(
+    source: np.ndarray,
+    lengths: np.ndarray,
+    is_ema: bool,
+) -> np.ndarray:
+    """
+    Calculate SMA-seeded EMAs or RMAs of `source` for several lengths
+    in a single pass.
+
+    Every length keeps its own `seeded_update` state and all of them
+    advance on each value read, so the input is scanned only once.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 or float32 array.
+    lengths : np.ndarray
+        The moving average lengths as an int64 array.
+    is_ema : bool
+        Whether to calculate EMAs instead of RMAs.
+
+    Returns
+    -------
+    np.ndarray
+        A ``(n_bars, n_lengths)`` array, NaN during the warm-up of each
+        length.
+    """
+    n_bars = source.shape[0]
+    n_lengths = lengths.shape[0]
+    output = np.empty((n_bars, n_lengths), dtype=source.dtype)
+    state = new_seeded_state(n_lengths)
+    alphas = np.empty(n_lengths)
+
+    for col in range(n_lengths):
+        if is_ema:
+            alphas[col] = 1 / (1 + (lengths[col] - 1) / 2)
+        else:
+            alphas[col] = 1 / lengths[col]
+
+    for idx in range(n_bars):
+        value = source[idx]
+        for col in range(n_lengths):
+            if idx < lengths[col]:
+                output[idx, col] = seeded_update(
+                    state[col], value, lengths[col], alphas[col], is_ema
+                )
+                continue
+
+            # the steady-state recursions of `seeded_update`, inlined
+            # to keep the inner loop free of per-length array views
+            alpha = alphas[col]
+            weighted = state[col, VALUE]
+
+            if not is_ema:
+                weighted = alpha * value + (1 - alpha) * weighted
+            elif weighted != weighted:
+                weighted = value
+            else:
+                state[col, OLD_WEIGHT] *= 1 - alpha
+                if value == value:
+                    old_weight = state[col, OLD_WEIGHT]
+                    state[col, OLD_WEIGHT] = 1.0
+                    if weighted != value:
+                        weighted = (
+                            (old_weight * weighted + alpha * value)
+                            / (old_weight + alpha)
+                        )
+
+            state[col, VALUE] = weighted
+            output[idx, col] = weighted
+
+    return output
+
+
+@njit(inline="always")
+def _kahan_add(
+    total: float,
+    compensation: float,
+    value: float,
+) -> tuple[float, float]:
+    """
+    Add `value` to a compensated sum.
+
+    Returns
+    -------
+    tuple[float, float]
+        The new sum and compensation.
+    """
+    y = value - compensation
+    t = total + y
+    return t, t - total - y
+
+
+@njit(inline="always")
+def _rolling_mean(
+    total: float,
+    nobs: int,
+    neg_ct: int,
+    consecutive_same: int,
+    prev_value: float,
+    length: int,
+) -> float:
+    """
+    Finish a rolling mean the way `pandas.Series.rolling().mean()`
+    does.
+    """
+    if nobs < length:
+        return np.nan
+    if consecutive_same >= nobs:
+        return prev_value
+
+    result = total / nobs
+    is_sign_flip = (
+        (neg_ct == 0 and result < 0)
+        or (neg_ct == nobs and result > 0)
+    )
+    return 0.0 if is_sign_flip else result
+
+
+@njit
+def rsi_gain(current: float, previous: float) -> float:
+    """
+    Return ``np.maximum(current - previous, 0.0)``.
+    """
+    change = current - previous
+    return change if change >= 0.0 or change != change else 0.0
+
+
+@njit
+def divide(numerator: float, denominator: float) -> float:
+    """
+    Divide with the IEEE results of NumPy for zero denominators.
+    """
+    if denominator != 0.0:
+        return numerator / denominator
+    if numerator == 0.0 or numerator != numerator:
+        return np.nan
+    if (numerator > 0.0) != np.signbit(denominator):
+        return np.inf
+    return -np.inf
+
+
+@njit
+def _rsi_sma(source: np.ndarray, length: int, output: np.ndarray) -> None:
+    """
+    Write the SMA-smoothed RSI of `source` into `output`.
+
+    Both rolling means follow the compensated add/remove sums of
+    `sma_batch_kernel`, kept in local variables so they stay in
+    registers. The gain and loss leaving the window are recomputed
+    from `source` instead of being buffered.
+    """
+    nobs = 0
+    upward_sum = upward_add = upward_remove = 0.0
+    downward_sum = downward_add = downward_remove = 0.0
+    upward_neg_ct = downward_neg_ct = 0
+    upward_same = downward_same = 0
+    upward_prev = downward_prev = np.nan
+
+    for idx in range(1, source.shape[0]):
+        if idx > length:
+            old = idx - length
+            upward = rsi_gain(source[old], source[old - 1])
+            downward = rsi_gain(source[old - 1], source[old])
+
+            if upward == upward:
+                nobs -= 1
+                upward_sum, upward_remove = _kahan_add(
+                    upward_sum, upward_remove, -upward
+                )
+                downward_sum, downward_remove = _kahan_add(
+                    downward_sum, downward_remove, -downward
+                )
+                if np.signbit(upward):
+                    upward_neg_ct -= 1
+                if np.signbit(downward):
+                    downward_neg_ct -= 1
+
+        upward = rsi_gain(source[idx], source[idx - 1])
+        downward = rsi_gain(source[idx - 1], source[idx])
+
+        if upward == upward:
+            nobs += 1
+            upward_sum, upward_add = _kahan_add(
+                upward_sum, upward_add, upward
+            )
+            downward_sum, downward_add = _kahan_add(
+                downward_sum, downward_add, downward
+            )
+            if np.signbit(upward):
+                upward_neg_ct += 1
+            if np.signbit(downward):
+                downward_neg_ct += 1
+
+            upward_same = upward_same + 1 if upward == upward_prev else 1
+            downward_same = (
+                downward_same + 1 if downward == downward_prev else 1
+            )
+            upward_prev = upward
+            downward_prev = downward
+
+        upward_ma = _rolling_mean(
+            upward_sum, nobs, upward_neg_ct, upward_same, upward_prev, length
+        )
+        downward_ma = _rolling_mean(
+            downward_sum,
+            nobs,
+            downward_neg_ct,
+            downward_same,
+            downward_prev,
+            length,
+        )
+        relative_strength = divide(upward_ma, downward_ma)
+        output[idx] = 100 - divide(100.0, 1 + relative_strength)
+
+
+@njit
+def _rsi_seeded(
+    source: np.ndarray,
+    length: int,
+    alpha: float,
+    is_ema: bool,
+    output: np.ndarray,
+) -> None:
+    """
+    Write the EMA or RMA-smoothed RSI of `source` into `output`.
+    """
+    upward_state = new_seeded_state(1)[0]
+    downward_state = new_seeded_state(1)[0]
+
+    for idx in range(1, source.shape[0]):
+        upward_ma = seeded_update(
+            upward_state,
+            rsi_gain(source[idx], source[idx - 1]),
+            length,
+            alpha,
+            is_ema,
+        )
+        downward_ma = seeded_update(
+            downward_state,
+            rsi_gain(source[idx - 1], source[idx]),
+            length,
+            alpha,
+            is_ema,
+        )
+        relative_strength = divide(upward_ma, downward_ma)
+        output[idx] = 100 - divide(100.0, 1 + relative_strength)
+
+
+@njit
+def _rsi_sema(
+    source: np.ndarray,
+    length: int,
+    smooth: int,
+    output: np.ndarray,
+) -> None:
+    """
+    Write the SEMA-smoothed RSI of `source` into `output`.
+    """
+    alpha = 1 / (1 + (length - 1) / 2)
+    upward_state = new_seeded_state(smooth)
+    downward_state = new_seeded_state(smooth)
+    stage_values = np.empty(smooth)
+
+    for idx in range(1, source.shape[0]):
+        upward_ma = sema_update(
+            upward_state,
+            stage_values,
+            rsi_gain(source[idx], source[idx - 1]),
+            length,
+            alpha,
+        )
+        downward_ma = sema_update(
+            downward_state,
+            stage_values,
+            rsi_gain(source[idx - 1], source[idx]),
+            length,
+            alpha,
+        )
+        relative_strength = divide(upward_ma, downward_ma)
+        output[idx] = 100 - divide(100.0, 1 + relative_strength)
+
+
+@njit
+def rsi_kernel(source: np.ndarray, length: int, ma_method: int) -> np.ndarray:
+    """
+    Calculate the Relative Strength Index (RSI) in a single pass.
+
+    Each bar computes its gain and loss, advances the moving averages
+    of both and writes the RSI, so no diff or moving average series
+    is allocated. The gains and losses match
+    ``np.maximum(source.diff(), 0.0)`` and the averages match the
+    `sma`, `ema`, `sema` and `rma` functions.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 or float32 array.
+    length : int
+        The number of periods of the moving averages.
+    ma_method : int
+        One of `MA_SMA`, `MA_EMA`, `MA_DEMA`, `MA_TEMA` or `MA_RMA`.
+
+    Returns
+    -------
+    np.ndarray
+        The RSI values aligned with `source`, NaN during warm-up.
+    """
+    output = np.full(source.shape[0], np.nan, dtype=source.dtype)
+
+    if ma_method == MA_SMA:
+        _rsi_sma(source, length, output)
+    elif ma_method == MA_EMA:
+        _rsi_seeded(source, length, 1 / (1 + (length - 1) / 2), True, output)
+    elif ma_method == MA_RMA:
+        _rsi_seeded(source, length, 1 / length, False, output)
+    else:
+        _rsi_sema(source, length, 2 if ma_method == MA_DEMA else 3, output)
+
+    return output
+
+
+@njit(inline="always")
+def _extremes_update(
+    value: float,
+    bar: int,
+    lengths: np.ndarray,
+    longest: int,
+    bars: np.ndarray,
+    values: np.ndarray,
+    pointers: np.ndarray,
+    head: int,
+    tail: int,
+    last_missing: int,
+    output: np.ndarray,
+    sign: float,
+) -> tuple[int, int]:
+    """
+    Add the finite `value` to a multi-window monotonic deque and write
+    the rolling maximum of every length for `bar`.
+
+    The deque is a ring buffer (`bars`, `values`) whose power of two
+    size covers the longest window, with non-increasing values from
+    `head` to `tail`. Every length has a read pointer to its first
+    entry still inside the window, which only moves forward. The
+    values are multiplied by `sign`, so -1.0 gives rolling minima.
+    Windows holding `last_missing` are NaN.
+
+    Returns the new `head` and `tail`.
+    """
+    mask = bars.shape[0] - 1
+    value = sign * value
+
+    # ties drop the older value, as pandas does
+    while tail > head and values[(tail - 1) & mask] <= value:
+        tail -= 1
+    while tail > head and bars[head & mask] <= bar - longest:
+        head += 1
+
+    bars[tail & mask] = bar
+    values[tail & mask] = value
+    tail += 1
+
+    for col in range(lengths.shape[0]):
+        length = lengths[col]
+        pointer = min(max(pointers[col], head), tail - 1)
+        while bars[pointer & mask] <= bar - length:
+            pointer += 1
+        pointers[col] = pointer
+
+        if bar < length - 1 or last_missing > bar - length:
+            output[bar, col] = np.nan
+        else:
+            output[bar, col] = sign * values[pointer & mask]
+
+    return head, tail
+
+
+@njit
+def rolling_extremes_kernel(
+    high: np.ndarray,
+    low: np.ndarray,
+    lengths: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling maximum of `high` and the rolling minimum of
+    `low` for several lengths in a single pass.
+
+    Each series keeps one monotonic deque covering the longest window
+    and every length reads its extreme through its own pointer into
+    it, so a bar costs O(1) amortized per length and both series are
+    read once. The results match ``rolling(length).max()`` and
+    ``rolling(length).min()`` of pandas, where NaN and infinite values
+    are missing and blank every window holding them.
+
+    Parameters
+    ----------
+    high : np.ndarray
+        The series of the maxima as a float64 or float32 array.
+    low : np.ndarray
+        The series of the minima, with the same length as `high`.
+    lengths : np.ndarray
+        The window lengths as an int64 array of positive values.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Two ``(n_bars, n_lengths)`` arrays with the rolling maxima and
+        minima, NaN where the window holds fewer than `length` values
+        or any missing value.
+    """
+    n_bars = high.shape[0]
+    n_lengths = lengths.shape[0]
+    longest = lengths.max()
+
+    capacity = 1
+    while capacity < longest:
+        capacity *= 2
+
+    highest = np.empty((n_bars, n_lengths), dtype=high.dtype)
+    lowest = np.empty((n_bars, n_lengths), dtype=low.dtype)
+
+    high_bars = np.empty(capacity, dtype=np.int64)
+    high_values = np.empty(capacity)
+    high_pointers = np.zeros(n_lengths, dtype=np.int64)
+    high_head = high_tail = 0
+    high_missing = -longest
+
+    low_bars = np.empty(capacity, dtype=np.int64)
+    low_values = np.empty(capacity)
+    low_pointers = np.zeros(n_lengths, dtype=np.int64)
+    low_head = low_tail = 0
+    low_missing = -longest
+
+    for bar in range(n_bars):
+        if np.isfinite(high[bar]):
+            high_head, high_tail = _extremes_update(
+                high[bar], bar, lengths, longest, high_bars, high_values,
+                high_pointers, high_head, high_tail, high_missing,
+                highest, 1.0,
+            )
+        else:
+            high_missing = bar
+            highest[bar] = np.nan
+
+        if np.isfinite(low[bar]):
+            low_head, low_tail = _extremes_update(
+                low[bar], bar, lengths, longest, low_bars, low_values,
+                low_pointers, low_head, low_tail, low_missing,
+                lowest, -1.0,
+            )
+        else:
+            low_missing = bar
+            lowest[bar] = np.nan
+
+    return highest, lowest
+
+
+@njit(inline="always")
+def window_mean_mad(window: np.ndarray) -> tuple[float, float]:
+    """
+    Calculate the mean of `window` and its mean absolute deviation
+    around that mean.
+
+    The window is read twice in order, summing in float64, so every
+    caller with the same values gets bit-identical results.
+
+    Parameters
+    ----------
+    window : np.ndarray
+        The values of the window, oldest first.
+
+    Returns
+    -------
+    tuple[float, float]
+        The mean and the mean absolute deviation.
+    """
+    length = window.shape[0]
+
+    total = 0.0
+    for idx in range(length):
+        total += window[idx]
+    mean = total / length
+
+    deviation = 0.0
+    for idx in range(length):
+        deviation += abs(window[idx] - mean)
+
+    return mean, deviation / length
+
+
+@njit
+def mean_mad_kernel(
+    source: np.ndarray,
+    length: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling mean of `source` and the mean absolute
+    deviation around it.
+
+    Every window is read in place by `window_mean_mad`, so the memory
+    is the outputs alone instead of a ``(n_windows, length)``
+    temporary.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 or float32 array.
+    length : int
+        The number of periods of each window.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The mean and the mean absolute deviation of each complete
+        window, i.e. ``n_bars - length + 1`` values each.
+    """
+    n_windows = max(source.shape[0] - length + 1, 0)
+    means = np.empty(n_windows, dtype=source.dtype)
+    deviations = np.empty(n_windows, dtype=source.dtype)
+
+    for start in range(n_windows):
+        means[start], deviations[start] = window_mean_mad(
+            source[start:start + length]
+        )
+
+    return means, deviations
+
+
+@njit
+def rolling_moments_kernel(
+    source: np.ndarray,
+    lengths: np.ndarray,
+    ddof: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling mean and standard deviation of `source` for
+    several lengths at once.
+
+    The windowed sums and sums of squares of every length are read
+    from one pass of Kahan-compensated cumulative sums, whose prefix
+    sums are kept in a ring buffer sized for the longest window.
+
+    The values are accumulated relative to a shift, which keeps the
+    sums of squares small and limits the cancellation of
+    ``sum(x**2) - sum(x)**2 / n``. Every `MOMENTS_EPOCH` bars (or
+    every time the ring wraps, for longer windows) the sums restart
+    from zero around the last valid value, so the shift follows the
+    series however far it drifts. A window then spans at most two
+    epochs, and the part in the previous epoch is moved to the current
+    shift. The epochs don't depend on the other lengths below
+    `MOMENTS_EPOCH`, so neither do the results of a length.
+
+    Like pandas, NaN and infinite values make every window holding
+    them NaN, and a window of identical values has a deviation of
+    exactly 0.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        The time series data as a float64 array.
+    lengths : np.ndarray
+        The window lengths as an int64 array.
+    ddof : int
+        The delta degrees of freedom of the standard deviation.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The rolling means and standard deviations, each a
+        ``(n_bars, n_lengths)`` array.
+    """
+    n_bars = source.shape[0]
+    n_lengths = lengths.shape[0]
+    means = np.empty((n_bars, n_lengths))
+    deviations = np.empty((n_bars, n_lengths))
+
+    size = 1
+    for col in range(n_lengths):
+        while size <= lengths[col]:
+            size *= 2
+    mask = size - 1
+    epoch_mask = max(size, MOMENTS_EPOCH) - 1
+
+    ring_sum = np.zeros(size)
+    ring_compensation = np.zeros(size)
+    ring_squares = np.zeros(size)
+    ring_squares_compensation = np.zeros(size)
+    ring_count = np.zeros(size, dtype=np.int64)
+
+    shift = 0.0
+    total = 0.0
+    compensation = 0.0
+    squares = 0.0
+    squares_compensation = 0.0
+    count = 0
+
+    epoch_start = 0
+    last_shift = 0.0
+    last_total = 0.0
+    last_compensation = 0.0
+    last_squares = 0.0
+    last_squares_compensation = 0.0
+    last_count = 0
+
+    consecutive_same = 0
+    previous = np.nan
+    last_valid = 0.0
+
+    for idx in range(n_bars):
+        if idx > 0 and idx & epoch_mask == 0:
+            epoch_start = idx
+            last_shift = shift
+            last_total = total
+            last_compensation = compensation
+            last_squares = squares
+            last_squares_compensation = squares_compensation
+            last_count = count
+
+            shift = last_valid
+            total = 0.0
+            compensation = 0.0
+            squares = 0.0
+            squares_compensation = 0.0
+
+            ring_sum[0] = 0.0
+            ring_compensation[0] = 0.0
+            ring_squares[0] = 0.0
+            ring_squares_compensation[0] = 0.0
+
+        value = source[idx]
+
+        if np.isfinite(value):
+            consecutive_same = consecutive_same + 1 if value == previous else 1
+            previous = value
+
+            if count == 0:
+                shift = value
+            last_valid = value
+
+            delta = value - shift
+            total, compensation = _kahan_add(total, compensation, delta)
+            squares, squares_compensation = _kahan_add(
+                squares, squares_compensation, delta * delta
+            )
+            count += 1
+        else:
+            consecutive_same = 0
+            previous = np.nan
+
+        slot = (idx + 1) & mask
+        ring_sum[slot] = total
+        ring_compensation[slot] = compensation
+        ring_squares[slot] = squares
+        ring_squares_compensation[slot] = squares_compensation
+        ring_count[slot] = count
+
+        for col in range(n_lengths):
+            length = lengths[col]
+            start = idx + 1 - length
+            start_slot = start & mask
+
+            if start < 0 or count - ring_count[start_slot] < length:
+                means[idx, col] = np.nan
+                deviations[idx, col] = np.nan
+                continue
+
+            if start >= epoch_start:
+                window_sum = (
+                    (total - ring_sum[start_slot])
+                    - (compensation - ring_compensation[start_slot])
+                )
+                window_squares = (
+                    (squares - ring_squares[start_slot])
+                    - (squares_compensation
+                       - ring_squares_compensation[start_slot])
+                )
+            else:
+                last_sum = (
+                    (last_total - ring_sum[start_slot])
+                    - (last_compensation - ring_compensation[start_slot])
+                )
+                last_window_squares = (
+                    (last_squares - ring_squares[start_slot])
+                    - (last_squares_compensation
+                       - ring_squares_compensation[start_slot])
+                )
+                last_size = last_count - ring_count[start_slot]
+                offset = last_shift - shift
+
+                window_sum = (
+                    (total - compensation)
+                    + last_sum
+                    + last_size * offset
+                )
+                window_squares = (
+                    (squares - squares_compensation)
+                    + last_window_squares
+                    + offset * (2 * last_sum + last_size * offset)
+                )
+
+            mean_delta = window_sum / length
+            means[idx, col] = shift + mean_delta
+
+            if length <= ddof:
+                deviations[idx, col] = np.nan
+            elif consecutive_same >= length:
+                deviations[idx, col] = 0.0
+            else:
+                variance = (
+                    (window_squares - window_sum * mean_delta)
+                    / (length - ddof)
+                )
+                deviations[idx, col] = np.sqrt(max(variance, 0.0))
+
+    return means, deviations
+
+
+@njit
+def bands_kernel(
+    bases: np.ndarray,
+    deviations: np.ndarray,
+    mults: np.ndarray,
+    output: np.ndarray,
+) -> np.ndarray:
+    """
+    Write the basis, upper and lower bands of every combination of
+    lengths and multipliers into `output`, row by row.
+
+    Parameters
+    ----------
+    bases : np.ndarray
+        The ``(n_bars, n_lengths)`` bases.
+    deviations : np.ndarray
+        The ``(n_bars, n_lengths)`` standard deviations.
+    mults : np.ndarray
+        The multipliers of the standard deviations.
+    output : np.ndarray
+        The ``(n_bars, n_lengths * n_mults, 3)`` array that receives
+        the bands, ordered by length then multiplier.
+
+    Returns
+    -------
+    np.ndarray
+        The `output` array.
+    """
+    n_bars, n_lengths = bases.shape
+    n_mults = mults.shape[0]
+
+    for idx in range(n_bars):
+        for col in range(n_lengths):
+            basis = bases[idx, col]
+            deviation = deviations[idx, col]
+
+            for mult_idx in range(n_mults):
+                offset = deviation * mults[mult_idx]
+                band_set = col * n_mults + mult_idx
+
+                output[idx, band_set, 0] = basis
+                output[idx, band_set, 1] = basis + offset
+                output[idx, band_set, 2] = basis - offset
+
+    return output
+
+
+@njit
+def expand_window_kernel(
+    path: np.ndarray,
+    len_x: int,
+    len_y: int,
+    radius: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Project a warping path found on the series reduced by half onto
+    the full series, widened by `radius` cells, like the window
+    expansion of FastDTW.
+
+    The path is monotonic, so the window of every row is a single run
+    of columns, returned as its first and last column.
+
+    Parameters
+    ----------
+    path : np.ndarray
+        The ``(n_steps, 2)`` warping path of the reduced series.
+    len_x : int
+        The length of the full first series.
+    len_y : int
+        The length of the full second series.
+    radius : int
+        The number of cells added around the projected path.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The first and last column of the window on each row of the
+        full series.
+    """
+    n_rows = path[-1, 0] + 1
+    path_lo = np.empty(n_rows, dtype=np.int64)
+    path_hi = np.empty(n_rows, dtype=np.int64)
+
+    for step in range(path.shape[0] - 1, -1, -1):
+        path_lo[path[step, 0]] = path[step, 1]
+    for step in range(path.shape[0]):
+        path_hi[path[step, 0]] = path[step, 1]
+
+    lo = np.empty(len_x, dtype=np.int64)
+    hi = np.empty(len_x, dtype=np.int64)
+
+    for row in range(len_x):
+        coarse_row = row // 2
+        first = min(max(coarse_row - radius, 0), n_rows - 1)
+        last = min(coarse_row + radius, n_rows - 1)
+
+        lo[row] = max(2 * (path_lo[first] - radius), 0)
+        hi[row] = min(2 * (path_hi[last] + radius) + 1, len_y - 1)
+
+    # with radius 0 and an odd len_y the projection misses the last
+    # column, where FastDTW fails, so the last row is run to the end
+    hi[len_x - 1] = len_y - 1
+    return lo, hi
+
+
+@njit
+def dtw_window_kernel(
+    x: np.ndarray,
+    y: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+) -> tuple[float, np.ndarray]:
+    """
+    Calculate the exact DTW of `x` and `y` restricted to a window of
+    cells, with the absolute difference as the local distance.
+
+    Each row of the window is a run of columns. Only the accumulated
+    costs of the previous row are kept, and the step taken into every
+    cell is stored row after row in one flat int8 array. The costs of
+    the predecessors are compared before the distance of the cell is
+    added, and exact ties are broken in the order of FastDTW
+    (vertical, horizontal, then diagonal step). The series must be
+    finite.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The first series as a float64 array.
+    y : np.ndarray
+        The second series as a float64 array.
+    lo : np.ndarray
+        The first column of the window on each row of `x`.
+    hi : np.ndarray
+        The last column of the window on each row of `x`.
+
+    Returns
+    -------
+    tuple[float, np.ndarray]
+        The DTW distance and the ``(n_steps, 2)`` warping path, from
+        ``(0, 0)`` to ``(len(x) - 1, len(y) - 1)``.
+    """
+    len_x = x.shape[0]
+    offsets = np.empty(len_x + 1, dtype=np.int64)
+    offsets[0] = 0
+    width = 0
+    for row in range(len_x):
+        offsets[row + 1] = offsets[row] + hi[row] - lo[row] + 1
+        width = max(width, hi[row] - lo[row] + 1)
+
+    moves = np.empty(offsets[len_x], dtype=np.int8)
+    previous_costs = np.empty(width)
+    costs = np.empty(width)
+    previous_lo = 0
+    previous_hi = -1
+
+    for row in range(len_x):
+        start = offsets[row]
+        row_lo = lo[row]
+        value = x[row]
+
+        for col in range(row_lo, hi[row] + 1):
+            distance = abs(value - y[col])
+
+            if previous_lo <= col <= previous_hi:
+                up = previous_costs[col - previous_lo]
+            else:
+                up = np.inf
+
+            if col > row_lo:
+                left = costs[col - 1 - row_lo]
+            else:
+                left = np.inf
+
+            if row == 0:
+                diagonal = 0.0 if col == 0 else np.inf
+            elif previous_lo <= col - 1 <= previous_hi:
+                diagonal = previous_costs[col - 1 - previous_lo]
+            else:
+                diagonal = np.inf
+
+            best = up
+            move = 0
+            if left < best:
+                best = left
+                move = 1
+            if diagonal < best:
+                best = diagonal
+                move = 2
+
+            costs[col - row_lo] = best + distance
+            moves[start + col - row_lo] = move
+
+        previous_costs, costs = costs, previous_costs
+        previous_lo = row_lo
+        previous_hi = hi[row]
+
+    len_y = y.shape[0]
+    path = np.empty((len_x + len_y - 1, 2), dtype=np.int64)
+    step = path.shape[0]
+    row = len_x - 1
+    col = len_y - 1
+
+    while row >= 0 and col >= 0:
+        step -= 1
+        path[step, 0] = row
+        path[step, 1] = col
+
+        move = moves[offsets[row] + col - lo[row]]
+        if move != 1:
+            row -= 1
+        if move != 0:
+            col -= 1
+
+    return previous_costs[previous_hi - previous_lo], path[step:].copy()
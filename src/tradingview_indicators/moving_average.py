@@ -1,94 +1,256 @@
+import math
 from typing import Literal
 import pandas as pd
 import numpy as np
 
+from .config import resolve_dtype
 from .errors_exceptions import InvalidArgumentError
+from .kernels import (
+    sma_seed,
+    ema_kernel,
+    rma_kernel,
+    sema_kernel,
+    sma_batch_kernel,
+    seeded_batch_kernel,
+    sema_batch_kernel,
+    sma_bank_kernel,
+    seeded_bank_kernel,
+    new_seeded_state,
+    sema_update,
+)
 
-def sma(source: pd.Series, length: int) -> pd.Series:
+
+def _is_batch(source: pd.Series | pd.DataFrame | np.ndarray) -> bool:
+    """
+    Check if `source` holds one time series per column.
+    """
+    return (
+        isinstance(source, pd.DataFrame)
+        or (isinstance(source, np.ndarray) and source.ndim == 2)
+    )
+
+
+def _batch(
+    source: pd.DataFrame | np.ndarray,
+    kernel,
+    *args,
+    dtype: np.dtype,
+) -> pd.DataFrame | np.ndarray:
+    """
+    Run a batch kernel over every column of `source`.
+
+    Parameters:
+    -----------
+    source : pd.DataFrame or np.ndarray
+        The 2-D data with one time series per column.
+    kernel : Callable
+        The batch kernel from `kernels`.
+    *args
+        Additional arguments passed to the kernel.
+    dtype : np.dtype
+        The dtype the kernel reads and writes.
+
+    Returns:
+    --------
+    pd.DataFrame or np.ndarray
+        The kernel output, wrapped in a DataFrame with the same index
+        and columns when `source` is a DataFrame.
+    """
+    output = kernel(np.ascontiguousarray(source, dtype=dtype), *args)
+
+    if isinstance(source, pd.DataFrame):
+        return pd.DataFrame(
+            output,
+            index=source.index,
+            columns=source.columns,
+        )
+    return output
+
+
+def _seeded_values(values: np.ndarray, length: int) -> np.ndarray:
+    """
+    Replace the first `length` values with the TradingView SMA seed.
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        The time series data as a float64 array.
+    length : int
+        The number of periods of the moving average.
+
+    Returns:
+    --------
+    np.ndarray
+        A copy of `values` with NaN before position ``length - 1`` and
+        the SMA of the first `length` values at that position.
+    """
+    seeded = values.copy()
+    seeded[:length - 1] = np.nan
+
+    if seeded.shape[0] >= length:
+        seeded[length - 1] = sma_seed(values, length)
+
+    return seeded
+
+
+def sma(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Simple Moving Average (SMA)
     of the input time series data.
 
     Parameters:
     -----------
-    source : pd.Series
-        The time series data to calculate the SMA for.
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The time series data to calculate the SMA for. A DataFrame or
+        a 2-D array is treated as one time series per column.
     length : int
         The number of periods to include in the SMA calculation.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
 
     Returns:
     --------
-    pd.Series
-        The calculated SMA time series data.
+    pd.Series, pd.DataFrame or np.ndarray
+        The calculated SMA time series data. 2-D inputs keep their
+        shape, with NaN where the SMA isn't available.
     """
-    sma_series = source.rolling(length).mean()
+    dtype = resolve_dtype(dtype)
+
+    if _is_batch(source):
+        return _batch(source, sma_batch_kernel, length, dtype=dtype)
+
+    sma_values = sma_batch_kernel(
+        source.to_numpy(dtype=dtype).reshape(-1, 1),
+        length,
+    )
+    sma_series = pd.Series(
+        sma_values[:, 0],
+        index=source.index,
+        name=source.name,
+    )
     return sma_series.dropna(axis=0)
 
-def ema(source: pd.Series, length: int) -> pd.Series:
+def ema(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Exponential Moving Average (EMA)
     of the input time series data.
 
     Parameters:
     -----------
-    source : pandas.Series
-        The time series data to calculate the EMA for.
+    source : pandas.Series, pandas.DataFrame or np.ndarray
+        The time series data to calculate the EMA for. A DataFrame or
+        a 2-D array is treated as one time series per column, and the
+        leading NaN values of each column are skipped before seeding.
     length : int
         The number of periods to include in the EMA calculation.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
 
     Returns:
     --------
-    pandas.Series
-        The calculated EMA time series data.
+    pandas.Series, pandas.DataFrame or np.ndarray
+        The calculated EMA time series data. 2-D inputs keep their
+        shape, with NaN where the EMA isn't available.
+
+    Note:
+    -----
+    The SMA seed is computed from the first `length` values only and
+    the recursion runs in `kernels.ema_kernel`, which writes into a
+    single output array. Sources with missing values after the seed
+    go through `pandas.Series.ewm` to keep its handling of gaps.
     """
-    sma_series = source.rolling(window=length, min_periods=length).mean()[:length]
-    rest = source[length:]
-    return (
-        pd.concat([sma_series, rest])
-        .ewm(span=length, adjust=False)
-        .mean()
-        .dropna(axis=0)
-    )
+    dtype = resolve_dtype(dtype)
+
+    if _is_batch(source):
+        return _batch(
+            source,
+            seeded_batch_kernel,
+            length,
+            1 / (1 + (length - 1) / 2),
+            True,
+            dtype=dtype,
+        )
+
+    values = source.to_numpy(dtype=dtype)
+
+    if np.isnan(values[length:]).any():
+        ema_values = (
+            pd.Series(_seeded_values(values.astype("float64"), length))
+            .ewm(span=length, adjust=False)
+            .mean()
+            .to_numpy(dtype=dtype)
+        )
+    else:
+        ema_values = ema_kernel(values, length)
+
+    ema_series = pd.Series(ema_values, index=source.index, name=source.name)
+    return ema_series.dropna(axis=0)
 
-def sema(source: pd.Series, length: int, smooth: int) -> pd.Series:
+def sema(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int,
+    smooth: int,
+    dtype: Literal["float32", "float64"] | None = None,
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Smoothed Exponential Moving Average (SEMA)
     of the input time series data.
 
     Parameters:
     -----------
-    source : pandas.Series
-        The time series data to calculate the SEMA for.
+    source : pandas.Series, pandas.DataFrame or np.ndarray
+        The time series data to calculate the SEMA for. A DataFrame or
+        a 2-D array is treated as one time series per column, and the
+        leading NaN values of each column are skipped before seeding.
     length : int
         The number of periods to include in the SEMA calculation.
     smooth : int
         The smooth of EMAs to calculate.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
 
     Returns:
     --------
-    pandas.Series
-        The calculeted SEMA time series data.
+    pandas.Series, pandas.DataFrame or np.ndarray
+        The calculeted SEMA time series data. 2-D inputs keep their
+        shape, with NaN where the SEMA isn't available.
+
+    Note:
+    -----
+    All the cascaded EMAs run in a single pass of
+    `kernels.sema_kernel`, so no intermediate series are built.
     """
+    dtype = resolve_dtype(dtype)
 
-    emas_dict = {}
-    emas_dict["source_1"] = ema(source, length)
-    for value in range(2, smooth + 1):
-        emas_dict[f"source_{value}"] = ema(
-            emas_dict[f"source_{value-1}"],
-            length,
-        )
-    emas_df = pd.DataFrame(emas_dict)
-    emas_df["sema"] = (
-        emas_df[emas_df.columns[:-1]].diff(axis=1).sum(axis=1) * - 1
-        * smooth
-        + emas_df[emas_df.columns[-1]]
+    if _is_batch(source):
+        return _batch(source, sema_batch_kernel, length, smooth, dtype=dtype)
+
+    sema_values = sema_kernel(
+        source.to_numpy(dtype=dtype),
+        length,
+        smooth,
     )
-    sema_series = emas_df["sema"]
+    sema_series = pd.Series(sema_values, index=source.index, name="sema")
     return sema_series.dropna(axis=0)
 
 def _rma_pandas(
     source: pd.Series,
     length: int,
+    dtype: np.dtype = np.dtype("float64"),
     **kwargs
 ) -> pd.Series:
     """
@@ -101,6 +263,9 @@ def _rma_pandas(
         The time series data to calculate the RMA for.
     length : int
         The number of periods to include in the RMA calculation.
+    dtype : np.dtype, optional
+        The dtype of the output.
+        (default: float64)
     **kwargs : additional keyword arguments
         Additional keyword arguments to pass to the pandas EWM (Exponential
         Weighted Moving Average) function.
@@ -114,27 +279,26 @@ def _rma_pandas(
     -----
     The first values are different from the TradingView RMA.
     """
-    sma_series = (
-        source
-        .rolling(window=length, min_periods=length)
-        .mean()[:length]
+    seeded_source = pd.Series(
+        _seeded_values(source.to_numpy(dtype="float64"), length),
+        index=source.index,
     )
 
-    rest = source[length:]
-
     return (
-        pd.concat([sma_series, rest])
+        seeded_source
         .ewm(alpha=1 / length, **kwargs)
         .mean()
+        .astype(dtype)
     ).rename("RMA")
 
 def _rma_python(
     source: pd.Series,
-    length: int
+    length: int,
+    dtype: np.dtype = np.dtype("float64"),
 ) -> pd.Series:
     """
     Calculate the Relative Moving Average (RMA) of the input time series
-    data using pure python.
+    data using the compiled RMA kernel.
 
     Parameters:
     -----------
@@ -142,6 +306,9 @@ def _rma_python(
         The time series data to calculate the RMA for.
     length : int
         The number of periods to include in the RMA calculation.
+    dtype : np.dtype, optional
+        The dtype the kernel reads and writes.
+        (default: float64)
 
     Returns:
     --------
@@ -150,24 +317,19 @@ def _rma_python(
 
     Note:
     -----
-    The pure python version is the only one with precision in the
-    initial RMA values. However, with the simple RMA version,
-    both pandas and python versions will yield the same precision
-    in initial values.
+    This version is the only one with precision in the initial RMA
+    values. However, with the simple RMA version, both pandas and
+    python versions will yield the same precision in initial values.
+    The recursion runs in `kernels.rma_kernel`, which is compiled
+    with numba.
     """
-    alpha = 1 / length
-    source_pd = _rma_pandas(source, length)[:length]
-    source_values = source[length:].to_numpy().tolist()
-
-    rma_series = float(source_pd.dropna().iloc[0])
-    rma_list = [rma_series]
-
-    for source_value in source_values:
-        rma_series = alpha * source_value + (1 - alpha) * rma_series
-        rma_list.append(rma_series)
+    rma_values = rma_kernel(
+        source.to_numpy(dtype=dtype),
+        length,
+    )
 
     rma_series = pd.Series(
-        rma_list,
+        rma_values,
         name="RMA",
         index=source[length - 1:].index
     )
@@ -175,35 +337,580 @@ def _rma_python(
     return rma_series
 
 def rma(
-    source: pd.Series,
+    source: pd.Series | pd.DataFrame | np.ndarray,
     length: int,
-    method: Literal["numpy", "pandas"] = "numpy"
-) -> np.ndarray | pd.Series:
+    method: Literal["numpy", "pandas"] = "numpy",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> np.ndarray | pd.Series | pd.DataFrame:
     """
     Calculate the Relative Moving Average (RMA) of the input time series
     data.
 
     Parameters:
     -----------
-    source : pandas.Series
-        The time series data to calculate the RMA for.
+    source : pandas.Series, pandas.DataFrame or np.ndarray
+        The time series data to calculate the RMA for. A DataFrame or
+        a 2-D array is treated as one time series per column, and the
+        leading NaN values of each column are skipped before seeding.
     length : int
         The number of periods to include in the RMA calculation.
     method : {"numpy", "pandas"}, optional
         The method to use for calculating the RMA, by default "numpy".
+        2-D inputs only support the "numpy" method.
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
 
     Returns:
     --------
-    np.ndarray or pandas.Series
-        The calculated RMA time series data.
+    np.ndarray, pandas.Series or pandas.DataFrame
+        The calculated RMA time series data. 2-D inputs keep their
+        shape, with NaN where the RMA isn't available.
     """
+    dtype = resolve_dtype(dtype)
+
     match method:
         case "numpy":
-            return _rma_python(source, length)
+            if _is_batch(source):
+                return _batch(
+                    source,
+                    seeded_batch_kernel,
+                    length,
+                    1 / length,
+                    False,
+                    dtype=dtype,
+                )
+            return _rma_python(source, length, dtype)
         case "pandas":
-            return _rma_pandas(source, length)
+            if _is_batch(source):
+                raise InvalidArgumentError(
+                    "method must be 'numpy' for 2-D sources,"
+                    f" got '{method}'."
+                )
+            return _rma_pandas(source, length, dtype)
         case _:
             raise InvalidArgumentError(
                 "method must be 'numpy' or 'pandas',"
                 f" got '{method}'."
             )
+
+
+def ma_bank(
+    source: pd.Series | np.ndarray,
+    lengths: list[int] | np.ndarray,
+    ma_method: Literal["sma", "ema", "rma"] = "ema",
+    dtype: Literal["float32", "float64"] | None = None,
+) -> pd.DataFrame | np.ndarray:
+    """
+    Calculate a moving average of the same source for several lengths
+    in a single pass over the data.
+
+    The SMAs are read from one shared compensated cumulative sum, and
+    the EMAs and RMAs advance the recursions of every length on each
+    value read.
+
+    Parameters:
+    -----------
+    source : pd.Series or np.ndarray
+        The time series data to calculate the moving averages for.
+    lengths : list[int] or np.ndarray
+        The numbers of periods of each moving average.
+    ma_method : Literal["sma", "ema", "rma"], optional
+        The moving average to calculate.
+        (default: "ema")
+    dtype : Literal["float32", "float64"], optional
+        The dtype of the calculation. None uses the dtype set by
+        `set_dtype`.
+        (default: None)
+
+    Returns:
+    --------
+    pd.DataFrame or np.ndarray
+        A ``(n_bars, n_lengths)`` matrix, with one column per length
+        and NaN during each warm-up period. Series inputs return a
+        DataFrame with the source index and the lengths as columns.
+
+    Note:
+    -----
+    The EMA and RMA columns are identical to `ema` and `rma`. The SMA
+    columns come from prefix-sum differences, so they match `sma` to
+    floating point tolerance rather than bit for bit.
+    """
+    lengths = np.asarray(lengths, dtype="int64")
+    values = np.ascontiguousarray(source, dtype=resolve_dtype(dtype))
+
+    match ma_method:
+        case "sma":
+            output = sma_bank_kernel(values, lengths)
+        case "ema":
+            output = seeded_bank_kernel(values, lengths, True)
+        case "rma":
+            output = seeded_bank_kernel(values, lengths, False)
+        case _:
+            raise InvalidArgumentError(
+                "ma_method must be 'sma', 'ema', or 'rma',"
+                f" got '{ma_method}'."
+            )
+
+    if isinstance(source, pd.Series):
+        return pd.DataFrame(output, index=source.index, columns=lengths)
+    return output
+
+
+def _compensated_mean(
+    sum_x: float,
+    nobs: int,
+    neg_ct: int,
+    consecutive_same: int,
+    prev_value: float,
+) -> float:
+    """
+    Calculate a mean from a compensated running sum the way
+    `pandas.Series.rolling().mean()` does.
+
+    Parameters:
+    -----------
+    sum_x : float
+        The compensated sum of the values.
+    nobs : int
+        The number of values in the sum.
+    neg_ct : int
+        The number of negative values in the sum.
+    consecutive_same : int
+        The number of consecutive identical values added last.
+    prev_value : float
+        The last value added.
+
+    Returns:
+    --------
+    float
+        The mean of the values.
+    """
+    result = sum_x / nobs
+
+    if consecutive_same >= nobs:
+        return prev_value
+
+    is_sign_flip = (
+        (neg_ct == 0 and result < 0)
+        or (neg_ct == nobs and result > 0)
+    )
+    return 0.0 if is_sign_flip else result
+
+
+class SMAState:
+    """
+    Streaming Simple Moving Average (SMA).
+
+    The last `length` values are kept in a preallocated ring buffer
+    and the window sum is updated with Kahan-compensated additions
+    and removals, the same running sum `pandas.Series.rolling` uses.
+    Every update costs O(1), doesn't drift over millions of values
+    and returns the same value as `sma` for the same window.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the SMA calculation.
+    value : float
+        The current SMA value (NaN until the window holds `length`
+        valid values).
+    count : int
+        The number of values received so far.
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize the SMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the SMA calculation.
+        """
+        if length < 1:
+            raise InvalidArgumentError(
+                f"length must be greater than 0, got '{length}'."
+            )
+
+        self.length = length
+        self.value = np.nan
+        self.count = 0
+
+        self._buffer = np.empty(length)
+        self._position = 0
+        self._nobs = 0
+        self._sum = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._neg_ct = 0
+        self._consecutive_same = 0
+        self._prev_value = np.nan
+
+    def _add(self, value: float) -> None:
+        """
+        Add a value to the compensated window sum.
+        """
+        if value != value:
+            return
+
+        self._nobs += 1
+        y = value - self._compensation_add
+        t = self._sum + y
+        self._compensation_add = t - self._sum - y
+        self._sum = t
+
+        if math.copysign(1.0, value) < 0:
+            self._neg_ct += 1
+
+        if value == self._prev_value or self.count == 0:
+            self._consecutive_same += 1
+        else:
+            self._consecutive_same = 1
+        self._prev_value = value
+
+    def _remove(self, value: float) -> None:
+        """
+        Remove a value from the compensated window sum.
+        """
+        if value != value:
+            return
+
+        self._nobs -= 1
+        y = -value - self._compensation_remove
+        t = self._sum + y
+        self._compensation_remove = t - self._sum - y
+        self._sum = t
+
+        if math.copysign(1.0, value) < 0:
+            self._neg_ct -= 1
+
+    def _snapshot(self) -> tuple[dict, float]:
+        """
+        Capture the state before an update that may be reverted.
+        """
+        return self.__dict__.copy(), float(self._buffer[self._position])
+
+    def _restore(self, snapshot: tuple[dict, float]) -> None:
+        """
+        Revert the single update made after `snapshot` was taken.
+        """
+        attributes, overwritten = snapshot
+        self.__dict__.update(attributes)
+        self._buffer[self._position] = overwritten
+
+    def update(self, value: float) -> float:
+        """
+        Add a new value and return the updated SMA.
+
+        Parameters:
+        -----------
+        value : float
+            The next value of the time series.
+
+        Returns:
+        --------
+        float
+            The current SMA value, or NaN while the window holds
+            fewer than `length` valid values.
+        """
+        value = float(value)
+
+        if self.count >= self.length:
+            self._remove(float(self._buffer[self._position]))
+
+        self._add(value)
+        self._buffer[self._position] = value
+        self._position = (self._position + 1) % self.length
+        self.count += 1
+
+        if self._nobs < self.length:
+            self.value = np.nan
+        else:
+            self.value = _compensated_mean(
+                self._sum,
+                self._nobs,
+                self._neg_ct,
+                self._consecutive_same,
+                self._prev_value,
+            )
+
+        return self.value
+
+
+class _SeededState:
+    """
+    Base class of the streaming moving averages seeded with an SMA.
+
+    The first `length` values are accumulated with the compensated
+    summation of `kernels.sma_seed`, so the seed is bit-identical to
+    the batch calculation. Subclasses implement `_step` with the
+    recursion applied after the seed.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the calculation.
+    value : float
+        The current moving average value (NaN until `length` values
+        are seen).
+    count : int
+        The number of values received so far.
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize the seeded state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the calculation.
+        """
+        if length < 1:
+            raise InvalidArgumentError(
+                f"length must be greater than 0, got '{length}'."
+            )
+
+        self.length = length
+        self.value = np.nan
+        self.count = 0
+
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._neg_ct = 0
+        self._consecutive_same = 0
+        self._prev_value = np.nan
+
+    def _add_seed_value(self, value: float) -> None:
+        """
+        Add a warm-up value to the compensated seed sum.
+        """
+        if value != value:
+            self._sum = np.nan
+            return
+
+        y = value - self._compensation
+        t = self._sum + y
+        self._compensation = t - self._sum - y
+        self._sum = t
+
+        if math.copysign(1.0, value) < 0:
+            self._neg_ct += 1
+
+        if value == self._prev_value or self.count == 1:
+            self._consecutive_same += 1
+        else:
+            self._consecutive_same = 1
+        self._prev_value = value
+
+    def _seed(self) -> float:
+        """
+        Calculate the SMA seed from the warm-up values.
+        """
+        return _compensated_mean(
+            self._sum,
+            self.length,
+            self._neg_ct,
+            self._consecutive_same,
+            self._prev_value,
+        )
+
+    def _snapshot(self) -> dict:
+        """
+        Capture the state before an update that may be reverted.
+        """
+        return self.__dict__.copy()
+
+    def _restore(self, snapshot: dict) -> None:
+        """
+        Revert the updates made after `snapshot` was taken.
+        """
+        self.__dict__.update(snapshot)
+
+    def update(self, value: float) -> float:
+        """
+        Add a new value and return the updated moving average.
+
+        Parameters:
+        -----------
+        value : float
+            The next value of the time series.
+
+        Returns:
+        --------
+        float
+            The current moving average value, or NaN during the
+            warm-up period.
+        """
+        value = float(value)
+        self.count += 1
+
+        if self.count > self.length:
+            self.value = self._step(value)
+        else:
+            self._add_seed_value(value)
+            if self.count == self.length:
+                self.value = self._seed()
+
+        return self.value
+
+
+class RMAState(_SeededState):
+    """
+    Streaming Relative Moving Average (RMA).
+
+    The state is seeded exactly like `rma` (an SMA over the first
+    `length` values) and then updated with the RMA recursion, so each
+    new value costs O(1) instead of recomputing the whole series.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the RMA calculation.
+    alpha : float
+        The smoothing factor, ``1 / length``.
+    value : float
+        The current RMA value (NaN until `length` values are seen).
+    count : int
+        The number of values received so far.
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize the RMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the RMA calculation.
+        """
+        super().__init__(length)
+        self.alpha = 1 / length
+
+    def _step(self, value: float) -> float:
+        return self.alpha * value + (1 - self.alpha) * self.value
+
+
+class EMAState(_SeededState):
+    """
+    Streaming Exponential Moving Average (EMA).
+
+    The state collects the first `length` values, seeds with their
+    SMA and then applies the ``span=length`` recursion of
+    `pandas.Series.ewm(adjust=False)`, reproducing `ema` value by
+    value in O(1) per update.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the EMA calculation.
+    alpha : float
+        The smoothing factor derived from the span, as pandas does.
+    value : float
+        The current EMA value (NaN until `length` values are seen).
+    count : int
+        The number of values received so far.
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize the EMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the EMA calculation.
+        """
+        super().__init__(length)
+        self.alpha = 1 / (1 + (length - 1) / 2)
+        self._decay = 1 - self.alpha
+        self._old_weight = 1.0
+
+    def _step(self, value: float) -> float:
+        weighted = self.value
+
+        if weighted != weighted:
+            return value
+
+        self._old_weight *= self._decay
+
+        if value != value:
+            return weighted
+
+        old_weight, self._old_weight = self._old_weight, 1.0
+
+        if weighted == value:
+            return weighted
+
+        return (
+            (old_weight * weighted + self.alpha * value)
+            / (old_weight + self.alpha)
+        )
+
+
+class SEMAState:
+    """
+    Streaming Smoothed Exponential Moving Average (SEMA).
+
+    The `smooth` cascaded EMAs advance together through
+    `kernels.sema_update`, the same step `sema` runs over a whole
+    series, so every update is O(smooth) and returns the value `sema`
+    gives for the same values.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods of each EMA.
+    smooth : int
+        The number of cascaded EMAs.
+    alpha : float
+        The smoothing factor derived from the span, as pandas does.
+    value : float
+        The current SEMA value (NaN until the last EMA is
+        available).
+    count : int
+        The number of values received so far.
+    """
+    def __init__(self, length: int, smooth: int) -> None:
+        """
+        Initialize the SEMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods of each EMA.
+        smooth : int
+            The number of cascaded EMAs.
+        """
+        if length < 1:
+            raise InvalidArgumentError(
+                f"length must be greater than 0, got '{length}'."
+            )
+
+        self.length = length
+        self.smooth = smooth
+        self.alpha = 1 / (1 + (length - 1) / 2)
+        self.value = np.nan
+        self.count = 0
+
+        self._state = new_seeded_state(smooth)
+        self._stage_values = np.empty(smooth)
+
+    def update(self, value: float) -> float:
+        """
+        Add a new value and return the updated SEMA.
+
+        Parameters:
+        -----------
+        value : float
+            The next value of the time series.
+
+        Returns:
+        --------
+        float
+            The current SEMA value, or NaN during the warm-up period.
+        """
+        self.count += 1
+        self.value = float(sema_update(
+            self._state, self._stage_values, float(value),
+            self.length, self.alpha,
+        ))
+        return self.value
@@ -0,0 +1,437 @@
+"""
+Rolling Window Module
+
+This module provides the rolling maximum and minimum used by the range
+based indicators (`stoch`, `Ichimoku`), and the rolling moments used
+by the Bollinger Bands.
+
+`rolling_extremes` computes the rolling maxima and minima of several
+window lengths in a single compiled pass over the data, and
+`rolling_moments` does the same for the rolling means and standard
+deviations.
+
+The streaming classes keep a monotonic deque of the window: every new
+value drops the older values it dominates from the back, so the front
+is always the extreme of the window. Each value enters and leaves the
+deque once, which makes an update O(1) amortized whatever the window
+length. The results match `pandas.Series.rolling(length).max()` and
+`.min()`, including missing values: like pandas, NaN and infinite
+values make every window holding them NaN.
+
+Functions
+---------
+rolling_extremes(high, low, lengths)
+    Rolling maxima and minima of several lengths in a single pass.
+rolling_moments(source, lengths, ddof)
+    Rolling means and standard deviations of several lengths in a
+    single pass.
+
+Classes
+-------
+RollingMax(length)
+    Streaming rolling maximum.
+RollingMin(length)
+    Streaming rolling minimum.
+RollingStd(length, ddof)
+    Streaming rolling mean and standard deviation.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .errors_exceptions import InvalidArgumentError
+from .kernels import rolling_extremes_kernel, rolling_moments_kernel
+
+# pandas recomputes the window variance when an update leaves fewer
+# than three significant digits of the previous sum of squares
+_INV_COND_TOL = np.finfo(np.float64).eps * 1e3
+
+
+def rolling_extremes(
+    high: pd.Series,
+    low: pd.Series,
+    lengths: list[int] | tuple[int, ...],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Calculate the rolling maximum of `high` and the rolling minimum of
+    `low` for several window lengths at once.
+
+    Both series are scanned once whatever the number of lengths: a
+    single monotonic deque per series covers the longest window and
+    every length reads its extreme from it.
+
+    Parameters:
+    -----------
+    high : pd.Series
+        The series of the rolling maxima (e.g. the high prices).
+    low : pd.Series
+        The series of the rolling minima (e.g. the low prices).
+    lengths : list[int] or tuple[int, ...]
+        The window lengths.
+
+    Returns:
+    --------
+    tuple[pd.DataFrame, pd.DataFrame]
+        The rolling maxima and minima, one column per distinct
+        length, equal to ``high.rolling(length).max()`` and
+        ``low.rolling(length).min()``.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If `lengths` is empty or holds a length smaller than 1.
+    """
+    lengths = list(dict.fromkeys(lengths))
+
+    if not lengths or min(lengths) < 1:
+        raise InvalidArgumentError(
+            f"lengths must be greater than 0, got '{lengths}'."
+        )
+
+    highest, lowest = rolling_extremes_kernel(
+        high.to_numpy(dtype=np.float64),
+        low.to_numpy(dtype=np.float64),
+        np.array(lengths, dtype=np.int64),
+    )
+
+    return (
+        pd.DataFrame(highest, index=high.index, columns=lengths, copy=False),
+        pd.DataFrame(lowest, index=low.index, columns=lengths, copy=False),
+    )
+
+
+def rolling_moments(
+    source: pd.Series,
+    lengths: list[int] | tuple[int, ...],
+    ddof: int = 1,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Calculate the rolling mean and standard deviation of `source` for
+    several window lengths at once.
+
+    The windowed sums and sums of squares of every length come from
+    one pass of compensated cumulative sums, so the cost barely grows
+    with the number of lengths.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The time series data.
+    lengths : list[int] or tuple[int, ...]
+        The window lengths.
+    ddof : int, optional
+        The delta degrees of freedom of the standard deviation.
+        (default: 1)
+
+    Returns:
+    --------
+    tuple[pd.DataFrame, pd.DataFrame]
+        The rolling means and standard deviations, one float64 column
+        per distinct length. They follow an exact computation of each
+        window closely, but not ``source.rolling(length).std(ddof)``:
+        the running variance of pandas loses precision on series far
+        from zero, and on a series near 1e6 the two differ by up to
+        1.6e-2 relative.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If `lengths` is empty or holds a length smaller than 1.
+    """
+    lengths = list(dict.fromkeys(lengths))
+
+    if not lengths or min(lengths) < 1:
+        raise InvalidArgumentError(
+            f"lengths must be greater than 0, got '{lengths}'."
+        )
+
+    means, deviations = rolling_moments_kernel(
+        source.to_numpy(dtype=np.float64),
+        np.array(lengths, dtype=np.int64),
+        ddof,
+    )
+
+    return (
+        pd.DataFrame(means, index=source.index, columns=lengths, copy=False),
+        pd.DataFrame(
+            deviations, index=source.index, columns=lengths, copy=False
+        ),
+    )
+
+
+class _RollingExtremum:
+    """
+    Base class of the streaming rolling extremes.
+
+    The deque holds ``(bar, value)`` pairs whose values are strictly
+    monotonic from front to back. Subclasses define `_dominates`.
+
+    Attributes:
+    -----------
+    length : int
+        The number of bars in the window.
+    value : float
+        The current extreme (NaN until the window holds `length`
+        valid values).
+    count : int
+        The number of values received so far.
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize the rolling extreme.
+
+        Parameters:
+        -----------
+        length : int
+            The number of bars in the window.
+        """
+        if length < 1:
+            raise InvalidArgumentError(
+                f"length must be greater than 0, got '{length}'."
+            )
+
+        self.length = length
+        self.value = np.nan
+        self.count = 0
+
+        self._deque = deque()
+        self._last_missing = -length
+
+    def update(self, value: float) -> float:
+        """
+        Add a new value and return the extreme of the last `length`
+        values.
+
+        Parameters:
+        -----------
+        value : float
+            The new value.
+
+        Returns:
+        --------
+        float
+            The current extreme, or NaN while the window holds fewer
+            than `length` values or any missing value.
+        """
+        value = float(value)
+        bar = self.count
+        self.count += 1
+
+        if not math.isfinite(value):
+            self._last_missing = bar
+        else:
+            # ties drop the older value, as pandas does
+            while self._deque and self._dominates(value, self._deque[-1][1]):
+                self._deque.pop()
+            self._deque.append((bar, value))
+
+        if self._deque and self._deque[0][0] <= bar - self.length:
+            self._deque.popleft()
+
+        if bar < self.length - 1 or self._last_missing > bar - self.length:
+            self.value = np.nan
+        else:
+            self.value = self._deque[0][1]
+        return self.value
+
+
+class RollingMax(_RollingExtremum):
+    """
+    Streaming rolling maximum with an O(1) amortized update.
+
+    Attributes:
+    -----------
+    length : int
+        The number of bars in the window.
+    value : float
+        The current maximum (NaN until the window holds `length`
+        valid values).
+    count : int
+        The number of values received so far.
+    """
+    @staticmethod
+    def _dominates(value: float, other: float) -> bool:
+        return value >= other
+
+
+class RollingMin(_RollingExtremum):
+    """
+    Streaming rolling minimum with an O(1) amortized update.
+
+    Attributes:
+    -----------
+    length : int
+        The number of bars in the window.
+    value : float
+        The current minimum (NaN until the window holds `length`
+        valid values).
+    count : int
+        The number of values received so far.
+    """
+    @staticmethod
+    def _dominates(value: float, other: float) -> bool:
+        return value <= other
+
+
+class RollingStd:
+    """
+    Streaming rolling mean and standard deviation.
+
+    The last `length` values are kept in a preallocated ring buffer,
+    and the mean and the sum of squared deviations are updated with
+    the Kahan-compensated Welford additions and removals of
+    `pandas.Series.rolling().std()`. Like pandas, the window is summed
+    again from the buffer when a removal cancels most of the sum of
+    squares, so an update costs O(1) except on those rare bars, and
+    the deviation equals ``source.rolling(length).std(ddof)`` for the
+    same values however many updates it receives. NaN and infinite
+    values make every window holding them NaN.
+
+    Attributes:
+    -----------
+    length : int
+        The number of bars in the window.
+    ddof : int
+        The delta degrees of freedom of the standard deviation.
+    value : float
+        The current standard deviation (NaN until the window holds
+        `length` valid values).
+    mean : float
+        The current Welford mean of the window (NaN until the window
+        holds `length` valid values).
+    count : int
+        The number of values received so far.
+    """
+    def __init__(self, length: int, ddof: int = 1) -> None:
+        """
+        Initialize the rolling standard deviation.
+
+        Parameters:
+        -----------
+        length : int
+            The number of bars in the window.
+        ddof : int, optional
+            The delta degrees of freedom of the standard deviation.
+            (default: 1)
+        """
+        if length < 1:
+            raise InvalidArgumentError(
+                f"length must be greater than 0, got '{length}'."
+            )
+
+        self.length = length
+        self.ddof = ddof
+        self.value = np.nan
+        self.mean = np.nan
+        self.count = 0
+
+        self._buffer = np.empty(length)
+        self._position = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        """
+        Clear the running moments.
+        """
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._unstable = False
+
+    def _add(self, value: float) -> None:
+        """
+        Add a value to the running moments.
+        """
+        if value != value:
+            return
+
+        prev_ssqdm = self._ssqdm
+        self._nobs += 1
+
+        prev_mean = self._mean - self._compensation_add
+        y = value - self._compensation_add
+        t = y - self._mean
+        self._compensation_add = t + self._mean - y
+        self._mean = self._mean + t / self._nobs
+        self._ssqdm = self._ssqdm + (value - prev_mean) * (value - self._mean)
+
+        if prev_ssqdm * _INV_COND_TOL > self._ssqdm:
+            self._unstable = True
+
+    def _remove(self, value: float) -> None:
+        """
+        Remove a value from the running moments.
+        """
+        if value != value:
+            return
+
+        prev_ssqdm = self._ssqdm
+        self._nobs -= 1
+
+        if not self._nobs:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+            self._unstable = False
+            return
+
+        prev_mean = self._mean - self._compensation_remove
+        y = value - self._compensation_remove
+        t = y - self._mean
+        self._compensation_remove = t + self._mean - y
+        self._mean = self._mean - t / self._nobs
+        self._ssqdm = self._ssqdm - (value - prev_mean) * (value - self._mean)
+
+        if prev_ssqdm * _INV_COND_TOL > self._ssqdm:
+            self._unstable = True
+
+    def update(self, value: float) -> float:
+        """
+        Add a new value and return the standard deviation of the
+        last `length` values.
+
+        Parameters:
+        -----------
+        value : float
+            The new value.
+
+        Returns:
+        --------
+        float
+            The current standard deviation, or NaN while the window
+            holds fewer than `length` valid values.
+        """
+        value = float(value)
+        if math.isinf(value):
+            value = np.nan
+
+        if self.count >= self.length:
+            self._remove(float(self._buffer[self._position]))
+
+        self._add(value)
+        self._buffer[self._position] = value
+        self._position = (self._position + 1) % self.length
+        self.count += 1
+
+        if self._unstable:
+            window = np.roll(self._buffer, -self._position)[
+                -min(self.count, self.length):
+            ]
+
+            self._reset()
+            for past_value in window:
+                self._add(float(past_value))
+            self._unstable = False
+
+        if self._nobs < self.length or self._nobs <= self.ddof:
+            self.value = np.nan
+            self.mean = np.nan
+        else:
+            variance = self._ssqdm / (self._nobs - self.ddof)
+            self.value = math.sqrt(variance) if variance > 0 else 0.0
+            self.mean = self._mean
+        return self.value
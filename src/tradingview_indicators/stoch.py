@@ -1,5 +1,10 @@
+import numpy as np
 import pandas as pd
 
+from .kernels import divide
+from .rolling import RollingMax, RollingMin
+
+
 def stoch(source: pd.Series, high: pd.Series, low: pd.Series, length: int) -> pd.Series:
     """
     Calculate the Fast Stochastic Oscillator values for the given
@@ -30,3 +35,67 @@ def stoch(source: pd.Series, high: pd.Series, low: pd.Series, length: int) -> pd
         / (highest_high - lowest_low)
     )
     return stochastic.rename("stoch")
+
+
+class StochState:
+    """
+    Streaming Fast Stochastic Oscillator (%K).
+
+    The highest high and the lowest low of the window come from the
+    monotonic deques of `RollingMax` and `RollingMin`, so every bar
+    costs O(1) amortized and returns the same value as `stoch` for
+    the same bars. A flat window (highest high equal to the lowest
+    low) gives NaN, or an infinite value when the close lies outside
+    the range, exactly like the division of `stoch`.
+
+    Attributes:
+    -----------
+    length : int
+        The length of the stochastic period.
+    value : float
+        The current %K value (NaN during the warm-up period).
+    count : int
+        The number of bars received so far.
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize the stochastic state.
+
+        Parameters:
+        -----------
+        length : int
+            The length of the stochastic period.
+        """
+        self._highest = RollingMax(length)
+        self._lowest = RollingMin(length)
+
+        self.length = length
+        self.value = np.nan
+        self.count = 0
+
+    def update(self, close: float, high: float, low: float) -> float:
+        """
+        Add a new bar and return the updated %K.
+
+        Parameters:
+        -----------
+        close : float
+            The close of the bar.
+        high : float
+            The high of the bar.
+        low : float
+            The low of the bar.
+
+        Returns:
+        --------
+        float
+            The current %K, or NaN during the warm-up period.
+        """
+        highest_high = self._highest.update(high)
+        lowest_low = self._lowest.update(low)
+
+        self.value = divide(
+            100 * (float(close) - lowest_low), highest_high - lowest_low
+        )
+        self.count += 1
+        return self.value
@@ -1,7 +1,9 @@
+from functools import cached_property
 from typing import Literal
 import pandas as pd
 import numpy as np
 import fastdtw
+from .dtw import banded_dtw, fast_dtw
 from .errors_exceptions import InvalidArgumentError
 
 
@@ -17,6 +19,20 @@ class DynamicTimeWarping:
         The first input sequence.
     input_y : numpy.ndarray or pandas.Series
         The second input sequence.
+    engine : str, optional
+        The DTW engine.
+        The options are:
+        - "compiled": The compiled FastDTW of `dtw.fast_dtw`, with
+        the same distance as the `fastdtw` package.
+        - "sakoe_chiba": The compiled exact DTW inside a
+        Sakoe-Chiba band of `dtw.banded_dtw`.
+        - "fastdtw": The pure Python `fastdtw` package.
+        (default: "compiled")
+    radius : int, optional
+        The radius of the FastDTW engines or the half-width of the
+        Sakoe-Chiba band. None uses 1 for the FastDTW engines and 50
+        for the band.
+        (default: None)
 
     Attributes
     ----------
@@ -24,14 +40,32 @@ class DynamicTimeWarping:
         The first input sequence.
     input_y : numpy.ndarray or pandas.Series
         The second input sequence.
+    engine : str
+        The DTW engine.
+    radius : int or None
+        The radius given to the engine.
+    distance : float
+        The DTW distance between the input sequences.
+    path : numpy.ndarray
+        The ``(n_steps, 2)`` int64 warping path, whose rows are the
+        aligned indexes of input_x and input_y. It used to be the list
+        of index tuples returned by the `fastdtw` package.
+    path_x : numpy.ndarray
+        The indexes of input_x along the warping path.
+    path_y : numpy.ndarray
+        The indexes of input_y along the warping path.
+    dtw : pandas.DataFrame
+        The warping path as a DataFrame, built on the first access and
+        cached.
 
     Methods
     -------
-    __init__(self, input_x, input_y)
+    __init__(self, input_x, input_y, engine="compiled", radius=None)
         Initialize the DynamicTimeWarping class with the input sequences.
 
     dtw_df(self)
-        Get the DTW dataframe between the input sequences.
+        Get the DTW dataframe between the input sequences, built on
+        the first access and cached.
 
     calculate_dtw_distance(self, method="ratio", align_sequences=False)
         Calculate the DTW distance between the input sequences.
@@ -41,6 +75,8 @@ class DynamicTimeWarping:
         self,
         input_x: np.ndarray | pd.Series,
         input_y: np.ndarray | pd.Series,
+        engine: Literal["compiled", "sakoe_chiba", "fastdtw"] = "compiled",
+        radius: int | None = None,
     ):
         """
         Initialize the DynamicTimeWarping class with the input
@@ -52,12 +88,55 @@ class DynamicTimeWarping:
             The first input sequence.
         input_y : numpy.ndarray or pandas.Series
             The second input sequence.
-
+        engine : str, optional
+            The DTW engine: "compiled", "sakoe_chiba" or "fastdtw".
+            (default: "compiled")
+        radius : int, optional
+            The radius of the engine. None uses its default.
+            (default: None)
+
+        Raises
+        ------
+        InvalidArgumentError
+            If `engine` is unknown, or the input sequences hold NaN or
+            infinite values.
         """
+        is_finite = (
+            np.isfinite(np.asarray(input_x, dtype=np.float64)).all()
+            and np.isfinite(np.asarray(input_y, dtype=np.float64)).all()
+        )
+        if not is_finite:
+            raise InvalidArgumentError(
+                "input_x and input_y must not contain NaN or infinite values."
+            )
+
         self.input_x = input_x
         self.input_y = input_y
-        _, self.path = fastdtw.fastdtw(input_x, input_y)
-        self.dtw = pd.DataFrame(self.path)
+        self.engine = engine
+        self.radius = radius
+
+        match engine:
+            case "compiled":
+                self.distance, self.path = fast_dtw(
+                    input_x, input_y, 1 if radius is None else radius
+                )
+            case "sakoe_chiba":
+                self.distance, self.path = banded_dtw(
+                    input_x, input_y, 50 if radius is None else radius
+                )
+            case "fastdtw":
+                self.distance, path = fastdtw.fastdtw(
+                    input_x, input_y, 1 if radius is None else radius
+                )
+                self.path = np.array(path, dtype=np.int64).reshape(-1, 2)
+            case _:
+                raise InvalidArgumentError(
+                    "engine must be 'compiled', 'sakoe_chiba', or 'fastdtw',"
+                    f" got '{engine}'."
+                )
+
+        self.path_x = self.path[:, 0]
+        self.path_y = self.path[:, 1]
 
         self.column_x = (
             input_x.name if isinstance(input_x, pd.Series)
@@ -69,10 +148,35 @@ class DynamicTimeWarping:
             else "input_y"
         )
 
-    @property
+    @cached_property
+    def dtw(self) -> pd.DataFrame:
+        """
+        The warping path as a DataFrame with the columns 0 and 1.
+        """
+        return pd.DataFrame(self.path)
+
+    @cached_property
+    def _path_values(self) -> tuple[pd.Series, pd.Series]:
+        """
+        The values of input_x and input_y along the warping path,
+        indexed by the step of the path.
+        """
+        x_values = (
+            pd.Series(self.input_x).iloc[self.path_x]
+            .reset_index(drop=True).rename(self.column_x)
+        )
+
+        y_values = (
+            pd.Series(self.input_y).iloc[self.path_y]
+            .reset_index(drop=True).rename(self.column_y)
+        )
+        return x_values, y_values
+
+    @cached_property
     def dtw_df(self) -> pd.DataFrame:
         """
-        Get the DTW dataframe between the input sequences.
+        Get the DTW dataframe between the input sequences. It is built
+        on the first access and cached on the instance.
 
         Returns
         -------
@@ -87,16 +191,16 @@ class DynamicTimeWarping:
             - <column_x>: The values of the input_x sequence.
             - <column_y>: The values of the input_y sequence.
         """
+        x_values, y_values = self._path_values
+
         dtw_df1 = (
-            self.input_x.reset_index(drop=True)
-            .reindex(self.dtw[0])
+            x_values.set_axis(self.path_x)
             .rename_axis([self.column_x + "_path"])
             .reset_index()
         )
 
         dtw_df2 = (
-            self.input_y.reset_index(drop=True)
-            .reindex(self.dtw[1])
+            y_values.set_axis(self.path_y)
             .rename_axis([self.column_y + "_path"])
             .reset_index()
         )
@@ -146,8 +250,7 @@ class DynamicTimeWarping:
         if align_sequences:
             x_series, y_series = self.align_dtw_distance()
         else:
-            x_series = self.dtw_df[self.column_x]
-            y_series = self.dtw_df[self.column_y]
+            x_series, y_series = self._path_values
 
         match method:
             case "ratio":
@@ -160,14 +263,11 @@ class DynamicTimeWarping:
                     f" got '{method}'."
                 )
 
-    def align_dtw_distance(self):
+    @cached_property
+    def _aligned(self) -> "DynamicTimeWarping":
         """
-        Aligns two time series using Dynamic Time Warping (DTW)
-        algorithm and returns the aligned series.
-
-        Returns:
-            x_series (pandas.Series): Aligned x series.
-            y_series (pandas.Series): Aligned y series.
+        The DTW of the input sequences cut to the length of the
+        shorter one, computed on the first access and cached.
         """
         x_source = self.input_x.copy().rename('x')
         y_source = self.input_y.copy().rename('y')
@@ -177,21 +277,25 @@ class DynamicTimeWarping:
         elif len(self.input_x) < len(self.input_y):
             y_source = y_source.reindex(self.input_x.index)
 
-        dtw_df = DynamicTimeWarping(x_source, y_source).dtw_df
+        return DynamicTimeWarping(x_source, y_source, self.engine, self.radius)
 
-        x_name = "x"
-        y_name = "y"
+    def align_dtw_distance(self):
+        """
+        Aligns two time series using Dynamic Time Warping (DTW)
+        algorithm and returns the aligned series.
 
-        x_series = dtw_df[x_name].reindex(
-            dtw_df[x_name + '_path'].drop_duplicates()
-        )
+        Returns:
+            x_series (pandas.Series): Aligned x series.
+            y_series (pandas.Series): Aligned y series.
+        """
+        aligned = self._aligned
+        x_values, y_values = aligned._path_values
 
-        y_series = dtw_df[y_name].reindex(
-            dtw_df[y_name + '_path'].drop_duplicates()
-        )
+        x_series = x_values.reindex(pd.unique(aligned.path_x))
+        y_series = y_values.reindex(pd.unique(aligned.path_y))
 
-        x_series.index = x_source.dropna().index
-        y_series.index = y_source.dropna().index
+        x_series.index = aligned.input_x.dropna().index
+        y_series.index = aligned.input_y.dropna().index
         return x_series, y_series
 
 
@@ -1,7 +1,8 @@
 import unittest
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators import RSI
+from src.tradingview_indicators import RSI, RSIState
+from src.tradingview_indicators.RSI import _rsi_series
 from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 class TestRSI(unittest.TestCase):
@@ -208,4 +209,121 @@ class TestRSI(unittest.TestCase):
         self.assertEqual(
             str(context.exception),
             "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma', got 'invalid_method'.",
-        )
\ No newline at end of file
+        )
+
+    def test_rsi_matches_series_path(self):
+        source = self.long_source["close"]
+
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            pd.testing.assert_series_equal(
+                RSI(source, self.length, ma_method),
+                _rsi_series(
+                    source, self.length, ma_method, np.dtype("float64")
+                ),
+                check_exact=True,
+            )
+
+    def test_rsi_missing_values(self):
+        source = self.long_source["close"].copy()
+        source.iloc[20] = np.nan
+
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            test_rsi = RSI(source, 5, ma_method)
+
+            pd.testing.assert_series_equal(
+                test_rsi,
+                _rsi_series(source, 5, ma_method, np.dtype("float64")),
+            )
+            self.assertFalse(test_rsi.isna().any())
+
+
+class TestRSIState(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source["close"].iloc[:200]
+        self.length = 14
+
+    def test_rsi_state_matches_rsi(self):
+        for ma_method in ["sma", "ema", "rma"]:
+            state = RSIState(self.length, ma_method)
+            result = [state.update(close) for close in self.source]
+            expected = RSI(self.source, self.length, ma_method)
+
+            self.assertTrue(np.isnan(result[: self.length]).all())
+            np.testing.assert_array_equal(
+                result[self.length :], expected.to_numpy()
+            )
+            self.assertEqual(state.count, len(self.source))
+
+    def test_rsi_state_nan_close(self):
+        source = self.source.copy()
+        source.iloc[100] = np.nan
+
+        for ma_method in ["sma", "ema", "rma"]:
+            state = RSIState(self.length, ma_method)
+            result = pd.Series(
+                [state.update(close) for close in source], index=source.index
+            )
+            expected = RSI(source.dropna(), self.length, ma_method)
+
+            np.testing.assert_array_equal(
+                result.drop(source.index[100]).iloc[self.length :],
+                expected.to_numpy(),
+            )
+            self.assertEqual(result.iloc[100], result.iloc[99])
+            self.assertEqual(state.count, len(self.source) - 1)
+
+    def test_rsi_state_update_last(self):
+        for ma_method in ["sma", "ema", "rma"]:
+            state = RSIState(self.length, ma_method)
+            expected = RSIState(self.length, ma_method)
+
+            for close in self.source:
+                for tick in [close * 0.9, close * 1.1, close]:
+                    value = state.update_last(tick)
+                self.assertEqual(state.count, expected.count + 1)
+
+                np.testing.assert_array_equal(
+                    [value, state.commit()], [expected.update(close)] * 2
+                )
+
+    def test_rsi_state_update_last_matches_revised_rsi(self):
+        state = RSIState(self.length)
+        for close in self.source.iloc[:-1]:
+            state.update(close)
+
+        for tick in [1000.0, 5000.0, self.source.iloc[-1]]:
+            revised = self.source.copy()
+            revised.iloc[-1] = tick
+
+            self.assertEqual(
+                state.update_last(tick),
+                RSI(revised, self.length).iloc[-1],
+            )
+
+    def test_rsi_state_update_after_update_last(self):
+        state = RSIState(self.length)
+        expected = RSIState(self.length)
+
+        for close in self.source:
+            state.update_last(close * 2)
+            np.testing.assert_equal(
+                state.update(close), expected.update(close)
+            )
+
+    def test_rsi_state_constant_source(self):
+        state = RSIState(3)
+        result = [state.update(100.0) for _ in range(6)]
+
+        self.assertTrue(np.isnan(result).all())
+
+        self.assertEqual(state.update(101.0), 100.0)
+
+    def test_rsi_state_invalid_ma_method(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            RSIState(self.length, "dema")
+
+        self.assertEqual(
+            str(context.exception),
+            "ma_method must be 'sma', 'ema', or 'rma', got 'dema'.",
+        )
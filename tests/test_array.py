@@ -0,0 +1,113 @@
+import unittest
+import pandas as pd
+import numpy as np
+
+import src.tradingview_indicators as ta
+from src.tradingview_indicators import array
+from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
+
+MA_METHODS = ["sma", "ema", "dema", "tema", "rma"]
+
+
+class TestArray(unittest.TestCase):
+    def setUp(self):
+        data = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0).iloc[:300]
+        self.source = data["close"]
+        self.high = data["high"]
+        self.low = data["low"]
+        self.values = self.source.to_numpy()
+
+    def assert_aligned(self, result, expected):
+        values, offset = result
+        expected = expected.dropna()
+        first = self.source.index.get_loc(expected.index[0])
+
+        self.assertEqual(offset, first)
+        self.assertEqual(len(values), len(self.values) - offset)
+        np.testing.assert_allclose(values, expected.to_numpy(), rtol=1e-12)
+
+    def test_moving_averages(self):
+        self.assert_aligned(array.sma(self.values, 14), ta.sma(self.source, 14))
+        self.assert_aligned(array.ema(self.values, 14), ta.ema(self.source, 14))
+        self.assert_aligned(array.rma(self.values, 14), ta.rma(self.source, 14))
+        self.assert_aligned(
+            array.sema(self.values, 14, 3), ta.sema(self.source, 14, 3)
+        )
+
+    def test_rsi(self):
+        for method in MA_METHODS:
+            self.assert_aligned(
+                array.RSI(self.values, 14, method),
+                ta.RSI(self.source, 14, method),
+            )
+
+    def test_stoch(self):
+        result = array.stoch(
+            self.values, self.high.to_numpy(), self.low.to_numpy(), 14
+        )
+        expected = ta.stoch(self.source, self.high, self.low, 14)
+        self.assert_aligned(result, expected)
+
+    def test_cci(self):
+        for method in MA_METHODS:
+            values, offset = array.CCI(self.values, 20, 0.015, method)
+            expected = ta.CCI(self.source, 20, 0.015, method)["CCI"]
+
+            self.assertEqual(offset, 19)
+            np.testing.assert_allclose(values, expected.to_numpy(), rtol=1e-12)
+
+    def test_tsi(self):
+        for method in MA_METHODS:
+            self.assert_aligned(
+                array.tsi(self.values, 13, 25, method),
+                ta.tsi(self.source, 13, 25, method),
+            )
+
+    def test_trix(self):
+        for method in MA_METHODS:
+            self.assert_aligned(
+                array.TRIX(self.values, 10, 2, method),
+                ta.TRIX(self.source, 10, 2, method),
+            )
+
+    def test_macd(self):
+        for diff_method in ["absolute", "ratio"]:
+            for method in MA_METHODS:
+                (macd, signal, histogram), offset = array.MACD(
+                    self.values, 12, 26, 9, diff_method, method, method
+                )
+                expected = ta.MACD(
+                    self.source, 12, 26, 9, diff_method, method, method
+                )
+
+                self.assertEqual(
+                    offset, self.source.index.get_loc(expected.index[0])
+                )
+                np.testing.assert_allclose(
+                    macd, expected["macd"].to_numpy(), rtol=1e-12
+                )
+                np.testing.assert_allclose(
+                    signal, expected["signal"].to_numpy(), rtol=1e-12
+                )
+                np.testing.assert_allclose(
+                    histogram, expected["histogram"].to_numpy(), rtol=1e-12
+                )
+
+    def test_accepts_lists(self):
+        values, offset = array.sma(self.values.tolist(), 5)
+        self.assertEqual(offset, 4)
+        self.assertEqual(len(values), len(self.values) - 4)
+
+    def test_invalid_methods(self):
+        with self.assertRaises(InvalidArgumentError):
+            array.RSI(self.values, 14, "invalid")
+        with self.assertRaises(InvalidArgumentError):
+            array.CCI(self.values, 20, 0.015, "invalid")
+        with self.assertRaises(InvalidArgumentError):
+            array.MACD(self.values, 12, 26, 9, "dtw")
+        with self.assertRaises(InvalidArgumentError):
+            array.MACD(self.values, 12, 26, 9, signal_method="invalid")
+
+
+if __name__ == "__main__":
+    unittest.main()
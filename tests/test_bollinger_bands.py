@@ -1,7 +1,12 @@
 import unittest
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators.bollinger import bollinger_bands
+from src.tradingview_indicators.bollinger import (
+    _bollinger_bank,
+    bollinger_bands,
+    bollinger_bank,
+    BollingerState,
+)
 from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 class TestBollingerBands(unittest.TestCase):
@@ -309,3 +314,104 @@ class TestBollingerBands(unittest.TestCase):
             str(context.exception),
             "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma', got 'invalid_method'.",
         )
+
+    def test_bollinger_bands_pandas_std(self):
+        source = 1e6 + self.source.astype(float)
+        result = bollinger_bands(source, self.short_length, self.stdev, "sma")
+
+        pd.testing.assert_series_equal(
+            result["upper"],
+            result["basis"]
+            + self.stdev * source.rolling(self.short_length).std(),
+            check_exact=True,
+            check_names=False,
+        )
+
+
+class TestBollingerState(unittest.TestCase):
+    def setUp(self):
+        self.source = pd.read_csv(
+            "example/BTCUSDT_1d_spot.csv", index_col=0
+        )["close"].iloc[:300]
+
+    def test_bollinger_state(self):
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            state = BollingerState(20, 2, ma_method)
+            values = pd.DataFrame(
+                [state.update(value) for value in self.source],
+                index=self.source.index,
+            )
+
+            pd.testing.assert_frame_equal(
+                values,
+                bollinger_bands(self.source, 20, 2, ma_method, "float64"),
+                rtol=1e-12,
+            )
+
+    def test_bollinger_state_attributes(self):
+        state = BollingerState(3, 2, "sma")
+        for value in [1.0, 3.0, 2.0, 4.0]:
+            state.update(value)
+
+        self.assertEqual(state.value, {"basis": 3.0, "upper": 5.0, "lower": 1.0})
+        self.assertEqual(state.count, 4)
+
+    def test_bollinger_state_invalid_ma_method(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            BollingerState(20, 2, "invalid_method")
+
+        self.assertEqual(
+            str(context.exception),
+            "ma_method must be 'sma', 'ema', 'dema', 'tema', or 'rma', got 'invalid_method'.",
+        )
+
+
+class TestBollingerBank(unittest.TestCase):
+    def setUp(self):
+        self.source = pd.read_csv(
+            "example/BTCUSDT_1d_spot.csv", index_col=0
+        )["close"].iloc[:300]
+        self.mults = [1.0, 1.5, 2.0, 2.5, 3.0]
+
+    def test_bollinger_bank(self):
+        for dtype in ["float32", "float64"]:
+            for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+                result = bollinger_bank(
+                    self.source, [10, 20], self.mults, ma_method, dtype
+                )
+
+                self.assertEqual(result.shape, (300, 30))
+                self.assertListEqual(
+                    list(result.columns.names), ["length", "mult", "band"]
+                )
+
+                for length in [10, 20]:
+                    for mult in self.mults:
+                        pd.testing.assert_frame_equal(
+                            result[(length, mult)],
+                            bollinger_bands(
+                                self.source, length, mult, ma_method, dtype
+                            ),
+                            check_names=False,
+                        )
+
+    def test_bollinger_bank_array(self):
+        result = bollinger_bank(self.source.to_numpy(), 20, self.mults)
+
+        self.assertEqual(result.shape, (300, 5, 3))
+        self.assertTrue(result.flags.c_contiguous)
+
+        for idx, mult in enumerate(self.mults):
+            np.testing.assert_array_equal(
+                result[:, idx],
+                _bollinger_bank(self.source, [20], mult, "ema", None)[0]
+                .to_numpy(),
+            )
+
+    def test_bollinger_bank_invalid_mults(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            bollinger_bank(self.source, 20, [])
+
+        self.assertEqual(
+            str(context.exception), "mults must hold at least one multiplier."
+        )
@@ -2,7 +2,10 @@ import unittest
 import pandas as pd
 import numpy as np
 
-from src.tradingview_indicators.bollinger import bollinger_trends
+from src.tradingview_indicators.bollinger import (
+    bollinger_bands,
+    bollinger_trends,
+)
 from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 class TestBollingerBands(unittest.TestCase):
@@ -210,4 +213,31 @@ class TestBollingerBands(unittest.TestCase):
         )
 
         self.assertIsInstance(result, pd.Series)
-        self.assertTrue(result.notna().any())
\ No newline at end of file
+        self.assertTrue(result.notna().any())
+
+    def test_bollinger_trends_shared_bands(self):
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            short_bands = bollinger_bands(
+                self.source, self.short_length, self.stdev, ma_method
+            )
+            long_bands = bollinger_bands(
+                self.source, 20, self.stdev, ma_method
+            )
+            lower_diff = abs(short_bands["lower"] - long_bands["lower"])
+            upper_diff = abs(short_bands["upper"] - long_bands["upper"])
+            expected = (
+                (lower_diff - upper_diff) / short_bands["basis"] * 100
+            ).rename("Bollinger Trend")
+
+            result = bollinger_trends(
+                self.source, self.short_length, 20, self.stdev, ma_method
+            )
+
+            pd.testing.assert_series_equal(result, expected, rtol=1e-10)
+
+    def test_bollinger_trends_same_lengths(self):
+        result = bollinger_trends(
+            self.source, self.short_length, self.short_length, self.stdev
+        )
+
+        self.assertTrue((result.iloc[self.short_length - 1:] == 0).all())
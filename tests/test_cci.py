@@ -2,7 +2,7 @@ import unittest
 
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators.CCI import CCI
+from src.tradingview_indicators.CCI import CCI, CCIState
 from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 class TestCCI(unittest.TestCase):
@@ -162,4 +162,89 @@ class TestCCI(unittest.TestCase):
         self.assertEqual(
             str(context.exception),
             "method must be 'sma', 'ema', 'sema', or 'rma', got 'invalid_method'.",
-        )
\ No newline at end of file
+        )
+
+    def test_CCI_mad_long_window(self):
+        rng = np.random.default_rng(seed=42)
+        source = pd.Series(100 + rng.normal(0, 1, 1000).cumsum())
+
+        window = np.lib.stride_tricks.sliding_window_view(source, 200)
+        expected = np.mean(
+            np.abs(window - window.mean(axis=1)[:, np.newaxis]), axis=1
+        )
+
+        np.testing.assert_allclose(
+            CCI(source, 200)["mad"].to_numpy(), expected, rtol=1e-12
+        )
+
+    def test_CCI_lean_output(self):
+        rng = np.random.default_rng(seed=42)
+        source = pd.Series(
+            100 + rng.normal(0, 1, 300).cumsum(),
+            index=pd.date_range("2024-01-01", periods=300),
+        )
+
+        for method in ["sma", "ema", "dema", "tema", "rma"]:
+            expected = CCI(source, 20, method=method)["CCI"]
+
+            pd.testing.assert_series_equal(
+                CCI(source, 20, method=method, output="series"), expected
+            )
+            np.testing.assert_array_equal(
+                CCI(source, 20, method=method, output="array"),
+                expected.to_numpy(),
+            )
+
+    def test_CCI_lean_output_short_source(self):
+        result = CCI(self.source, self.length, method="tema", output="array")
+
+        np.testing.assert_array_equal(result, np.full(6, np.nan))
+
+    def test_CCI_invalid_output(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            CCI(self.source, self.length, output="list")
+
+        self.assertEqual(
+            str(context.exception),
+            "output must be 'dataframe', 'series', or 'array', got 'list'.",
+        )
+
+
+class TestCCIState(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source["close"].iloc[:400].reset_index(drop=True)
+
+    def assert_matches_cci(self, source, length, method):
+        state = CCIState(length, 0.015, method)
+        result = np.array([state.update(value) for value in source])
+        expected = CCI(source, length, 0.015, method)
+
+        self.assertTrue(np.isnan(result[: length - 1]).all())
+        np.testing.assert_array_equal(
+            result[length - 1 :], expected["CCI"].to_numpy()
+        )
+        self.assertEqual(state.mad, expected["mad"].iloc[-1])
+        self.assertEqual(state.ma, expected["ma"].iloc[-1])
+
+    def test_cci_state(self):
+        for method in ["sma", "ema", "dema", "tema", "rma"]:
+            for length in [1, 5, 20]:
+                self.assert_matches_cci(self.source, length, method)
+
+    def test_cci_state_flat_window(self):
+        source = pd.Series([5.0] * 10 + [6.0, 4.0, 5.0])
+
+        self.assert_matches_cci(source, 5, "sma")
+        self.assert_matches_cci(source, 5, "ema")
+
+    def test_cci_state_invalid_arguments(self):
+        with self.assertRaises(InvalidArgumentError):
+            CCIState(0)
+
+        with self.assertRaises(InvalidArgumentError) as context:
+            CCIState(20, method="invalid_method")
+        self.assertEqual(
+            str(context.exception),
+            "method must be 'sma', 'ema', 'sema', or 'rma', got 'invalid_method'.",
+        )
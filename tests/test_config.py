@@ -0,0 +1,175 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+import src.tradingview_indicators as ta
+from src.tradingview_indicators.config import resolve_dtype
+from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source["close"].iloc[:300]
+
+    def tearDown(self):
+        ta.set_dtype("float64")
+
+    def test_default_dtype(self):
+        self.assertEqual(ta.get_dtype(), np.dtype("float64"))
+
+    def test_set_dtype(self):
+        ta.set_dtype(np.float32)
+        self.assertEqual(ta.get_dtype(), np.dtype("float32"))
+        self.assertEqual(resolve_dtype(), np.dtype("float32"))
+        self.assertEqual(resolve_dtype("float64"), np.dtype("float64"))
+
+    def test_invalid_dtype(self):
+        for dtype in ["float16", "int64", "invalid", None]:
+            with self.assertRaises(InvalidArgumentError):
+                ta.set_dtype(dtype)
+        with self.assertRaises(InvalidArgumentError):
+            resolve_dtype("int32")
+
+    def test_global_dtype(self):
+        ta.set_dtype("float32")
+
+        self.assertEqual(ta.ema(self.source, 14).dtype, np.float32)
+        self.assertEqual(ta.RSI(self.source, 14).dtype, np.float32)
+        self.assertEqual(
+            ta.ema(self.source, 14, dtype="float64").dtype, np.float64
+        )
+
+    def test_float32_deviation(self):
+        for function in [ta.sma, ta.ema, ta.rma]:
+            result = function(self.source, 14, dtype="float32")
+            expected = function(self.source, 14)
+
+            self.assertEqual(result.dtype, np.float32)
+            pd.testing.assert_series_equal(
+                result, expected, check_dtype=False, rtol=1e-6
+            )
+
+        bands = ta.bollinger_bands(self.source, 20, 2, dtype="float32")
+        expected_bands = ta.bollinger_bands(self.source, 20, 2)
+
+        self.assertTrue((bands.dtypes == np.float32).all())
+        pd.testing.assert_frame_equal(
+            bands, expected_bands, check_dtype=False, rtol=1e-6
+        )
+
+        for method in ["sma", "ema", "dema", "tema", "rma"]:
+            result = ta.RSI(self.source, 14, method, "float32")
+            expected = ta.RSI(self.source, 14, method)
+            np.testing.assert_allclose(result, expected, atol=1e-2)
+
+    def test_float32_global_indicators(self):
+        dataframe = pd.read_csv(
+            "example/BTCUSDT_1d_spot.csv", index_col=0
+        ).iloc[:300]
+
+        def indicators():
+            return {
+                "MACD": ta.MACD(self.source, 12, 26, 9),
+                "DMI": pd.concat(ta.DMI(dataframe).adx(), axis=1),
+                "TRIX": ta.TRIX(self.source),
+                "tsi": ta.tsi(self.source),
+                "SMIO": ta.SMIO(self.source),
+            }
+
+        expected = indicators()
+        ta.set_dtype("float32")
+        results = indicators()
+
+        macd_deviation = (results["MACD"] - expected["MACD"]).abs()
+        self.assertTrue((results["MACD"].dtypes == np.float32).all())
+        self.assertLess(
+            macd_deviation.div(self.source, axis=0).max().max(), 1e-6
+        )
+
+        self.assertTrue((results["DMI"].dtypes == np.float32).all())
+        self.assertLess(
+            (results["DMI"] - expected["DMI"]).abs().max().max(), 1e-4
+        )
+
+        for name, tolerance in [("TRIX", 2e-2), ("tsi", 1e-6), ("SMIO", 1e-6)]:
+            self.assertEqual(results[name].dtype, np.float32)
+            self.assertLess(
+                (results[name] - expected[name]).abs().max(), tolerance
+            )
+
+    def test_float32_global_float64_indicators(self):
+        dataframe = pd.read_csv(
+            "example/BTCUSDT_1d_spot.csv", index_col=0
+        ).iloc[:300]
+        ta.set_dtype("float32")
+
+        stoch = ta.stoch(
+            dataframe["close"], dataframe["high"], dataframe["low"], 14
+        )
+        self.assertEqual(stoch.dtype, np.float64)
+
+        cci = ta.CCI(self.source, method="ema")
+        self.assertEqual(cci["CCI"].dtype, np.float64)
+        self.assertEqual(
+            ta.CCI(self.source, output="series").dtype, np.float64
+        )
+
+        ichimoku = ta.Ichimoku(dataframe, 9, 26, 52, 26)
+        self.assertTrue((ichimoku.dtypes == np.float64).all())
+
+    def test_float32_batch(self):
+        block = np.column_stack([self.source, self.source * 2])
+
+        for function in [ta.sma, ta.ema, ta.rma]:
+            result = function(block, 14, dtype="float32")
+            self.assertEqual(result.dtype, np.float32)
+            np.testing.assert_allclose(
+                result, function(block, 14), rtol=1e-6
+            )
+
+        result = ta.sema(block, 14, 2, "float32")
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, ta.sema(block, 14, 2), rtol=1e-6)
+
+        result = ta.ma_bank(self.source.to_numpy(), [5, 10], "rma", "float32")
+        self.assertEqual(result.dtype, np.float32)
+
+    def test_float32_array(self):
+        values = self.source.to_numpy()
+
+        for name in ["sma", "ema", "rma"]:
+            result, _ = getattr(ta.array, name)(values, 14, "float32")
+            self.assertEqual(result.dtype, np.float32)
+
+        for name in ["RSI", "CCI", "tsi", "TRIX"]:
+            result, _ = getattr(ta.array, name)(values, dtype="float32")
+            expected, _ = getattr(ta.array, name)(values)
+
+            self.assertEqual(result.dtype, np.float32)
+            np.testing.assert_allclose(result, expected, atol=1e-1)
+
+        (macd, signal, histogram), _ = ta.array.MACD(
+            values, 12, 26, 9, dtype="float32"
+        )
+        self.assertEqual(macd.dtype, np.float32)
+        self.assertEqual(signal.dtype, np.float32)
+        self.assertEqual(histogram.dtype, np.float32)
+
+    def test_float32_ema_missing_values(self):
+        source = self.source.copy()
+        source.iloc[50] = np.nan
+
+        result = ta.ema(source, 14, dtype="float32")
+        self.assertEqual(result.dtype, np.float32)
+        pd.testing.assert_series_equal(
+            result, ta.ema(source, 14), check_dtype=False, rtol=1e-6
+        )
+
+    def test_float32_rma_pandas(self):
+        result = ta.rma(self.source, 14, "pandas", "float32")
+        self.assertEqual(result.dtype, np.float32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import numpy as np
+
+from src.tradingview_indicators import (
+    EMAState,
+    RMAState,
+    RSIState,
+    CrossSectionalEMA,
+    CrossSectionalRMA,
+    CrossSectionalRSI,
+    CrossSectionalEngine,
+)
+from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
+
+
+def expected_values(state, closes: np.ndarray) -> np.ndarray:
+    """Feed the valid closes to a single-symbol state."""
+    values = np.full(len(closes), np.nan)
+    value = np.nan
+
+    for idx, close in enumerate(closes):
+        if not np.isnan(close):
+            value = state.update(close)
+        values[idx] = value
+
+    return values
+
+
+class TestCrossSectional(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.n_bars = 120
+        self.n_symbols = 12
+
+        self.closes = np.round(
+            100 * np.exp(np.cumsum(
+                rng.normal(0, 0.01, (self.n_bars, self.n_symbols)), axis=0
+            )),
+            1,
+        )
+        for col in range(self.n_symbols):
+            self.closes[: col * 5, col] = np.nan
+            self.closes[rng.random(self.n_bars) < 0.05, col] = np.nan
+
+        self.closes[:, 0] = 100.0
+        self.closes[60:, 1] = self.closes[59, 1]
+
+    def assert_matches_states(self, results, state_factory):
+        for col in range(self.n_symbols):
+            np.testing.assert_array_equal(
+                results[:, col],
+                expected_values(state_factory(), self.closes[:, col]),
+            )
+
+    def test_cross_sectional_ema(self):
+        for length in [1, 2, 9]:
+            state = CrossSectionalEMA(self.n_symbols, length)
+            results = np.array([state.update(row) for row in self.closes])
+
+            self.assert_matches_states(results, lambda: EMAState(length))
+
+    def test_cross_sectional_rma(self):
+        state = CrossSectionalRMA(self.n_symbols, 14)
+        results = np.array([state.update(row) for row in self.closes])
+
+        self.assert_matches_states(results, lambda: RMAState(14))
+
+    def test_cross_sectional_rsi(self):
+        for ma_method in ["sma", "ema", "rma"]:
+            state = CrossSectionalRSI(self.n_symbols, 5, ma_method)
+            results = np.array([state.update(row) for row in self.closes])
+
+            self.assert_matches_states(
+                results, lambda: RSIState(5, ma_method)
+            )
+
+    def test_engine(self):
+        engine = CrossSectionalEngine(self.n_symbols, [9], [14], [14])
+        results = [engine.update(row) for row in self.closes]
+
+        self.assertEqual(list(results[0]), ["ema_9", "rma_14", "RSI_14"])
+        np.testing.assert_array_equal(
+            engine.count, (~np.isnan(self.closes)).sum(axis=0)
+        )
+        self.assert_matches_states(
+            np.array([result["RSI_14"] for result in results]),
+            lambda: RSIState(14),
+        )
+
+    def test_add_symbols(self):
+        engine = CrossSectionalEngine(2, [3], [3], [3], "sma")
+        for row in self.closes[:50, :2]:
+            engine.update(row)
+
+        engine.add_symbols(1)
+        self.assertEqual(engine.n_symbols, 3)
+
+        late = CrossSectionalEngine(1, [3], [3], [3], "sma")
+        for row in self.closes[50:, :3]:
+            result = engine.update(row)
+            expected = late.update(row[2:])
+
+            for name, values in expected.items():
+                np.testing.assert_array_equal(result[name][2:], values)
+
+    def test_reset(self):
+        engine = CrossSectionalEngine(2, [3], [3], [3], "sma")
+        for row in self.closes[:50, :2]:
+            engine.update(row)
+
+        engine.reset([1])
+        self.assertEqual(engine.count[1], 0)
+
+        fresh = CrossSectionalEngine(1, [3], [3], [3], "sma")
+        for row in self.closes[50:, :2]:
+            result = engine.update(row)
+            expected = fresh.update(row[1:])
+
+            for name, values in expected.items():
+                np.testing.assert_array_equal(result[name][1:], values)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(InvalidArgumentError):
+            CrossSectionalEMA(3, 0)
+
+        with self.assertRaises(InvalidArgumentError) as context:
+            CrossSectionalRSI(3, 14, "dema")
+        self.assertEqual(
+            str(context.exception),
+            "ma_method must be 'sma', 'ema', or 'rma', got 'dema'.",
+        )
+
+        with self.assertRaises(InvalidArgumentError) as context:
+            CrossSectionalRMA(3, 14).update(np.ones(4))
+        self.assertEqual(
+            str(context.exception), "values must have shape (3,), got (4,)."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
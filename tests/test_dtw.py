@@ -0,0 +1,137 @@
+import unittest
+
+import fastdtw
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators.dtw import banded_dtw, fast_dtw
+from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
+
+
+class TestFastDTW(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.x = rng.normal(0, 1, 300).cumsum()
+        self.y = rng.normal(0, 1, 250).cumsum()
+
+    def test_fast_dtw_matches_fastdtw(self):
+        for radius in [1, 3]:
+            distance, path = fast_dtw(self.x, self.y, radius)
+            expected_distance, expected_path = fastdtw.fastdtw(
+                self.x, self.y, radius
+            )
+
+            self.assertEqual(distance, expected_distance)
+            np.testing.assert_array_equal(path, expected_path)
+
+    def test_fast_dtw_without_radius(self):
+        distance, path = fast_dtw(self.x, self.y, 0)
+
+        np.testing.assert_array_equal(path[0], [0, 0])
+        np.testing.assert_array_equal(path[-1], [299, 249])
+        self.assertAlmostEqual(
+            distance, np.abs(self.x[path[:, 0]] - self.y[path[:, 1]]).sum()
+        )
+
+    def test_fast_dtw_with_ties(self):
+        rng = np.random.default_rng(seed=7)
+        x = rng.integers(0, 3, 64).astype(float)
+        y = rng.integers(0, 3, 81).astype(float)
+
+        distance, path = fast_dtw(x, y)
+        expected_distance, expected_path = fastdtw.fastdtw(x, y)
+
+        self.assertEqual(distance, expected_distance)
+        np.testing.assert_array_equal(path, expected_path)
+
+    def test_fast_dtw_series(self):
+        distance, path = fast_dtw(pd.Series(self.x), pd.Series(self.y))
+
+        self.assertEqual(distance, fast_dtw(self.x, self.y)[0])
+        self.assertEqual(path.dtype, np.int64)
+        self.assertEqual(path.shape[1], 2)
+
+    def test_fast_dtw_empty(self):
+        distance, path = fast_dtw([], [])
+        self.assertEqual(distance, 0.0)
+        self.assertEqual(path.shape, (0, 2))
+
+        distance, path = fast_dtw(self.x, [])
+        self.assertEqual(distance, np.inf)
+        self.assertEqual(path.shape, (0, 2))
+
+    def test_fast_dtw_invalid_radius(self):
+        with self.assertRaises(InvalidArgumentError):
+            fast_dtw(self.x, self.y, -1)
+
+    def test_fast_dtw_invalid_values(self):
+        for value in [np.nan, np.inf]:
+            x = self.x.copy()
+            x[10] = value
+
+            with self.assertRaises(InvalidArgumentError) as context:
+                fast_dtw(x, self.y)
+
+            self.assertEqual(
+                str(context.exception),
+                "x and y must not contain NaN or infinite values.",
+            )
+
+
+class TestBandedDTW(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.x = rng.normal(0, 1, 200).cumsum()
+        self.y = rng.normal(0, 1, 170).cumsum()
+
+    def test_banded_dtw_full_band_is_exact(self):
+        distance, path = banded_dtw(self.x, self.y, 200)
+        expected_distance, expected_path = fastdtw.dtw(self.x, self.y)
+
+        self.assertEqual(distance, expected_distance)
+        np.testing.assert_array_equal(path, expected_path)
+
+    def test_banded_dtw_path(self):
+        for radius in [0, 1, 5, 50]:
+            distance, path = banded_dtw(self.x, self.y, radius)
+
+            np.testing.assert_array_equal(path[0], [0, 0])
+            np.testing.assert_array_equal(path[-1], [199, 169])
+            steps = np.diff(path, axis=0)
+            self.assertTrue(((steps == 0) | (steps == 1)).all())
+            self.assertTrue((steps.sum(axis=1) > 0).all())
+            self.assertAlmostEqual(
+                distance, np.abs(self.x[path[:, 0]] - self.y[path[:, 1]]).sum()
+            )
+
+    def test_banded_dtw_narrow_band_is_not_better(self):
+        exact, _ = banded_dtw(self.x, self.y, 200)
+        narrow, _ = banded_dtw(self.x, self.y, 5)
+
+        self.assertGreaterEqual(narrow, exact)
+
+    def test_banded_dtw_single_value(self):
+        distance, path = banded_dtw([2.0], self.y[:3])
+
+        self.assertEqual(distance, np.abs(2.0 - self.y[:3]).sum())
+        np.testing.assert_array_equal(path, [[0, 0], [0, 1], [0, 2]])
+
+    def test_banded_dtw_empty(self):
+        distance, path = banded_dtw([], self.y)
+        self.assertEqual(distance, np.inf)
+        self.assertEqual(path.shape, (0, 2))
+
+    def test_banded_dtw_invalid_radius(self):
+        with self.assertRaises(InvalidArgumentError):
+            banded_dtw(self.x, self.y, -1)
+
+    def test_banded_dtw_invalid_values(self):
+        y = self.y.copy()
+        y[0] = np.nan
+
+        with self.assertRaises(InvalidArgumentError):
+            banded_dtw(self.x, y)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators.ichimoku import Ichimoku
+from src.tradingview_indicators.ichimoku import Ichimoku, IchimokuState
+from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 
 class TestIchimoku(unittest.TestCase):
@@ -488,6 +489,123 @@ class TestIchimoku(unittest.TestCase):
 
         pd.testing.assert_frame_equal(result, ref_values)
 
+    def test_ichimoku_matches_rolling(self):
+        df = self.df_lowercase.copy()
+        df.loc[40, "high"] = np.nan
+
+        for periods in [(9, 26, 52), (9, 9, 30), (1, 5, 3)]:
+            result = Ichimoku(df, *periods, self.displacement)
+
+            for column, length in zip(
+                ["conversion_line", "base_line", "lead_line2"], periods
+            ):
+                expected = (
+                    df["high"].rolling(length).max()
+                    + df["low"].rolling(length).min()
+                ) / 2
+
+                pd.testing.assert_series_equal(
+                    result[column], expected.rename(column)
+                )
+
+    def test_ichimoku_displacement_shifts(self):
+        for displacement in [1, 26, 150, 0, -3]:
+            result = Ichimoku(self.df_lowercase, 9, 26, 52, displacement)
+
+            pd.testing.assert_series_equal(
+                result["leading_span_a"],
+                result["lead_line1"]
+                .shift(displacement - 1)
+                .rename("leading_span_a"),
+            )
+            pd.testing.assert_series_equal(
+                result["lagging_span"],
+                self.df_lowercase["close"]
+                .shift(-displacement + 1)
+                .rename("lagging_span"),
+            )
+
+    def test_ichimoku_components(self):
+        result = Ichimoku(self.df_lowercase, 9, 26, 52, 26)
+
+        for components in [
+            ["leading_span_b", "leading_span_a"],
+            ["lagging_span"],
+            ["base_line", "lagging_span", "lead_line2"],
+        ]:
+            pd.testing.assert_frame_equal(
+                Ichimoku(self.df_lowercase, 9, 26, 52, 26, components),
+                result[components],
+            )
+
+    def test_ichimoku_invalid_component(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            Ichimoku(self.df_lowercase, 9, 26, 52, 26, ["kijun"])
+
+        self.assertIn("got 'kijun'.", str(context.exception))
+
+
+class TestIchimokuState(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source.iloc[:200].reset_index(drop=True)
+        self.source.loc[120, "high"] = np.nan
+
+    def assert_matches_ichimoku(self, *periods):
+        displacement = periods[-1]
+        expected = Ichimoku(self.source, *periods)
+        lagging_span = expected["lagging_span"].to_numpy()
+        lead_line1 = expected["lead_line1"].to_numpy()
+        lead_line2 = expected["lead_line2"].to_numpy()
+
+        state = IchimokuState(*periods)
+
+        for idx, bar in enumerate(
+            self.source[["high", "low", "close"]].to_numpy()
+        ):
+            result = state.update(*bar)
+            lagging_idx = idx - displacement + 1
+
+            self.assertEqual(state.count, idx + 1)
+            np.testing.assert_array_equal(
+                [result[column] for column in expected.columns.drop(
+                    "lagging_span"
+                )],
+                expected.drop(columns="lagging_span").iloc[idx].to_numpy(),
+            )
+            np.testing.assert_array_equal(
+                result["lagging_span"],
+                lagging_span[lagging_idx] if lagging_idx >= 0 else np.nan,
+            )
+
+            future_a, future_b = state.future_cloud()
+            start = max(idx - displacement + 2, 0)
+            np.testing.assert_array_equal(
+                future_a[len(future_a) - (idx + 1 - start):],
+                lead_line1[start: idx + 1],
+            )
+            np.testing.assert_array_equal(
+                future_b[len(future_b) - (idx + 1 - start):],
+                lead_line2[start: idx + 1],
+            )
+
+    def test_ichimoku_state(self):
+        self.assert_matches_ichimoku(9, 26, 52, 26)
+
+    def test_ichimoku_state_short_periods(self):
+        self.assert_matches_ichimoku(2, 3, 5, 2)
+
+    def test_ichimoku_state_no_displacement(self):
+        self.assert_matches_ichimoku(9, 26, 52, 1)
+
+    def test_invalid_displacement(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            IchimokuState(9, 26, 52, 0)
+        self.assertEqual(
+            str(context.exception),
+            "displacement must be greater than 0, got '0'.",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,468 @@
+import importlib
+import inspect
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import fastdtw
+import numba
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators import kernels
+from src.tradingview_indicators.moving_average import ema
+from src.tradingview_indicators.RSI import _rsi_series
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.source = rng.normal(0, 10, 500)
+        self.length = 14
+        self.kernels = kernels
+
+    def test_sma_seed_matches_pandas(self):
+        sources = [
+            self.source,
+            np.full(20, 0.1),
+            -np.abs(self.source),
+            np.abs(self.source),
+        ]
+
+        for source in sources:
+            expected = (
+                pd.Series(source)
+                .rolling(self.length)
+                .mean()
+                .iloc[self.length - 1]
+            )
+            self.assertEqual(
+                self.kernels.sma_seed(source, self.length),
+                expected,
+            )
+
+    def test_sma_seed_nan(self):
+        source = self.source.copy()
+        source[3] = np.nan
+
+        self.assertTrue(np.isnan(self.kernels.sma_seed(source, self.length)))
+
+    def test_rma_kernel(self):
+        alpha = 1 / self.length
+        expected = [
+            pd.Series(self.source).rolling(self.length).mean()
+            .iloc[self.length - 1]
+        ]
+
+        for value in self.source[self.length:].tolist():
+            expected.append(alpha * value + (1 - alpha) * expected[-1])
+
+        result = self.kernels.rma_kernel(self.source, self.length)
+
+        np.testing.assert_array_equal(result, np.array(expected))
+
+    def test_rma_kernel_short_source(self):
+        result = self.kernels.rma_kernel(self.source[:5], self.length)
+
+        self.assertEqual(result.shape, (0,))
+
+    def test_ema_kernel(self):
+        length = 5
+        source = pd.Series(self.source)
+        sma_series = source.rolling(length).mean()[:length]
+        expected = (
+            pd.concat([sma_series, source[length:]])
+            .ewm(span=length, adjust=False)
+            .mean()
+        )
+
+        result = self.kernels.ema_kernel(self.source, length)
+
+        np.testing.assert_array_equal(result, expected.to_numpy())
+
+    def test_seeded_update_rma(self):
+        state = self.kernels.new_seeded_state(1)[0]
+        result = [
+            self.kernels.seeded_update(
+                state, value, self.length, 1 / self.length, False
+            )
+            for value in self.source
+        ]
+
+        self.assertTrue(np.isnan(result[: self.length - 1]).all())
+        np.testing.assert_array_equal(
+            result[self.length - 1 :],
+            self.kernels.rma_kernel(self.source, self.length),
+        )
+
+    def test_seeded_update_nan_seed(self):
+        state = self.kernels.new_seeded_state(1)[0]
+        source = [1.0, np.nan, 3.0, 4.0, 4.0]
+        result = [
+            self.kernels.seeded_update(state, value, 3, 0.5, True)
+            for value in source
+        ]
+
+        np.testing.assert_array_equal(
+            result, [np.nan, np.nan, np.nan, 4.0, 4.0]
+        )
+
+    def test_seeded_update_ema_missing_value(self):
+        state = self.kernels.new_seeded_state(1)[0]
+        source = [2.0, 2.0, 2.0, np.nan, 3.0]
+        result = [
+            self.kernels.seeded_update(state, value, 3, 0.25, True)
+            for value in source
+        ]
+
+        np.testing.assert_array_equal(
+            result,
+            [np.nan, np.nan, 2.0, 2.0, (0.5625 * 2 + 0.25 * 3) / 0.8125],
+        )
+
+    def test_sema_kernel(self):
+        source = pd.Series(self.source[:120].round(1))
+        source[60:70] = source[59]
+
+        for smooth in range(1, 5):
+            emas = [ema(source, self.length)]
+            for _ in range(1, smooth):
+                emas.append(ema(emas[-1], self.length))
+
+            emas_df = pd.concat(emas, axis=1)
+            expected = (
+                emas_df[emas_df.columns[:-1]].diff(axis=1).sum(axis=1)
+                * -1
+                * smooth
+                + emas_df[emas_df.columns[-1]]
+            )
+
+            result = self.kernels.sema_kernel(
+                source.to_numpy(), self.length, smooth
+            )
+
+            np.testing.assert_array_equal(
+                result,
+                expected.reindex(source.index).to_numpy(),
+            )
+
+    def test_sma_batch_kernel(self):
+        source = self.source[:200].reshape(50, 4).round(1)
+        source[:5, 1] = np.nan
+        source[20, 2] = np.nan
+        source[30:40, 3] = source[29, 3]
+
+        result = self.kernels.sma_batch_kernel(source, 5)
+
+        np.testing.assert_array_equal(
+            result,
+            pd.DataFrame(source).rolling(5).mean().to_numpy(),
+        )
+
+    def test_seeded_batch_kernel(self):
+        source = self.source[:200].reshape(50, 4)
+        source[:7, 1] = np.nan
+
+        result = self.kernels.seeded_batch_kernel(source, 5, 1 / 5, False)
+
+        for col, first_valid in enumerate([0, 7, 0, 0]):
+            np.testing.assert_array_equal(
+                result[first_valid + 4 :, col],
+                self.kernels.rma_kernel(source[first_valid:, col], 5),
+            )
+            self.assertTrue(np.isnan(result[: first_valid + 4, col]).all())
+
+    def test_sema_batch_kernel(self):
+        source = self.source[:200].reshape(50, 4)
+        source[:7, 1] = np.nan
+
+        result = self.kernels.sema_batch_kernel(source, 5, 3)
+
+        for col, first_valid in enumerate([0, 7, 0, 0]):
+            np.testing.assert_array_equal(
+                result[first_valid:, col],
+                self.kernels.sema_kernel(source[first_valid:, col], 5, 3),
+            )
+
+    def test_sma_bank_kernel(self):
+        source = self.source[:150].copy()
+        source[60] = np.nan
+        lengths = np.array([2, 5, 14])
+
+        result = self.kernels.sma_bank_kernel(source, lengths)
+
+        for col, length in enumerate(lengths):
+            np.testing.assert_allclose(
+                result[:, col],
+                pd.Series(source).rolling(length).mean().to_numpy(),
+                rtol=1e-12,
+            )
+
+    def test_seeded_bank_kernel(self):
+        source = self.source[:150].copy()
+        source[2] = np.nan
+        source[60] = np.nan
+        lengths = np.array([2, 5, 14])
+
+        for is_ema in [True, False]:
+            result = self.kernels.seeded_bank_kernel(source, lengths, is_ema)
+
+            for col, length in enumerate(lengths):
+                alpha = (
+                    1 / (1 + (length - 1) / 2) if is_ema else 1 / length
+                )
+                state = self.kernels.new_seeded_state(1)[0]
+                expected = [
+                    self.kernels.seeded_update(
+                        state, value, length, alpha, is_ema
+                    )
+                    for value in source
+                ]
+                np.testing.assert_array_equal(result[:, col], expected)
+
+    def test_rsi_kernel(self):
+        source = self.source[:150].cumsum() + 1000
+        source[40:60] = source[40]
+        methods = ["sma", "ema", "dema", "tema", "rma"]
+
+        for code, method in enumerate(methods):
+            expected = _rsi_series(
+                pd.Series(source), 5, method, np.dtype("float64")
+            )
+            result = self.kernels.rsi_kernel(source, 5, code)
+
+            np.testing.assert_array_equal(
+                result[expected.index[0]:], expected.to_numpy()
+            )
+            self.assertTrue(np.isnan(result[:expected.index[0]]).all())
+
+    def test_rsi_kernel_signed_zeros(self):
+        source = np.tile([0.0, -0.0, 0.0, 1.0, -0.0], 10)
+        expected = _rsi_series(
+            pd.Series(source), 3, "sma", np.dtype("float64")
+        )
+
+        result = self.kernels.rsi_kernel(source, 3, self.kernels.MA_SMA)
+        np.testing.assert_array_equal(result[3:], expected.to_numpy())
+
+    def test_rsi_kernel_missing_values(self):
+        source = self.source[:60].cumsum()
+        source[30] = np.nan
+
+        result = self.kernels.rsi_kernel(source, 5, self.kernels.MA_SMA)
+
+        self.assertTrue(np.isnan(result[30:36]).all())
+        self.assertFalse(np.isnan(result[36:]).any())
+
+    def test_divide(self):
+        self.assertEqual(self.kernels.divide(1.0, 4.0), 0.25)
+        self.assertEqual(self.kernels.divide(1.0, 0.0), np.inf)
+        self.assertEqual(self.kernels.divide(-1.0, 0.0), -np.inf)
+        self.assertEqual(self.kernels.divide(1.0, -0.0), -np.inf)
+        self.assertTrue(np.isnan(self.kernels.divide(0.0, 0.0)))
+        self.assertTrue(np.isnan(self.kernels.divide(np.nan, 0.0)))
+
+    def test_rolling_extremes_kernel(self):
+        high = np.round(self.source[:150], 0)
+        high[[10, 80]] = np.nan
+        high[[40, 41]] = [0.0, -0.0]
+        high[120] = np.inf
+        low = high[::-1].copy()
+        lengths = np.array([1, 3, 14, 3])
+
+        highest, lowest = self.kernels.rolling_extremes_kernel(
+            high, low, lengths
+        )
+
+        for col, length in enumerate(lengths):
+            np.testing.assert_array_equal(
+                highest[:, col],
+                pd.Series(high).rolling(length).max().to_numpy(),
+            )
+            np.testing.assert_array_equal(
+                lowest[:, col],
+                pd.Series(low).rolling(length).min().to_numpy(),
+            )
+
+    def test_mean_mad_kernel(self):
+        source = self.source[:150]
+
+        for length in [1, 5, 20]:
+            window = np.lib.stride_tricks.sliding_window_view(source, length)
+            expected_mean = window.mean(axis=1)
+            expected_mad = np.mean(
+                np.abs(window - expected_mean[:, np.newaxis]), axis=1
+            )
+
+            mean, mad = self.kernels.mean_mad_kernel(source, length)
+
+            np.testing.assert_allclose(mean, expected_mean, rtol=1e-12)
+            np.testing.assert_allclose(mad, expected_mad, rtol=1e-12)
+            self.assertEqual(
+                self.kernels.window_mean_mad(source[-length:]),
+                (mean[-1], mad[-1]),
+            )
+
+        self.assertEqual(
+            self.kernels.mean_mad_kernel(source[:3], 5)[1].shape, (0,)
+        )
+
+    def test_rolling_moments_kernel(self):
+        source = self.source[:150] + 1e6
+        source[[10, 80]] = np.nan
+        source[120] = np.inf
+        source[90:100] = 1e6 + 3.0
+        lengths = np.array([1, 3, 14, 3])
+
+        means, deviations = self.kernels.rolling_moments_kernel(
+            source, lengths, 1
+        )
+
+        for col, length in enumerate(lengths):
+            rolling = pd.Series(source).rolling(length)
+            np.testing.assert_allclose(
+                means[:, col], rolling.mean().to_numpy(), rtol=1e-14
+            )
+            np.testing.assert_allclose(
+                deviations[:, col], rolling.std().to_numpy(), rtol=1e-8
+            )
+
+        self.assertTrue(np.all(deviations[99, [1, 3]] == 0.0))
+
+        drifting = np.cumsum(np.tile(self.source, 10)) * 1e3
+        means, deviations = self.kernels.rolling_moments_kernel(
+            drifting, np.array([5, 300]), 0
+        )
+        window = np.lib.stride_tricks.sliding_window_view(drifting, 5)
+
+        np.testing.assert_allclose(
+            deviations[4:, 0], window.std(axis=1), rtol=1e-10
+        )
+        np.testing.assert_array_equal(
+            deviations[:, :1],
+            self.kernels.rolling_moments_kernel(
+                drifting, np.array([5]), 0
+            )[1],
+        )
+
+    def test_rolling_moments_kernel_without_values(self):
+        means, deviations = self.kernels.rolling_moments_kernel(
+            np.full(40, np.nan), np.array([2]), 1
+        )
+
+        self.assertTrue(np.isnan(means).all())
+        self.assertTrue(np.isnan(deviations).all())
+
+    def test_bands_kernel(self):
+        bases = self.source[:40].reshape(20, 2)
+        deviations = np.abs(self.source[40:80]).reshape(20, 2)
+        mults = np.array([1.0, 2.5])
+
+        output = self.kernels.bands_kernel(
+            bases, deviations, mults, np.empty((20, 4, 3))
+        )
+
+        for col in range(2):
+            for mult_idx, mult in enumerate(mults):
+                band_set = output[:, col * 2 + mult_idx]
+                np.testing.assert_array_equal(band_set[:, 0], bases[:, col])
+                np.testing.assert_array_equal(
+                    band_set[:, 1], bases[:, col] + mult * deviations[:, col]
+                )
+                np.testing.assert_array_equal(
+                    band_set[:, 2], bases[:, col] - mult * deviations[:, col]
+                )
+
+    def test_expand_window_kernel(self):
+        path = np.array([[0, 0], [1, 1], [1, 2], [2, 3]])
+
+        lo, hi = self.kernels.expand_window_kernel(path, 6, 8, 0)
+        np.testing.assert_array_equal(lo, [0, 0, 2, 2, 6, 6])
+        np.testing.assert_array_equal(hi, [1, 1, 5, 5, 7, 7])
+
+        lo, hi = self.kernels.expand_window_kernel(path, 6, 8, 1)
+        np.testing.assert_array_equal(lo, np.zeros(6))
+        np.testing.assert_array_equal(hi, np.full(6, 7))
+
+    def test_dtw_window_kernel(self):
+        x = self.source[:30]
+        y = self.source[30:55]
+
+        distance, path = self.kernels.dtw_window_kernel(
+            x, y, np.zeros(30, dtype=np.int64), np.full(30, 24)
+        )
+        expected_distance, expected_path = fastdtw.dtw(x, y)
+
+        self.assertEqual(distance, expected_distance)
+        np.testing.assert_array_equal(path, expected_path)
+
+    def test_dtw_window_kernel_rounding_ties(self):
+        x = np.array([0.5, 1.0, 0.5])
+        y = np.array([0.0, 1e16])
+
+        distance, path = self.kernels.dtw_window_kernel(
+            x, y, np.zeros(3, dtype=np.int64), np.ones(3, dtype=np.int64)
+        )
+
+        self.assertEqual(distance, fastdtw.dtw(x, y)[0])
+        np.testing.assert_array_equal(path, [[0, 0], [1, 0], [2, 1]])
+
+
+class TestKernelsWithoutJit(TestKernels):
+    # the interpreted kernels let coverage trace the compiled code
+    def setUp(self):
+        super().setUp()
+        with mock.patch.object(numba.config, "DISABLE_JIT", True):
+            self.kernels = importlib.reload(kernels)
+
+    def tearDown(self):
+        importlib.reload(kernels)
+
+    def test_njit_disabled(self):
+        self.assertTrue(inspect.isfunction(self.kernels.sma_seed))
+        self.assertTrue(inspect.isfunction(self.kernels.window_mean_mad))
+
+
+class TestImportNames(unittest.TestCase):
+    def run_sma(self, module, cwd, pythonpath):
+        env = dict(os.environ, PYTHONPATH=pythonpath)
+        env.pop(kernels.CACHE_VARIABLE, None)
+        script = (
+            "import pandas as pd\n"
+            f"from {module} import sma\n"
+            "print(sma(pd.Series(range(30), dtype=float), 5).iloc[-1])"
+        )
+        return subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    def test_import_under_both_names(self):
+        root = Path(__file__).resolve().parents[1]
+
+        with tempfile.TemporaryDirectory() as directory:
+            for module, cwd, pythonpath in [
+                ("src.tradingview_indicators", root, str(root)),
+                ("tradingview_indicators", directory, str(root / "src")),
+                ("src.tradingview_indicators", root, str(root)),
+            ]:
+                self.assertEqual(
+                    self.run_sma(module, cwd, pythonpath), "27.0\n"
+                )
+
+    def test_cache_opt_in(self):
+        try:
+            with mock.patch.dict(os.environ, {kernels.CACHE_VARIABLE: "1"}):
+                self.assertTrue(importlib.reload(kernels).NUMBA_CACHE)
+
+            with mock.patch.dict(os.environ, {kernels.CACHE_VARIABLE: ""}):
+                self.assertFalse(importlib.reload(kernels).NUMBA_CACHE)
+        finally:
+            importlib.reload(kernels)
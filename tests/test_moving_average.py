@@ -2,7 +2,17 @@ import unittest
 
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators.moving_average import sma, ema, sema, rma
+from src.tradingview_indicators.moving_average import (
+    sma,
+    ema,
+    sema,
+    rma,
+    ma_bank,
+    SMAState,
+    RMAState,
+    EMAState,
+    SEMAState,
+)
 from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 
@@ -35,6 +45,29 @@ class TestMovingAverage(unittest.TestCase):
 
         pd.testing.assert_series_equal(result, expected_result)
 
+    def test_ema_missing_values(self):
+        source = self.source.astype("float64")
+        source[7] = np.nan
+
+        sma_series = source.rolling(self.length).mean()[: self.length]
+        expected_result = (
+            pd.concat([sma_series, source[self.length :]])
+            .ewm(span=self.length, adjust=False)
+            .mean()
+            .dropna()
+        )
+
+        result = ema(source, self.length)
+
+        pd.testing.assert_series_equal(result, expected_result)
+
+    def test_ema_short_source(self):
+        result = ema(self.source[:3], self.length)
+        self.assertTrue(result.empty)
+
+        result = rma(self.source[:3], self.length, method="pandas")
+        self.assertTrue(result.isna().all())
+
     def test_sema(self):
         smooth = 2
 
@@ -90,3 +123,277 @@ class TestMovingAverage(unittest.TestCase):
             str(context.exception),
             "method must be 'numpy' or 'pandas', got 'invalid'.",
         )
+
+
+class TestRMAState(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.source = pd.Series(rng.normal(100, 5, 300))
+        self.length = 14
+
+    def test_rma_state_matches_rma(self):
+        state = RMAState(self.length)
+        result = [state.update(value) for value in self.source]
+
+        self.assertTrue(np.isnan(result[: self.length - 1]).all())
+        np.testing.assert_array_equal(
+            result[self.length - 1 :],
+            rma(self.source, self.length).to_numpy(),
+        )
+        self.assertEqual(state.count, len(self.source))
+
+    def test_rma_state_constant_and_negative_values(self):
+        sources = [
+            pd.Series(np.full(30, 0.1)),
+            pd.Series(-np.abs(self.source)),
+        ]
+
+        for source in sources:
+            state = RMAState(self.length)
+            result = [state.update(value) for value in source]
+
+            np.testing.assert_array_equal(
+                result[self.length - 1 :],
+                rma(source, self.length).to_numpy(),
+            )
+
+    def test_rma_state_nan_seed(self):
+        state = RMAState(3)
+        result = [state.update(value) for value in [1.0, np.nan, 2.0, 3.0]]
+
+        self.assertTrue(np.isnan(result).all())
+
+    def test_rma_state_invalid_length(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            RMAState(0)
+        self.assertEqual(
+            str(context.exception),
+            "length must be greater than 0, got '0'.",
+        )
+
+
+class TestEMAState(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.source = pd.Series(rng.normal(100, 5, 300).round(1))
+        self.length = 14
+
+    def test_ema_state_matches_ema(self):
+        for length in [1, 2, self.length, 50]:
+            state = EMAState(length)
+            result = [state.update(value) for value in self.source]
+
+            self.assertTrue(np.isnan(result[: length - 1]).all())
+            np.testing.assert_array_equal(
+                result[length - 1 :],
+                ema(self.source, length).to_numpy(),
+            )
+
+    def test_ema_state_constant_source(self):
+        source = pd.Series(np.full(30, 0.1))
+        state = EMAState(self.length)
+        result = [state.update(value) for value in source]
+
+        np.testing.assert_array_equal(
+            result[self.length - 1 :],
+            ema(source, self.length).to_numpy(),
+        )
+
+    def test_ema_state_missing_values(self):
+        source = self.source.copy()
+        source[[3, 40, 41, 120]] = np.nan
+        source[150:160] = source[149]
+
+        state = EMAState(self.length)
+        result = [state.update(value) for value in source]
+
+        sma_series = source.rolling(self.length).mean()[: self.length]
+        expected = (
+            pd.concat([sma_series, source[self.length :]])
+            .ewm(span=self.length, adjust=False)
+            .mean()
+        )
+
+        np.testing.assert_array_equal(
+            result[self.length - 1 :],
+            expected.to_numpy()[self.length - 1 :],
+        )
+
+
+class TestSMAState(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.source = pd.Series(rng.normal(0, 50, 500).round(2))
+        self.length = 14
+
+    def test_sma_state_matches_sma(self):
+        state = SMAState(self.length)
+        result = [state.update(value) for value in self.source]
+
+        self.assertTrue(np.isnan(result[: self.length - 1]).all())
+        np.testing.assert_array_equal(
+            result[self.length - 1 :],
+            sma(self.source, self.length).to_numpy(),
+        )
+        self.assertEqual(state.value, result[-1])
+
+    def test_sma_state_constant_and_missing_values(self):
+        source = self.source.copy()
+        source[[3, 40, 41, 120]] = np.nan
+        source[150:180] = source[149]
+        source[300:320] = -np.abs(source[300:320])
+
+        state = SMAState(self.length)
+        result = [state.update(value) for value in source]
+
+        np.testing.assert_array_equal(
+            result,
+            source.rolling(self.length).mean().to_numpy(),
+        )
+
+    def test_sma_state_invalid_length(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            SMAState(-1)
+        self.assertEqual(
+            str(context.exception),
+            "length must be greater than 0, got '-1'.",
+        )
+
+
+class TestSEMAState(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.source = pd.Series(rng.normal(100, 5, 300).round(1))
+
+    def test_sema_state_matches_sema(self):
+        for length, smooth in [(1, 2), (5, 2), (14, 3), (9, 4)]:
+            state = SEMAState(length, smooth)
+            result = np.array([state.update(value) for value in self.source])
+            expected = sema(self.source, length, smooth)
+
+            self.assertTrue(np.isnan(result[: expected.index[0]]).all())
+            np.testing.assert_array_equal(
+                result[expected.index[0]:], expected.to_numpy()
+            )
+            self.assertEqual(state.count, len(self.source))
+
+    def test_sema_state_invalid_length(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            SEMAState(0, 2)
+        self.assertEqual(
+            str(context.exception),
+            "length must be greater than 0, got '0'.",
+        )
+
+
+class TestBatchMovingAverage(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        values = rng.normal(100, 5, (120, 4)).round(2)
+        values[:10, 1] = np.nan
+        values[:35, 3] = np.nan
+
+        self.source = pd.DataFrame(
+            values,
+            columns=["BTC", "ETH", "SOL", "NEW"],
+            index=pd.date_range("2024-01-01", periods=120),
+        )
+        self.length = 9
+
+    def assert_matches_1d(self, result, function, *args):
+        self.assertIsInstance(result, pd.DataFrame)
+        pd.testing.assert_index_equal(result.index, self.source.index)
+        pd.testing.assert_index_equal(result.columns, self.source.columns)
+
+        for column in self.source.columns:
+            expected = function(self.source[column].dropna(), *args)
+            np.testing.assert_array_equal(
+                result[column].dropna().to_numpy(),
+                expected.to_numpy(),
+            )
+            pd.testing.assert_index_equal(
+                result[column].dropna().index,
+                expected.index,
+            )
+
+    def test_batch_sma(self):
+        result = sma(self.source, self.length)
+        self.assert_matches_1d(result, sma, self.length)
+
+    def test_batch_ema(self):
+        result = ema(self.source, self.length)
+        self.assert_matches_1d(result, ema, self.length)
+
+    def test_batch_rma(self):
+        result = rma(self.source, self.length)
+        self.assert_matches_1d(result, rma, self.length)
+
+    def test_batch_sema(self):
+        for smooth in [2, 3]:
+            result = sema(self.source, self.length, smooth)
+            self.assert_matches_1d(result, sema, self.length, smooth)
+
+    def test_batch_array(self):
+        values = self.source.to_numpy()
+
+        np.testing.assert_array_equal(
+            ema(values, self.length),
+            ema(self.source, self.length).to_numpy(),
+        )
+
+    def test_batch_rma_pandas_method(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            rma(self.source, self.length, method="pandas")
+        self.assertEqual(
+            str(context.exception),
+            "method must be 'numpy' for 2-D sources, got 'pandas'.",
+        )
+
+
+class TestMABank(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=42)
+        self.source = pd.Series(
+            rng.normal(100, 5, 200).cumsum(),
+            index=pd.date_range("2024-01-01", periods=200),
+        )
+        self.lengths = [2, 5, 14, 50]
+
+    def test_ma_bank_ema_and_rma(self):
+        for ma_method, function in [("ema", ema), ("rma", rma)]:
+            result = ma_bank(self.source, self.lengths, ma_method)
+
+            self.assertIsInstance(result, pd.DataFrame)
+            self.assertListEqual(list(result.columns), self.lengths)
+
+            for length in self.lengths:
+                expected = function(self.source, length)
+                np.testing.assert_array_equal(
+                    result[length].dropna().to_numpy(),
+                    expected.to_numpy(),
+                )
+
+    def test_ma_bank_sma(self):
+        result = ma_bank(self.source, self.lengths, "sma")
+
+        for length in self.lengths:
+            pd.testing.assert_series_equal(
+                result[length].dropna(),
+                sma(self.source, length),
+                check_names=False,
+                rtol=1e-12,
+            )
+
+    def test_ma_bank_array(self):
+        result = ma_bank(self.source.to_numpy(), self.lengths)
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, (200, 4))
+
+    def test_ma_bank_invalid_method(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            ma_bank(self.source, self.lengths, "wma")
+        self.assertEqual(
+            str(context.exception),
+            "ma_method must be 'sma', 'ema', or 'rma', got 'wma'.",
+        )
@@ -0,0 +1,173 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from src.tradingview_indicators.rolling import (
+    RollingMax,
+    RollingMin,
+    RollingStd,
+    rolling_extremes,
+    rolling_moments,
+)
+from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
+
+
+class TestRolling(unittest.TestCase):
+    def setUp(self):
+        self.source = pd.read_csv(
+            "example/BTCUSDT_1d_spot.csv", index_col=0
+        )["close"].iloc[:200]
+
+        self.edge_source = pd.Series(
+            [1.0, 1.0, 2.0, -0.0, 0.0, np.nan, 3.0, 3.0, 1.0, np.inf,
+             2.0, 2.0, 2.0, -np.inf, 0.0, -0.0, 5.0, 4.0, 3.0, 2.0]
+        )
+
+    def assert_matches_pandas(self, source, length):
+        highest = RollingMax(length)
+        lowest = RollingMin(length)
+
+        max_values = np.array([highest.update(value) for value in source])
+        min_values = np.array([lowest.update(value) for value in source])
+
+        ref_max = source.rolling(length).max().to_numpy()
+        ref_min = source.rolling(length).min().to_numpy()
+
+        np.testing.assert_array_equal(max_values, ref_max)
+        np.testing.assert_array_equal(min_values, ref_min)
+        np.testing.assert_array_equal(np.signbit(max_values), np.signbit(ref_max))
+        np.testing.assert_array_equal(np.signbit(min_values), np.signbit(ref_min))
+
+    def test_rolling_extremes(self):
+        for length in [1, 2, 14, 52]:
+            self.assert_matches_pandas(self.source, length)
+
+    def test_rolling_extremes_edge_values(self):
+        for length in [1, 2, 3, 5]:
+            self.assert_matches_pandas(self.edge_source, length)
+
+    def test_rolling_extremes_attributes(self):
+        highest = RollingMax(3)
+        for value in [1.0, 3.0, 2.0, 1.0]:
+            highest.update(value)
+
+        self.assertEqual(highest.value, 3.0)
+        self.assertEqual(highest.count, 4)
+
+    def test_rolling_extremes(self):
+        high = self.source + 100
+        low = self.source.copy()
+        low.iloc[30] = np.nan
+
+        highest, lowest = rolling_extremes(high, low, [9, 26, 52, 9])
+
+        self.assertListEqual(list(highest.columns), [9, 26, 52])
+        self.assertListEqual(list(lowest.columns), [9, 26, 52])
+
+        for length in [9, 26, 52]:
+            pd.testing.assert_series_equal(
+                highest[length],
+                high.rolling(length).max().rename(length),
+            )
+            pd.testing.assert_series_equal(
+                lowest[length],
+                low.rolling(length).min().rename(length),
+            )
+
+    def test_rolling_extremes_invalid_lengths(self):
+        for lengths in [[], [9, 0]]:
+            with self.assertRaises(InvalidArgumentError) as context:
+                rolling_extremes(self.source, self.source, lengths)
+            self.assertEqual(
+                str(context.exception),
+                f"lengths must be greater than 0, got '{lengths}'.",
+            )
+
+    def test_rolling_moments(self):
+        source = self.source.copy()
+        source.iloc[30] = np.nan
+
+        means, deviations = rolling_moments(source, [20, 50, 20])
+
+        self.assertListEqual(list(means.columns), [20, 50])
+        self.assertListEqual(list(deviations.columns), [20, 50])
+
+        for length in [20, 50]:
+            pd.testing.assert_series_equal(
+                means[length],
+                source.rolling(length).mean().rename(length),
+            )
+            pd.testing.assert_series_equal(
+                deviations[length],
+                source.rolling(length).std().rename(length),
+            )
+
+    def test_rolling_moments_ddof(self):
+        _, deviations = rolling_moments(self.source, [14], ddof=0)
+
+        pd.testing.assert_series_equal(
+            deviations[14],
+            self.source.rolling(14).std(ddof=0).rename(14),
+        )
+
+    def test_rolling_moments_invalid_lengths(self):
+        for lengths in [[], [20, 0]]:
+            with self.assertRaises(InvalidArgumentError) as context:
+                rolling_moments(self.source, lengths)
+            self.assertEqual(
+                str(context.exception),
+                f"lengths must be greater than 0, got '{lengths}'.",
+            )
+
+    def assert_std_matches_pandas(self, source, length, ddof=1):
+        state = RollingStd(length, ddof)
+        values = np.array([state.update(value) for value in source])
+
+        np.testing.assert_array_equal(
+            values, source.rolling(length).std(ddof=ddof).to_numpy()
+        )
+
+    def test_rolling_std(self):
+        for length in [1, 2, 14, 52]:
+            self.assert_std_matches_pandas(self.source, length)
+            self.assert_std_matches_pandas(self.source, length, ddof=0)
+
+    def test_rolling_std_edge_values(self):
+        for length in [1, 2, 3, 5]:
+            self.assert_std_matches_pandas(self.edge_source, length)
+
+    def test_rolling_std_recompute(self):
+        rng = np.random.default_rng(seed=42)
+        source = pd.Series(np.concatenate([
+            rng.normal(1e8, 1, 100),
+            rng.normal(0, 1e-3, 100),
+            np.full(30, 7.0),
+            rng.normal(0, 1, 100),
+        ]))
+
+        for length in [3, 20]:
+            self.assert_std_matches_pandas(source, length)
+
+    def test_rolling_std_attributes(self):
+        state = RollingStd(3)
+        for value in [1.0, 3.0, 2.0, 4.0]:
+            state.update(value)
+
+        self.assertEqual(state.value, 1.0)
+        self.assertEqual(state.mean, 3.0)
+        self.assertEqual(state.count, 4)
+
+        state.update(np.nan)
+        self.assertTrue(np.isnan(state.mean))
+
+    def test_invalid_length(self):
+        for state in [RollingMax, RollingMin, RollingStd]:
+            with self.assertRaises(InvalidArgumentError) as context:
+                state(0)
+            self.assertEqual(
+                str(context.exception), "length must be greater than 0, got '0'."
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
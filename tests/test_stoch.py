@@ -1,7 +1,7 @@
 import unittest
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators.stoch import stoch
+from src.tradingview_indicators.stoch import stoch, StochState
 
 
 class TestStoch(unittest.TestCase):
@@ -58,3 +58,55 @@ class TestStoch(unittest.TestCase):
         ).dropna()
 
         pd.testing.assert_series_equal(test_stoch, ref_values)
+
+
+class TestStochState(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source.iloc[:300]
+
+    def assert_matches_stoch(self, close, high, low, length):
+        state = StochState(length)
+        values = np.array([
+            state.update(*bar) for bar in zip(close, high, low)
+        ])
+
+        np.testing.assert_array_equal(
+            values, stoch(close, high, low, length).to_numpy()
+        )
+
+    def test_stoch_state(self):
+        for length in [1, 5, 14]:
+            self.assert_matches_stoch(
+                self.source["close"],
+                self.source["high"],
+                self.source["low"],
+                length,
+            )
+
+    def test_stoch_state_flat_window(self):
+        close = pd.Series([2.0, 2.0, 2.0, 3.0, 2.0, 1.0, 2.0, np.nan, 2.0])
+        high = pd.Series([2.0, 2.0, 2.0, 2.0, 3.0, 2.0, 2.0, 2.0, 2.0])
+        low = pd.Series([2.0, 2.0, 2.0, 2.0, 1.0, 2.0, 2.0, 2.0, 2.0])
+
+        self.assert_matches_stoch(close, high, low, 3)
+
+        state = StochState(3)
+        for bar in zip(close, high, low):
+            state.update(*bar)
+
+        self.assertTrue(np.isnan(state.value))
+        self.assertEqual(state.count, 9)
+        self.assertEqual(
+            stoch(close, high, low, 3).iloc[3], np.inf
+        )
+
+    def test_stoch_state_missing_values(self):
+        close = self.source["close"].copy()
+        high = self.source["high"].copy()
+        low = self.source["low"].copy()
+        high.iloc[[20, 21, 100]] = np.nan
+        low.iloc[[50, 150]] = np.nan
+        close.iloc[200] = np.nan
+
+        self.assert_matches_stoch(close, high, low, 14)
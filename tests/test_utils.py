@@ -254,6 +254,95 @@ class TestDynamicTimeWarping(unittest.TestCase):
         )
         pd.testing.assert_series_equal(result, ref_values)
 
+    def test_dtw_engines(self):
+        fastdtw_engine = DynamicTimeWarping(
+            self.input_x, self.input_y, "fastdtw"
+        )
+        pd.testing.assert_frame_equal(fastdtw_engine.dtw_df, self.dtw.dtw_df)
+        self.assertEqual(fastdtw_engine.distance, self.dtw.distance)
+
+        banded = DynamicTimeWarping(self.input_x, self.input_y, "sakoe_chiba")
+        exact = DynamicTimeWarping(
+            self.input_x, self.input_y, "sakoe_chiba", radius=20
+        )
+        self.assertEqual(banded.distance, exact.distance)
+        self.assertLessEqual(banded.distance, self.dtw.distance)
+        self.assertEqual(banded.radius, None)
+        self.assertEqual(exact.radius, 20)
+
+    def test_dtw_engine_aligned(self):
+        dtw = DynamicTimeWarping(
+            self.input_x, self.input_y.iloc[:15], "sakoe_chiba", 2
+        )
+        result = dtw.calculate_dtw_distance("ratio", True)
+
+        self.assertEqual(len(result), 15)
+
+    def test_dtw_path(self):
+        self.assertEqual(self.dtw.engine, "compiled")
+        self.assertEqual(self.dtw.path.dtype, np.int64)
+        np.testing.assert_array_equal(
+            self.dtw.path, self.dtw.dtw_df.iloc[:, :2].to_numpy()
+        )
+        self.assertAlmostEqual(
+            self.dtw.distance,
+            np.abs(
+                self.input_x.to_numpy()[self.dtw.path[:, 0]]
+                - self.input_y.to_numpy()[self.dtw.path[:, 1]]
+            ).sum(),
+        )
+
+    def test_dtw_df_cached(self):
+        self.assertIs(self.dtw.dtw_df, self.dtw.dtw_df)
+
+    def test_dtw_path_frame_lazy(self):
+        self.assertNotIn("dtw", vars(self.dtw))
+
+        pd.testing.assert_frame_equal(
+            self.dtw.dtw, pd.DataFrame(self.dtw.path.tolist())
+        )
+        self.assertIs(self.dtw.dtw, self.dtw.dtw)
+
+    def test_dtw_path_arrays(self):
+        np.testing.assert_array_equal(self.dtw.path_x, self.dtw.path[:, 0])
+        np.testing.assert_array_equal(self.dtw.path_y, self.dtw.path[:, 1])
+
+        result = self.dtw.calculate_dtw_distance("absolute")
+        expected = (
+            self.dtw.dtw_df["signal_x"] - self.dtw.dtw_df["signal_y"]
+        )
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_align_dtw_distance_cached(self):
+        x_aligned, y_aligned = self.dtw.align_dtw_distance()
+        x_aligned.iloc[0] = np.nan
+
+        x_again, y_again = self.dtw.align_dtw_distance()
+        self.assertFalse(np.isnan(x_again.iloc[0]))
+        pd.testing.assert_series_equal(y_again, y_aligned)
+
+    def test_dtw_invalid_values(self):
+        input_y = self.input_y.copy()
+        input_y.iloc[3] = np.nan
+
+        for engine in ["compiled", "sakoe_chiba", "fastdtw"]:
+            with self.assertRaises(InvalidArgumentError) as context:
+                DynamicTimeWarping(self.input_x, input_y, engine)
+
+            self.assertEqual(
+                str(context.exception),
+                "input_x and input_y must not contain NaN or infinite values.",
+            )
+
+    def test_dtw_invalid_engine(self):
+        with self.assertRaises(InvalidArgumentError) as context:
+            DynamicTimeWarping(self.input_x, self.input_y, "invalid_engine")
+
+        self.assertIn(
+            "engine must be 'compiled', 'sakoe_chiba', or 'fastdtw'",
+            str(context.exception),
+        )
+
     def test_calculate_dtw_distance_invalid_method(self):
         with self.assertRaises(InvalidArgumentError) as context:
             self.dtw.calculate_dtw_distance(method="invalid_method")